@@ -1,9 +1,27 @@
 """Make security admin subclasses available from package root."""
 from .access.access_admin import AccessAdmin
+from .access.async_access_admin import AsyncAccessAdmin
+from .common.julian_date_decoder import JulianDateDecoder
+from .common.profile_cache import ProfileCache
+from .common.recording_transport import RecordingTransport
+from .common.replay_transport import ReplayTransport
+from .common.request_governor import RequestGovernor
+from .common.security_batch import SecurityBatch
 from .common.security_request_error import SecurityRequestError
+from .common.security_result_stream import SecurityResultStream
+from .common.sqlite_profile_cache import SQLiteProfileCache
+from .common.transport import Transport
+from .connection.async_connection_admin import AsyncConnectionAdmin
 from .connection.connection_admin import ConnectionAdmin
+from .data_set.async_data_set_admin import AsyncDataSetAdmin
 from .data_set.data_set_admin import DataSetAdmin
+from .group.async_group_admin import AsyncGroupAdmin
 from .group.group_admin import GroupAdmin
+from .resource.async_resource_admin import AsyncResourceAdmin
 from .resource.resource_admin import ResourceAdmin
+from .setropts.async_setropts_admin import AsyncSetroptsAdmin
 from .setropts.setropts_admin import SetroptsAdmin
+from .setropts.setropts_snapshot import SetroptsSnapshot
+from .simulator.racf_simulator import RACFSimulator
+from .user.async_user_admin import AsyncUserAdmin
 from .user.user_admin import UserAdmin
@@ -3,7 +3,9 @@
 from typing import List, Union
 
 from pyracf.access.access_request import AccessRequest
+from pyracf.common.profile_cache import ProfileCache
 from pyracf.common.security_admin import SecurityAdmin
+from pyracf.common.transport import Transport
 
 
 class AccessAdmin(SecurityAdmin):
@@ -16,6 +18,8 @@ class AccessAdmin(SecurityAdmin):
         update_existing_segment_traits: Union[dict, None] = None,
         replace_existing_segment_traits: Union[dict, None] = None,
         additional_secret_traits: Union[List[str], None] = None,
+        transport: Union[Transport, None] = None,
+        profile_cache: Union[ProfileCache, None] = None,
     ) -> None:
         self._valid_segment_traits = {
             "base": {
@@ -48,6 +52,8 @@ class AccessAdmin(SecurityAdmin):
             update_existing_segment_traits=update_existing_segment_traits,
             replace_existing_segment_traits=replace_existing_segment_traits,
             additional_secret_traits=additional_secret_traits,
+            transport=transport,
+            profile_cache=profile_cache,
         )
 
     # ============================================================================
@@ -64,8 +70,8 @@ class AccessAdmin(SecurityAdmin):
     ) -> Union[dict, bytes]:
         """Create a new permission."""
         traits["base:id"] = auth_id
-        self._build_segment_dictionaries(traits)
         access_request = AccessRequest(resource, class_name, "set", volume, generic)
+        self._build_segment_dictionaries(access_request, traits)
         self._add_traits_directly_to_request_xml_with_no_segments(access_request)
         return self._make_request(access_request)
 
@@ -80,8 +86,8 @@ class AccessAdmin(SecurityAdmin):
     ) -> Union[dict, bytes]:
         """Alter an existing permission."""
         traits["base:id"] = auth_id
-        self._build_segment_dictionaries(traits)
         access_request = AccessRequest(resource, class_name, "set", volume, generic)
+        self._build_segment_dictionaries(access_request, traits)
         self._add_traits_directly_to_request_xml_with_no_segments(
             access_request, alter=True
         )
@@ -97,7 +103,7 @@ class AccessAdmin(SecurityAdmin):
     ) -> Union[dict, bytes]:
         """Delete a permission."""
         traits = {"base:id": auth_id}
-        self._build_segment_dictionaries(traits)
         access_request = AccessRequest(resource, class_name, "del", volume, generic)
+        self._build_segment_dictionaries(access_request, traits)
         self._add_traits_directly_to_request_xml_with_no_segments(access_request)
         return self._make_request(access_request)
@@ -1,6 +1,6 @@
 """Access Request Builder."""
 
-from typing import Union
+from typing import List, Union
 
 from pyracf.common.security_request import SecurityRequest
 
@@ -35,3 +35,11 @@ class AccessRequest(SecurityRequest):
             del self._security_definition.attrib["volume"]
         if generic == "no":
             del self._security_definition.attrib["generic"]
+
+    def _get_affected_profile_keys(self) -> List[tuple]:
+        """Permissions are listed in the data set or resource profile they cover."""
+        attributes = self._security_definition.attrib
+        class_name = attributes["class"].upper()
+        if class_name == "DATASET":
+            return [("dataset", attributes["name"].upper())]
+        return [("resource", attributes["name"].upper(), class_name)]
@@ -0,0 +1,11 @@
+"""Asynchronous RACF Access Administration."""
+
+from pyracf.common.async_security_admin import AsyncSecurityAdmin
+
+from .access_admin import AccessAdmin
+
+
+class AsyncAccessAdmin(AsyncSecurityAdmin):
+    """Asynchronous RACF Access Administration."""
+
+    _security_admin_class = AccessAdmin
@@ -0,0 +1,162 @@
+"""Base Class for asyncio RACF Administration Interface."""
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, Callable, Iterable, List, Tuple, Union
+
+from .profile_cache import ProfileCache
+from .security_admin import SecurityAdmin
+from .security_request_error import SecurityRequestError
+from .transport import Transport
+
+
+class AsyncSecurityAdmin:
+    """
+    Base Class for asyncio RACF Administration Interface.
+    Every public method of the wrapped security admin is available as a coroutine.
+    Building the request, calling IRRSMO00, parsing the result XML and formatting
+    profiles all happen on a worker thread, so the event loop is never blocked.
+    """
+
+    _security_admin_class = SecurityAdmin
+
+    def __init__(
+        self,
+        debug: bool = False,
+        generate_requests_only: bool = False,
+        update_existing_segment_traits: Union[dict, None] = None,
+        replace_existing_segment_traits: Union[dict, None] = None,
+        additional_secret_traits: Union[List[str], None] = None,
+        transport: Union[Transport, None] = None,
+        profile_cache: Union[ProfileCache, None] = None,
+        executor: Union[Executor, None] = None,
+        **kwargs,
+    ) -> None:
+        # Any other keyword arguments (i.e., 'snapshot_ttl') are specific to the
+        # wrapped security admin and are passed along to it.
+        self._security_admin = self._security_admin_class(
+            debug=debug,
+            generate_requests_only=generate_requests_only,
+            update_existing_segment_traits=update_existing_segment_traits,
+            replace_existing_segment_traits=replace_existing_segment_traits,
+            additional_secret_traits=additional_secret_traits,
+            transport=transport,
+            profile_cache=profile_cache,
+            **kwargs,
+        )
+        # 'None' uses the event loop's default executor.
+        self.__executor = executor
+
+    def __getattr__(self, name: str) -> Any:
+        """Make the public methods of the wrapped security admin awaitable."""
+        if name.startswith("_"):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        method = getattr(self._security_admin, name)
+        if not callable(method):
+            return method
+
+        @functools.wraps(method)
+        async def async_method(*args, **kwargs) -> Any:
+            return await self._run_in_executor(name, *args, **kwargs)
+
+        return async_method
+
+    # ============================================================================
+    # Request Execution
+    # ============================================================================
+    async def _run_in_executor(self, method_name: str, *args, **kwargs) -> Any:
+        """
+        Call a method of the wrapped security admin on a worker thread.
+        The caller's context (i.e., an active batch) is carried over to the worker thread.
+        """
+        method = getattr(self._security_admin, method_name)
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            self.__executor, functools.partial(context.run, method, *args, **kwargs)
+        )
+
+    async def __iterate_in_executor(self, iterable: Iterable) -> AsyncIterator[Any]:
+        """
+        Get each item of an iterable on a worker thread, so that any requests made and
+        results parsed while iterating don't block the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        iterator = await loop.run_in_executor(self.__executor, iter, iterable)
+        end = object()
+        try:
+            while True:
+                item = await loop.run_in_executor(self.__executor, next, iterator, end)
+                if item is end:
+                    return
+                yield item
+        finally:
+            # Finish the request if the caller stops iterating early.
+            if hasattr(iterator, "close"):
+                await loop.run_in_executor(self.__executor, iterator.close)
+
+    # ============================================================================
+    # Streamed Profile Extract
+    # ============================================================================
+    async def extract_stream(
+        self, *args, **kwargs
+    ) -> Union[AsyncIterator[Tuple[str, object]], bytes]:
+        """
+        Extract a profile as an asynchronous stream of result events.
+        Each IRRSMO00 response chunk is requested and parsed on a worker thread as the
+        stream is iterated. Any arguments are passed along to 'extract_stream()'.
+        """
+        if not hasattr(self._security_admin, "extract_stream"):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute 'extract_stream'"
+            )
+        security_result_stream = await self._run_in_executor(
+            "extract_stream", *args, **kwargs
+        )
+        if isinstance(security_result_stream, bytes):
+            return security_result_stream
+        return self.__iterate_in_executor(security_result_stream)
+
+    # ============================================================================
+    # Concurrent Profile Extract
+    # ============================================================================
+    async def extract_many(
+        self, profile_names: List[str], *args, **kwargs
+    ) -> AsyncIterator[Tuple[str, Union[dict, bytes, SecurityRequestError]]]:
+        """
+        Extract many profiles concurrently.
+        Yields a '(profile name, profile or error)' tuple for each profile as each
+        extract completes. A 'SecurityRequestError' raised by an individual extract
+        is yielded in place of the result so that one failure does not stop the rest.
+        Any other arguments are passed along to 'extract()'.
+        """
+        if not hasattr(self._security_admin, "extract_many"):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute 'extract_many'"
+            )
+        extract = getattr(self, "extract")
+        tasks = [
+            asyncio.ensure_future(
+                self.__extract_one(extract, profile_name, *args, **kwargs)
+            )
+            for profile_name in profile_names
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            # Don't make any more requests if the caller stops iterating early.
+            for task in tasks:
+                task.cancel()
+
+    async def __extract_one(
+        self, extract: Callable, profile_name: str, *args, **kwargs
+    ) -> Tuple[str, Union[dict, bytes, SecurityRequestError]]:
+        """Extract a single profile, returning any 'SecurityRequestError' raised."""
+        try:
+            return (profile_name, await extract(profile_name, *args, **kwargs))
+        except SecurityRequestError as security_request_error:
+            return (profile_name, security_request_error)
@@ -1,10 +1,11 @@
+#define PY_SSIZE_T_CLEAN
 #include <Python.h>
 
 #include <unistd.h>
 #include <signal.h>
 #include <stdio.h>
 
-#define BUFFER_SIZE (100000)
+#define REQ_HANDLE_SIZE (64)
 
 #pragma linkage(IRRSMO64, OS)
 
@@ -17,24 +18,42 @@ static PyObject* call_irrsmo00(PyObject* self, PyObject* args, PyObject *kwargs)
    const unsigned int xml_len;
    const unsigned int input_opts;
    const char *input_xml;
+   const char *input_req_handle = NULL;
+   Py_ssize_t input_req_handle_len = 0;
+   Py_buffer rsp_buffer;
 
-   static char *kwlist[] = {"xml_str", "xml_len", "opts", NULL};
+   static char *kwlist[] = {"xml_str", "xml_len", "opts", "req_handle", "rsp_buffer", NULL};
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y|II", kwlist, &input_xml, &xml_len, &input_opts)) {
+    if (!PyArg_ParseTupleAndKeywords(
+            args, kwargs, "yIIy#w*", kwlist,
+            &input_xml, &xml_len, &input_opts, &input_req_handle, &input_req_handle_len,
+            &rsp_buffer)) {
         return NULL;
     }
 
 
     char work_area[1024];
-    char req_handle[64] = { 0 };
+    char req_handle[REQ_HANDLE_SIZE] = { 0 };
     VarStr_T userid = { 0, {0}};
     unsigned int alet = 0;
     unsigned int acee = 0;
-    char rsp[BUFFER_SIZE+1];
-    memset(rsp, 0, BUFFER_SIZE);
+    // The response buffer is allocated once by the caller and reused across calls.
+    // It does not need to be cleared since only the returned length is read back.
+    char *rsp = (char *) rsp_buffer.buf;
     unsigned int saf_rc=0, racf_rc=0, racf_rsn=0;
-    unsigned int num_parms=17, fn=1, opts = input_opts, rsp_len = sizeof(rsp)-1;
+    unsigned int num_parms=17, fn=1, opts = input_opts, rsp_len = (unsigned int) rsp_buffer.len;
 
+    // A request handle returned by a previous call is passed back to
+    // IRRSMO00 to retrieve the next part of a response that did not fit.
+    if (input_req_handle_len > REQ_HANDLE_SIZE) {
+        input_req_handle_len = REQ_HANDLE_SIZE;
+    }
+    memcpy(req_handle, input_req_handle, input_req_handle_len);
+
+    // Release the GIL while waiting on RACF so that other Python threads
+    // can run. Only C locals, the immutable request bytes and the exported
+    // response buffer (which cannot be resized while exported) are referenced.
+    Py_BEGIN_ALLOW_THREADS
     IRRSMO64(
         work_area, 
         alet, 
@@ -54,12 +73,33 @@ static PyObject* call_irrsmo00(PyObject* self, PyObject* args, PyObject *kwargs)
         rsp_len, 
         rsp
     );
+    Py_END_ALLOW_THREADS
+
+   // On return, 'rsp_len' contains the length of the response.
+   if ((Py_ssize_t) rsp_len > rsp_buffer.len) {
+      rsp_len = (unsigned int) rsp_buffer.len;
+   }
 
-   return Py_BuildValue("y", rsp);
+   // IRRSMO00 leaves a non-zero request handle when part of the
+   // response is still pending, so it is returned to the caller
+   // along with the return codes to allow for continuation.
+   // The response itself is left in the caller's buffer and is not copied here.
+   PyObject *result = Py_BuildValue(
+      "{s:I,s:y#,s:[I,I,I]}",
+      "responseLength", rsp_len,
+      "requestHandle", req_handle, (Py_ssize_t) REQ_HANDLE_SIZE,
+      "returnCodes", saf_rc, racf_rc, racf_rsn
+   );
+   PyBuffer_Release(&rsp_buffer);
+   return result;
 }
 
 static char call_irrsmo00_docs[] =
-   "call_irrsmo00(input_xml: bytes, xml_len: uint, opts: uint): Returns an XML response from the IRRSMO00 RACF Callable Service.\n";
+   "call_irrsmo00(xml_str: bytes, xml_len: uint, opts: uint, req_handle: bytes, rsp_buffer: bytearray): "
+   "Writes an XML response from the IRRSMO00 RACF Callable Service to 'rsp_buffer' "
+   "and returns a dictionary containing the length of the response, "
+   "the request handle to use to retrieve the rest of a partial response, "
+   "and the SAF return code, RACF return code and RACF reason code.\n";
 
 static PyMethodDef cpyracf_methods[] = {
    {"call_irrsmo00", (PyCFunction)call_irrsmo00,
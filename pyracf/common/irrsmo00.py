@@ -1,5 +1,9 @@
 """Interface to irrsmo00.dll."""
 import platform
+import threading
+from typing import Iterator, Tuple, Union
+
+from .transport import Transport
 
 try:
     from cpyracf import call_irrsmo00
@@ -8,20 +12,121 @@ except ImportError as import_error:
         raise import_error
 
     # Ignore import of extension on non-z/OS platforms to allow for unit testing off platform.
-    def call_irrsmo00() -> None:
+    def call_irrsmo00(**_) -> None:
         return None
 
 
-class IRRSMO00:
-    """Interface to irrsmo00 callable service through cpyracf Python extension."""
+class IRRSMO00(Transport):
+    """
+    Interface to irrsmo00 callable service through cpyracf Python extension.
+
+    Thread Safety:
+    The cpyracf extension releases the GIL while IRRSMO00 is running and keeps all
+    per-call state local to each call. Response buffers are allocated once per
+    thread and reused for every call made from that thread, so 'call_racf()' and
+    'call_racf_chunks()' may be called concurrently from multiple threads using
+    the same IRRSMO00 object.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, buffer_size: int = 100000) -> None:
         # Initialize size of output buffer
-        self.buffer_size = 100000
+        self.buffer_size = buffer_size
+        self.__response_buffers = threading.local()
+        # Upper bound on continuation calls made for a single request.
+        self.max_continuations = 10000
+
+    def call_racf(
+        self, request_xml: bytes, precheck: bool = False, zero_copy: bool = False
+    ) -> Union[str, bytes, memoryview]:
+        """
+        Make request to call_irrsmo00 in the cpyracf Python extension.
+        When 'zero_copy' is True, the result XML is returned undecoded as a memoryview
+        over this thread's response buffer instead of as a str. The memoryview is only
+        valid until the next request made from the same thread, so it should be parsed
+        right away (i.e., by SecurityResult). Results that needed continuation calls
+        are returned as undecoded bytes.
+        """
+        if not zero_copy:
+            return "".join(self.call_racf_chunks(request_xml, precheck=precheck))
+        response_buffer = self.__get_response_buffer()
+        chunks = []
+        for response_length, partial in self.__call_irrsmo00(
+            request_xml, precheck, response_buffer
+        ):
+            if not partial and not chunks:
+                return memoryview(response_buffer)[:response_length]
+            chunks.append(response_buffer[:response_length])
+        return b"".join(chunks)
 
-    def call_racf(self, request_xml: bytes, precheck: bool = False) -> str:
-        """Make request to call_irrsmo00 in the cpyracf Python extension."""
+    def call_racf_chunks(
+        self, request_xml: bytes, precheck: bool = False, zero_copy: bool = False
+    ) -> Iterator[Union[str, memoryview]]:
+        """
+        Make request to call_irrsmo00 in the cpyracf Python extension
+        and yield the response one chunk at a time.
+        When a response does not fit in the response buffer, IRRSMO00 returns
+        a non-zero request handle that is passed back on the next call to
+        retrieve the rest of the response. Concatenating the chunks in the
+        order they are yielded produces the complete result XML.
+        When 'zero_copy' is True, undecoded chunks are yielded as memoryviews over
+        this thread's response buffer, which are only valid until the next chunk.
+        """
+        encoding = "cp1047"
+        if platform.system() != "OS/390":
+            # If not running on z/OS, EBCDIC is most likely not supported.
+            encoding = "utf-8"
+        response_buffer = self.__get_response_buffer()
+        for response_length, _ in self.__call_irrsmo00(
+            request_xml, precheck, response_buffer
+        ):
+            chunk = memoryview(response_buffer)[:response_length]
+            if zero_copy:
+                yield chunk
+            else:
+                yield str(chunk, encoding)
+
+    def __call_irrsmo00(
+        self, request_xml: bytes, precheck: bool, response_buffer: bytearray
+    ) -> Iterator[Tuple[int, bool]]:
+        """
+        Call IRRSMO00 until the complete response has been returned.
+        Yields the length of each part of the response that was written to the
+        response buffer and whether or not more of the response is pending.
+        A continuation call that does not return zero return codes means that the
+        rest of the response could not be retrieved, so a RuntimeError is raised
+        instead of yielding what is left in the response buffer.
+        """
         options = 11 if precheck else 9
-        return call_irrsmo00(
-            xml_str=request_xml, xml_len=len(request_xml), opts=options
-        ).decode("cp1047")
+        request_handle = bytes(64)
+        for continuation in range(self.max_continuations + 1):
+            response = call_irrsmo00(
+                xml_str=request_xml,
+                xml_len=len(request_xml),
+                opts=options,
+                req_handle=request_handle,
+                rsp_buffer=response_buffer,
+            )
+            if continuation and any(response["returnCodes"]):
+                (saf_rc, racf_rc, racf_rsn) = response["returnCodes"]
+                raise RuntimeError(
+                    f"IRRSMO00 continuation call {continuation} failed with "
+                    + f"SAF return code {saf_rc}, RACF return code {racf_rc}, "
+                    + f"and RACF reason code {racf_rsn}."
+                )
+            request_handle = response["requestHandle"]
+            partial = any(request_handle)
+            yield (response["responseLength"], partial)
+            if not partial:
+                return
+        raise RuntimeError(
+            "IRRSMO00 response was not complete after "
+            + f"{self.max_continuations} continuation calls."
+        )
+
+    def __get_response_buffer(self) -> bytearray:
+        """Get the response buffer for the current thread, allocating it if needed."""
+        response_buffer = getattr(self.__response_buffers, "response_buffer", None)
+        if response_buffer is None or len(response_buffer) != self.buffer_size:
+            response_buffer = bytearray(self.buffer_size)
+            self.__response_buffers.response_buffer = response_buffer
+        return response_buffer
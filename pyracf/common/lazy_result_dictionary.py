@@ -0,0 +1,190 @@
+"""Lazily Parsed Security Result Dictionary."""
+
+import codecs
+import copy
+import re
+from typing import Tuple, Union
+
+from .security_result import SecurityResult
+
+
+class LazyResultDictionary(dict):
+    """
+    Lazily Parsed Security Result Dictionary.
+    Stands in for the 'securityResult' dictionary that 'SecurityResult' builds. The
+    return code and reason code are decoded from the end of the result XML right
+    away, and the security definitions (i.e., commands, messages and errors) are
+    only parsed the first time anything else is accessed, so requests whose results
+    are only checked for their return code never pay for parsing the rest.
+    Since it is a 'dict', it can be used anywhere the eagerly built dictionary is.
+    Note: Result XML in a memoryview is copied, so results that will be accessed
+    right away (i.e., profile extracts) should be parsed with 'SecurityResult'.
+    """
+
+    # Only the end of the result XML is searched for the return codes.
+    __tail_size = 256
+    __return_codes_pattern = re.compile(
+        r"<returncode>\s*(-?\d+)\s*</returncode>\s*"
+        + r"<reasoncode>\s*(-?\d+)\s*</reasoncode>\s*</securityresult>\s*$"
+    )
+    __return_code_keys = ("returnCode", "reasonCode")
+
+    def __init__(
+        self, result_xml: Union[str, bytes, memoryview], encoding: str = "cp1047"
+    ) -> None:
+        super().__init__()
+        self.__result_xml = result_xml
+        self.__encoding = encoding
+        return_codes = self.__decode_return_codes()
+        if return_codes is None:
+            self._materialize()
+            return
+        if isinstance(result_xml, memoryview):
+            # The memoryview is only valid until the next request,
+            # so a copy is kept in case the definitions are accessed later.
+            self.__result_xml = result_xml.tobytes()
+        (return_code, reason_code) = return_codes
+        dict.__setitem__(self, "returnCode", return_code)
+        dict.__setitem__(self, "reasonCode", reason_code)
+
+    def __decode_return_codes(self) -> Union[Tuple[int, int], None]:
+        """Decode the return code and reason code without parsing the result XML."""
+        result_xml = self.__result_xml
+        if not isinstance(result_xml, str):
+            encoding = self.__encoding
+            try:
+                codecs.lookup(encoding)
+            except LookupError:
+                # If not running on z/OS, EBCDIC is most likely not supported.
+                encoding = "utf-8"
+            result_xml = str(result_xml[-self.__tail_size :], encoding, errors="ignore")
+        match = self.__return_codes_pattern.search(result_xml[-self.__tail_size :])
+        if match is None:
+            return None
+        return (int(match.group(1)), int(match.group(2)))
+
+    def _materialize(self) -> None:
+        """Parse the security definitions of the result XML, if not done already."""
+        if self.__result_xml is None:
+            return
+        security_result = SecurityResult(
+            self.__result_xml, self.__encoding
+        ).get_result_dictionary()["securityResult"]
+        self.__result_xml = None
+        dict.clear(self)
+        dict.update(self, security_result)
+
+    # ============================================================================
+    # Return Codes Without Parsing
+    # ============================================================================
+    def __getitem__(self, key):
+        if key not in self.__return_code_keys:
+            self._materialize()
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        if key not in self.__return_code_keys:
+            self._materialize()
+        return dict.get(self, key, default)
+
+    def __contains__(self, key) -> bool:
+        if key not in self.__return_code_keys:
+            self._materialize()
+        return dict.__contains__(self, key)
+
+    # ============================================================================
+    # Everything Else Parses First
+    # ============================================================================
+    def __iter__(self):
+        self._materialize()
+        return dict.__iter__(self)
+
+    def __reversed__(self):
+        self._materialize()
+        return dict.__reversed__(self)
+
+    def __len__(self) -> int:
+        self._materialize()
+        return dict.__len__(self)
+
+    def __eq__(self, other) -> bool:
+        self._materialize()
+        if isinstance(other, LazyResultDictionary):
+            other._materialize()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other) -> bool:
+        self._materialize()
+        if isinstance(other, LazyResultDictionary):
+            other._materialize()
+        return dict.__ne__(self, other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        self._materialize()
+        return dict.__repr__(self)
+
+    def __or__(self, other):
+        self._materialize()
+        return dict.__or__(self, other)
+
+    def __ror__(self, other):
+        self._materialize()
+        return dict.__ror__(self, other)
+
+    def __ior__(self, other):
+        self._materialize()
+        return dict.__ior__(self, other)
+
+    def __setitem__(self, key, value) -> None:
+        self._materialize()
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key) -> None:
+        self._materialize()
+        dict.__delitem__(self, key)
+
+    def keys(self):
+        self._materialize()
+        return dict.keys(self)
+
+    def values(self):
+        self._materialize()
+        return dict.values(self)
+
+    def items(self):
+        self._materialize()
+        return dict.items(self)
+
+    def copy(self) -> dict:
+        self._materialize()
+        return dict(dict.items(self))
+
+    def pop(self, *args):
+        self._materialize()
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self._materialize()
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        self._materialize()
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwargs) -> None:
+        self._materialize()
+        dict.update(self, *args, **kwargs)
+
+    def clear(self) -> None:
+        self._materialize()
+        dict.clear(self)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        self._materialize()
+        return copy.deepcopy(dict(dict.items(self)), memo)
+
+    def __reduce__(self):
+        self._materialize()
+        return (dict, (dict(dict.items(self)),))
@@ -1,5 +1,6 @@
 """Logging for pyRACF."""
 
+import codecs
 import inspect
 import json
 import os
@@ -79,7 +80,8 @@ class Logger:
         admin_class_calls = [
             (os.path.basename(stack[i].filename), stack[i].function)
             for i in range(len(stack) - 1)
-            if os.path.basename(stack[i + 1].filename).split("_")[-1] == "admin.py"
+            if os.path.basename(stack[i + 1].filename).split("_")[-1]
+            in ["admin.py", "batch.py"]
         ][1:]
         user_call = admin_class_calls[0]
         class_tokens = [
@@ -142,33 +144,69 @@ class Logger:
             is_bytes = True
             xml_string = xml_string.decode("utf-8")
         for xml_key in secret_traits.values():
-            match = re.search(rf"\<{xml_key}+[^>]*\>", xml_string)
-            if not match:
-                continue
-            xml_string = self.__redact_string(xml_string, match.end(), f"</{xml_key}")
+            secret_pattern = re.compile(rf"\<{xml_key}+[^>]*\>")
+            match = secret_pattern.search(xml_string)
+            # Batched requests may contain the same secret trait more than once.
+            while match:
+                xml_string = self.__redact_string(
+                    xml_string, match.end(), f"</{xml_key}"
+                )
+                match = secret_pattern.search(xml_string, match.end())
         if is_bytes:
             xml_string = xml_string.encode("utf-8")
         return xml_string
 
     def redact_result_xml(
         self,
-        xml_string: str,
+        xml_string: Union[str, bytes, memoryview],
         secret_traits: dict,
-    ) -> str:
+        encoding: str = "cp1047",
+    ) -> Union[str, bytes, memoryview]:
         """
         Redacts a list of specific secret traits in a result xml string.
         Based on the following RACF command pattern:
             'TRAIT (value)'
         This function also accounts for varied amounts of whitespace in the pattern.
+        Undecoded result xml is only decoded if there is something to redact,
+        otherwise it is returned as is.
         """
+        if not isinstance(xml_string, str):
+            if not self.__contains_secret_traits(xml_string, secret_traits, encoding):
+                return xml_string
+            xml_string = str(xml_string, self.__get_result_encoding(encoding))
         for xml_key in secret_traits.values():
             racf_key = xml_key.split(":")[1] if ":" in xml_key else xml_key
-            match = re.search(rf"{racf_key.upper()} +\(", xml_string)
-            if not match:
-                continue
-            xml_string = self.__redact_string(xml_string, match.end(), ") ")
+            secret_pattern = re.compile(rf"{racf_key.upper()} +\(")
+            match = secret_pattern.search(xml_string)
+            # Batched results may contain the same secret trait more than once.
+            while match:
+                xml_string = self.__redact_string(xml_string, match.end(), ") ")
+                match = secret_pattern.search(xml_string, match.end())
         return xml_string
 
+    def __contains_secret_traits(
+        self,
+        xml_bytes: Union[bytes, memoryview],
+        secret_traits: dict,
+        encoding: str,
+    ) -> bool:
+        """Check whether undecoded result xml contains any secret traits."""
+        encoding = self.__get_result_encoding(encoding)
+        for xml_key in secret_traits.values():
+            racf_key = xml_key.split(":")[1] if ":" in xml_key else xml_key
+            if re.search(re.escape(racf_key.upper().encode(encoding)), xml_bytes):
+                return True
+        return False
+
+    def __get_result_encoding(self, encoding: str) -> str:
+        """Get the encoding of undecoded result xml."""
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            # If not running on z/OS, EBCDIC is most likely not supported.
+            return "utf-8"
+        return encoding
+
     def __colorize_json(self, json_text: str) -> str:
         updated_json_text = ""
         json_lines = json_text.splitlines()
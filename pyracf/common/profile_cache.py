@@ -0,0 +1,165 @@
+"""Profile Extract Cache."""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Set, Tuple, Union
+
+
+class ProfileCache:
+    """
+    Profile Extract Cache.
+    Keeps formatted profile extract results so that reading several fields of the
+    same profile (i.e., 'get_omvs_uid()' followed by 'get_omvs_home()') only costs
+    one IRRSMO00 request. Entries expire 'ttl' seconds after they are cached, and
+    the least recently used entries are evicted once there are more than 'max_size'.
+    Entries are keyed by profile and by the segments that were requested, and all
+    entries for a profile are invalidated whenever a security admin object that uses
+    this cache makes a request that changes the profile.
+    A profile key may also be invalidated by a prefix of it (i.e., '("group",)'),
+    which invalidates every profile whose key starts with the prefix.
+    Each profile also has a version that changes when it is invalidated.
+    Results are only cached if the version of the profile is still the same as it
+    was before the result was extracted, so a result that was extracted while the
+    profile was being changed is never cached. Only the versions of the 'max_size'
+    most recently invalidated profiles are kept.
+
+    Profiles Not Found:
+    When 'not_found_ttl' is greater than zero, extracts of profiles that don't exist
+    are also remembered for 'not_found_ttl' seconds, so repeated probes of a missing
+    profile fail without making another IRRSMO00 request. Requests that change the
+    profile (i.e., 'add()') invalidate these entries like any other.
+
+    Thread Safety:
+    A profile cache may be shared by multiple security admin objects and threads.
+    """
+
+    def __init__(
+        self, ttl: float = 60.0, max_size: int = 1000, not_found_ttl: float = 0.0
+    ) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self.not_found_ttl = not_found_ttl
+        self.__entries: OrderedDict[Tuple[tuple, tuple], Tuple[float, dict]] = (
+            OrderedDict()
+        )
+        # Segments cached for each profile, so every entry for a profile can be found.
+        self.__profile_segments: Dict[tuple, Set[tuple]] = {}
+        # Versions of profiles and prefixes, in the order they were invalidated.
+        # Versions are never reused, and a profile whose version was dropped gets
+        # the newest version that was dropped, so its version can never go back.
+        self.__profile_versions: OrderedDict[tuple, int] = OrderedDict()
+        self.__last_version = 0
+        self.__dropped_version = 0
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__entries)
+
+    def get(
+        self, profile_key: tuple, segments: Union[tuple, None]
+    ) -> Union[dict, None]:
+        """Get a copy of a cached result, or 'None' if it is not cached or expired."""
+        with self.__lock:
+            entry = self.__entries.get((profile_key, segments))
+            if entry is None:
+                return None
+            (expiration_time, result) = entry
+            if time.monotonic() >= expiration_time:
+                self.__remove_entry(profile_key, segments)
+                return None
+            self.__entries.move_to_end((profile_key, segments))
+        # Callers are free to modify the result they get back.
+        return copy.deepcopy(result)
+
+    def get_version(self, profile_key: tuple) -> int:
+        """Get the current version of a profile."""
+        with self.__lock:
+            return self.__get_version(profile_key)
+
+    def put(
+        self,
+        profile_key: tuple,
+        segments: Union[tuple, None],
+        result: dict,
+        version: int,
+        ttl: Union[float, None] = None,
+    ) -> None:
+        """
+        Cache a copy of a result, evicting the least recently used entries if needed.
+        'version' is the version of the profile from before the result was extracted.
+        'ttl' overrides the TTL of the cache for this result.
+        """
+        result = copy.deepcopy(result)
+        with self.__lock:
+            if self.__get_version(profile_key) != version:
+                return
+            self.__entries[(profile_key, segments)] = (
+                time.monotonic() + (self.ttl if ttl is None else ttl),
+                result,
+            )
+            self.__entries.move_to_end((profile_key, segments))
+            self.__profile_segments.setdefault(profile_key, set()).add(segments)
+            while len(self.__entries) > self.max_size:
+                ((evicted_profile_key, evicted_segments), _) = next(
+                    iter(self.__entries.items())
+                )
+                self.__remove_entry(evicted_profile_key, evicted_segments)
+
+    def get_not_found(self, profile_key: tuple) -> Union[dict, None]:
+        """Get the cached result of an extract that didn't find a profile."""
+        # Profiles that don't exist are cached as entries with no segments.
+        return self.get(profile_key, None)
+
+    def put_not_found(self, profile_key: tuple, result: dict, version: int) -> None:
+        """Cache the result of an extract that didn't find a profile."""
+        if self.not_found_ttl > 0:
+            self.put(profile_key, None, result, version, ttl=self.not_found_ttl)
+
+    def invalidate(self, profile_key: tuple) -> None:
+        """
+        Remove all cached results for a profile, or for every profile whose key
+        starts with 'profile_key', and change their versions.
+        """
+        with self.__lock:
+            self.__last_version += 1
+            self.__profile_versions[profile_key] = self.__last_version
+            self.__profile_versions.move_to_end(profile_key)
+            while len(self.__profile_versions) > self.max_size:
+                (_, self.__dropped_version) = self.__profile_versions.popitem(
+                    last=False
+                )
+            for cached_profile_key in [
+                cached_profile_key
+                for cached_profile_key in self.__profile_segments
+                if cached_profile_key[: len(profile_key)] == profile_key
+            ]:
+                for segments in list(self.__profile_segments[cached_profile_key]):
+                    self.__remove_entry(cached_profile_key, segments)
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        with self.__lock:
+            self.__entries.clear()
+            self.__profile_segments.clear()
+
+    def __get_version(self, profile_key: tuple) -> int:
+        """
+        Get the version of a profile, which is the newest version of the profile
+        key and its prefixes. The caller must hold the lock.
+        """
+        return max(
+            self.__profile_versions.get(profile_key[:length], self.__dropped_version)
+            for length in range(1, len(profile_key) + 1)
+        )
+
+    def __remove_entry(self, profile_key: tuple, segments: tuple) -> None:
+        """Remove a cached result. The caller must hold the lock."""
+        self.__entries.pop((profile_key, segments), None)
+        profile_segments = self.__profile_segments.get(profile_key)
+        if profile_segments is not None:
+            profile_segments.discard(segments)
+            if not profile_segments:
+                del self.__profile_segments[profile_key]
@@ -0,0 +1,85 @@
+"""Security Request Transport that Records Requests and Results."""
+
+import json
+import platform
+import threading
+import time
+from typing import Union
+
+from .irrsmo00 import IRRSMO00
+from .logger import Logger
+from .transport import Transport
+
+
+class RecordingTransport(Transport):
+    """
+    Security Request Transport that Records Requests and Results.
+    Each request is sent to RACF using the wrapped transport (IRRSMO00 by default),
+    and the request XML, precheck option, result XML and latency are appended to
+    a capture file as one JSON object per line. The capture file can be replayed
+    using ReplayTransport.
+    Secrets are redacted from the request XML and result XML before they are written
+    to the capture file using the same rules that are used for debug logging.
+    'secret_traits' maps each secret trait to its RACF XML tag (i.e.,
+    {"base:password": "racf:password"}) and defaults to the secret traits that
+    security admin objects always redact. The secret traits of every security admin
+    object that uses this transport (including 'additional_secret_traits') are
+    redacted as well.
+    """
+
+    __logger = Logger()
+
+    def __init__(
+        self,
+        capture_file: str,
+        transport: Union[Transport, None] = None,
+        secret_traits: Union[dict, None] = None,
+    ) -> None:
+        self.capture_file = capture_file
+        self.__transport = transport if transport is not None else IRRSMO00()
+        if secret_traits is None:
+            secret_traits = {
+                "base:password": "racf:password",
+                "base:passphrase": "racf:phrase",
+            }
+        self.__secret_traits = dict(secret_traits)
+        self.__encoding = "cp1047" if platform.system() == "OS/390" else "utf-8"
+        # Requests may be made from multiple threads at once.
+        self.__capture_file_lock = threading.Lock()
+
+    def call_racf(
+        self, request_xml: bytes, precheck: bool = False, zero_copy: bool = False
+    ) -> str:
+        """
+        Send request XML to RACF using the wrapped transport and record the result.
+        Result XML is always returned as a str since it has to be decoded to be recorded.
+        """
+        start_time = time.perf_counter()
+        result_xml = self.__transport.call_racf(request_xml, precheck=precheck)
+        latency = time.perf_counter() - start_time
+        self.__record(str(request_xml, self.__encoding), precheck, result_xml, latency)
+        return result_xml
+
+    def _add_secret_traits(self, secret_traits: dict) -> None:
+        """Redact the secret traits of a security admin object that uses this transport."""
+        with self.__capture_file_lock:
+            # Replaced instead of updated, since requests may be recorded meanwhile.
+            self.__secret_traits = {**self.__secret_traits, **secret_traits}
+
+    def __record(
+        self, request_xml: str, precheck: bool, result_xml: str, latency: float
+    ) -> None:
+        """Redact secrets and append a request and its result to the capture file."""
+        record = {
+            "request_xml": self.__logger.redact_request_xml(
+                request_xml, self.__secret_traits
+            ),
+            "precheck": precheck,
+            "result_xml": self.__logger.redact_result_xml(
+                result_xml, self.__secret_traits
+            ),
+            "latency": latency,
+        }
+        with self.__capture_file_lock:
+            with open(self.capture_file, "a", encoding="utf-8") as capture_file:
+                capture_file.write(json.dumps(record) + "\n")
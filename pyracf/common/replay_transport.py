@@ -0,0 +1,91 @@
+"""Security Request Transport that Replays Recorded Results."""
+
+import json
+import platform
+import threading
+import time
+from typing import Dict, List, Tuple, Union
+
+from .logger import Logger
+from .transport import Transport
+
+
+class ReplayTransport(Transport):
+    """
+    Security Request Transport that Replays Recorded Results.
+    Answers requests with the results recorded in a capture file by RecordingTransport.
+    Each request is redacted the same way it was when it was recorded (including the
+    secret traits of every security admin object that uses this transport) and is answered
+    with the recorded results for the same request XML and precheck option, in the
+    order they were recorded, starting over once all of them have been used.
+    When 'real_time' is True, each result is returned after the latency that was
+    recorded for it, otherwise results are returned as fast as possible.
+    """
+
+    __logger = Logger()
+
+    def __init__(
+        self,
+        capture_file: str,
+        real_time: bool = False,
+        secret_traits: Union[dict, None] = None,
+    ) -> None:
+        self.real_time = real_time
+        if secret_traits is None:
+            secret_traits = {
+                "base:password": "racf:password",
+                "base:passphrase": "racf:phrase",
+            }
+        self.__secret_traits = dict(secret_traits)
+        self.__encoding = "cp1047" if platform.system() == "OS/390" else "utf-8"
+        with open(capture_file, "r", encoding="utf-8") as capture_file:
+            self.records = [json.loads(line) for line in capture_file if line.strip()]
+        self.__results: Dict[Tuple[str, bool], List[Tuple[str, bytes, float]]] = {}
+        for record in self.records:
+            self.__results.setdefault(
+                (record["request_xml"], record["precheck"]), []
+            ).append(
+                (
+                    record["result_xml"],
+                    # Encode up front so that replaying undecoded results is cheap.
+                    record["result_xml"].encode(self.__encoding),
+                    record["latency"],
+                )
+            )
+        self.__replay_counts: Dict[Tuple[str, bool], int] = {}
+        self.__replay_counts_lock = threading.Lock()
+
+    def _add_secret_traits(self, secret_traits: dict) -> None:
+        """Redact the secret traits of a security admin object that uses this transport."""
+        with self.__replay_counts_lock:
+            # Replaced instead of updated, since requests may be replayed meanwhile.
+            self.__secret_traits = {**self.__secret_traits, **secret_traits}
+
+    def call_racf(
+        self, request_xml: bytes, precheck: bool = False, zero_copy: bool = False
+    ) -> Union[str, memoryview]:
+        """
+        Return the recorded result XML for the request XML.
+        When 'zero_copy' is True, the result XML is returned undecoded as a memoryview.
+        Raises a LookupError if the request was never recorded.
+        """
+        key = (
+            self.__logger.redact_request_xml(
+                str(request_xml, self.__encoding), self.__secret_traits
+            ),
+            precheck,
+        )
+        results = self.__results.get(key)
+        if results is None:
+            raise LookupError(
+                "No result was recorded for this request XML and precheck option."
+            )
+        with self.__replay_counts_lock:
+            replay_count = self.__replay_counts.get(key, 0)
+            self.__replay_counts[key] = replay_count + 1
+        result_xml, result_bytes, latency = results[replay_count % len(results)]
+        if self.real_time:
+            time.sleep(latency)
+        if zero_copy:
+            return memoryview(result_bytes)
+        return result_xml
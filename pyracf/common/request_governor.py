@@ -0,0 +1,168 @@
+"""Concurrency Governor and Rate Limiter for IRRSMO00 Requests."""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Union
+
+
+class RequestGovernor:
+    """
+    Concurrency Governor and Rate Limiter for IRRSMO00 Requests.
+    Once installed, every request that any security admin object in this process
+    sends to RACF must first fit in the budget of the governor. Each budget has a
+    maximum number of requests in flight and a token bucket requests per second
+    limit that allows bursts of up to one second worth of requests. There is an
+    overall budget, and separate budgets for read requests (i.e., profile extracts)
+    and write requests (i.e., add, alter and delete). 'None' means no limit.
+    Requests that don't fit wait until they do, which is reflected in the queueing
+    statistics returned by 'get_statistics()'.
+
+    Thread Safety:
+    A request governor may be shared by multiple threads.
+    """
+
+    __installed_governor = None
+    __installed_governor_lock = threading.Lock()
+
+    class __Budget:
+        """Limits on requests in flight and requests per second."""
+
+        def __init__(
+            self,
+            max_in_flight: Union[int, None],
+            requests_per_second: Union[float, None],
+        ) -> None:
+            self.max_in_flight = max_in_flight
+            self.requests_per_second = requests_per_second
+            # Bursts of up to one second worth of requests are allowed.
+            self.capacity = max(1.0, requests_per_second or 0.0)
+            self.tokens = self.capacity
+            self.last_refill_time = time.monotonic()
+            self.in_flight = 0
+            self.queued = 0
+            self.requests = 0
+            self.total_wait_time = 0.0
+            self.max_wait_time = 0.0
+            self.condition = threading.Condition()
+
+        def acquire(self) -> None:
+            """Wait until a request fits in this budget and count it as in flight."""
+            start_time = time.monotonic()
+            with self.condition:
+                self.queued += 1
+                try:
+                    while True:
+                        timeout = self.__get_wait_time()
+                        if timeout == 0.0:
+                            break
+                        self.condition.wait(timeout)
+                finally:
+                    self.queued -= 1
+                if self.requests_per_second is not None:
+                    self.tokens -= 1.0
+                self.in_flight += 1
+                self.requests += 1
+                wait_time = time.monotonic() - start_time
+                self.total_wait_time += wait_time
+                self.max_wait_time = max(self.max_wait_time, wait_time)
+
+        def release(self) -> None:
+            """Stop counting a request as in flight."""
+            with self.condition:
+                self.in_flight -= 1
+                self.condition.notify()
+
+        def get_statistics(self) -> dict:
+            """Get the queueing statistics for this budget."""
+            with self.condition:
+                return {
+                    "inFlight": self.in_flight,
+                    "queued": self.queued,
+                    "requests": self.requests,
+                    "totalWaitSeconds": self.total_wait_time,
+                    "maxWaitSeconds": self.max_wait_time,
+                }
+
+        def __get_wait_time(self) -> Union[float, None]:
+            """
+            Get how long to wait before a request might fit in this budget.
+            '0.0' means that it fits now and 'None' means to wait until a request
+            that is in flight completes. The caller must hold the condition lock.
+            """
+            if self.max_in_flight is not None and self.in_flight >= self.max_in_flight:
+                return None
+            if self.requests_per_second is None:
+                return 0.0
+            current_time = time.monotonic()
+            self.tokens = min(
+                self.capacity,
+                self.tokens
+                + (current_time - self.last_refill_time) * self.requests_per_second,
+            )
+            self.last_refill_time = current_time
+            if self.tokens >= 1.0:
+                return 0.0
+            return (1.0 - self.tokens) / self.requests_per_second
+
+    def __init__(
+        self,
+        max_in_flight: Union[int, None] = None,
+        requests_per_second: Union[float, None] = None,
+        max_reads_in_flight: Union[int, None] = None,
+        reads_per_second: Union[float, None] = None,
+        max_writes_in_flight: Union[int, None] = None,
+        writes_per_second: Union[float, None] = None,
+    ) -> None:
+        self.__total_budget = self.__Budget(max_in_flight, requests_per_second)
+        self.__read_budget = self.__Budget(max_reads_in_flight, reads_per_second)
+        self.__write_budget = self.__Budget(max_writes_in_flight, writes_per_second)
+
+    # ============================================================================
+    # Installation
+    # ============================================================================
+    def install(self) -> None:
+        """Govern all requests made by this process, replacing any other governor."""
+        with RequestGovernor.__installed_governor_lock:
+            RequestGovernor.__installed_governor = self
+
+    @staticmethod
+    def uninstall() -> None:
+        """Stop governing requests made by this process."""
+        with RequestGovernor.__installed_governor_lock:
+            RequestGovernor.__installed_governor = None
+
+    @staticmethod
+    def _get_installed_governor() -> Union["RequestGovernor", None]:
+        """Get the governor installed for this process, if there is one."""
+        return RequestGovernor.__installed_governor
+
+    # ============================================================================
+    # Request Admission
+    # ============================================================================
+    @contextmanager
+    def _govern(self, read_only: bool) -> Iterator[None]:
+        """Hold a place in the budgets of this governor while a request is made."""
+        operation_budget = self.__read_budget if read_only else self.__write_budget
+        # Requests don't take up overall capacity while they wait for their
+        # operation budget, so bulk writes can't crowd out reads or vice versa.
+        operation_budget.acquire()
+        try:
+            self.__total_budget.acquire()
+            try:
+                yield
+            finally:
+                self.__total_budget.release()
+        finally:
+            operation_budget.release()
+
+    # ============================================================================
+    # Statistics
+    # ============================================================================
+    def get_statistics(self) -> dict:
+        """Get queueing statistics for all requests, read requests and write requests."""
+        return {
+            "total": self.__total_budget.get_statistics(),
+            "read": self.__read_budget.get_statistics(),
+            "write": self.__write_budget.get_statistics(),
+        }
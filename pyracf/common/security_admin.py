@@ -1,22 +1,129 @@
 """Base Class for RACF Administration Interface."""
 
-import platform
 import re
-from datetime import datetime
-from typing import Any, List, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
 
 from .irrsmo00 import IRRSMO00
+from .julian_date_decoder import JulianDateDecoder
+from .lazy_result_dictionary import LazyResultDictionary
 from .logger import Logger
+from .profile_cache import ProfileCache
+from .request_governor import RequestGovernor
+from .security_batch import SecurityBatch
 from .security_request import SecurityRequest
 from .security_request_error import SecurityRequestError
 from .security_result import SecurityResult
+from .security_result_stream import SecurityResultStream
+from .single_flight import SingleFlight
+from .transport import Transport
 
 
 class SecurityAdmin:
-    """Base Class for RACF Administration Interface."""
+    """
+    Base Class for RACF Administration Interface.
+
+    Thread Safety:
+    Security admin objects are not modified after they are initialized. All of the
+    state needed to build a request is kept on the request object for that call,
+    so one security admin object may be shared by multiple threads.
+
+    Profile Cache:
+    When a profile cache is provided, formatted profile extract results are cached
+    and requests invalidate the cached results for every profile they change
+    (i.e., a connection changes both the user profile and the group profile).
+    Extracts of profiles that don't exist are also cached when the profile cache
+    has a 'not_found_ttl', and raise a 'SecurityRequestError' without calling RACF.
+
+    Extract Coalescing:
+    Concurrent identical profile extracts made using the same security admin object
+    share one IRRSMO00 request, and each caller gets its own copy of the result.
+    """
 
     _valid_segment_traits = {}
     __logger = Logger()
+    # Messages issued when a profile to extract doesn't exist.
+    __profile_not_found_message_ids = (
+        "ICH30001I",
+        "ICH51003I",
+        "ICH35003I",
+        "ICH13003I",
+    )
+    # Profile data fields that are always formatted as lists.
+    __key_value_list_fields = frozenset(
+        ["attributes", "classAuthorizations", "connectAttributes"]
+    )
+    __group_list_fields = frozenset(["users", "subgroups"])
+    __data_set_list_fields = frozenset(["volumes"])
+    # Classifiers for the lines of each type of profile data. Each line is matched
+    # once, and the name of the first alternative that matches is the kind of line.
+    # The last alternative of each classifier matches any other line.
+    __data_set_line_pattern = re.compile(
+        r"(?P<pair>[^=]*=)"
+        + r"|(?P<rule>[ -]*-[ -]*\Z)"
+        + r"|(?P<no_installation_data>.*?NO INSTALLATION DATA)"
+        + r"|(?P<name>.*?INFORMATION FOR DATA ?SET )"
+        + r"|(?P<heading>.*?  )"
+        + r"|(?P<other>)"
+    )
+    __profile_line_patterns = {
+        "dataSet": __data_set_line_pattern,
+        "resource": __data_set_line_pattern,
+        "user": re.compile(
+            r"(?P<rule> -{45}\Z)"
+            + r"|(?P<connect>  GROUP=)"
+            + r"|(?P<pairs>[^=]*=|\s*NO-)"
+            + r"|(?P<key>)"
+        ),
+        "group": re.compile(
+            r"(?P<users>.*?USER\(S\)=      ACCESS=      ACCESS COUNT=      UNIVERSAL ACCESS=)"
+            + r"|(?P<pairs>[^=]*=)"
+            + r"|(?P<no>.*?NO )"
+            + r"|(?P<termuacc>.*?TERMUACC)"
+            + r"|(?P<name>.*?INFORMATION FOR GROUP )"
+            + r"|(?P<other>)"
+        ),
+    }
+    # Field names that are spelled differently in some lines of profile data.
+    __user_field_replacements = {
+        "PASSDATE=": "PASSWORD-DATE=",
+        "PASS-INTERVAL=": "PASSWORD-INTERVAL=",
+        "PHRASEDATE=": "PASSPHRASE-DATE=",
+    }
+    __user_field_pattern = re.compile("|".join(__user_field_replacements))
+    __data_set_field_pattern = re.compile(
+        "(?P<volumes>VOLUMES ON WHICH DATA ?SET RESIDES)|(?P<data_set>DATASET)"
+    )
+    # Raw profile values that cast to None, True or False.
+    __cast_constants = {
+        **dict.fromkeys(["n/a", "none", "none specified", "no"], None),
+        **dict.fromkeys(
+            [
+                "in effect",
+                "active",
+                "active.",
+                "being done.",
+                "in effect.",
+                "allowed.",
+                "being done",
+                "true",
+            ],
+            True,
+        ),
+        **dict.fromkeys(
+            ["not in effect", "inactive", "not allowed.", "not being done", "false"],
+            False,
+        ),
+    }
+    __no_constant = object()
+    # Julian dates are checked first, since they also look like decimal numbers.
+    __cast_num_pattern = re.compile(
+        r"(?P<julian_date>\d\d\.\d\d\d(?:/\d\d:\d\d:\d\d)?)"
+        + r"|(?P<integer>-?\d+)"
+        + r"|(?P<decimal>-?\d*\.\d+)"
+    )
 
     def __init__(
         self,
@@ -26,6 +133,8 @@ class SecurityAdmin:
         update_existing_segment_traits: Union[dict, None] = None,
         replace_existing_segment_traits: Union[dict, None] = None,
         additional_secret_traits: Union[List[str], None] = None,
+        transport: Union[Transport, None] = None,
+        profile_cache: Union[ProfileCache, None] = None,
     ) -> None:
         self._common_base_traits_data_set_generic = {
             "base:aclcnt": "racf:aclcnt",
@@ -61,12 +170,11 @@ class SecurityAdmin:
             "base:password": "racf:password",
             "base:passphrase": "racf:phrase",
         }
-        self.__irrsmo00 = IRRSMO00()
+        # IRRSMO00 is used to send requests to RACF unless another transport is provided.
+        self.__transport = transport if transport is not None else IRRSMO00()
+        self.__profile_cache = profile_cache
+        self.__extract_single_flight = SingleFlight()
         self.__profile_type = profile_type
-        self._segment_traits = {}
-        # used to preserve segment traits for debug logging.
-        self.__preserved_segment_traits = {}
-        self._trait_map = {}
         self.__debug = debug
         self.__generate_requests_only = generate_requests_only
         if update_existing_segment_traits is not None:
@@ -75,6 +183,23 @@ class SecurityAdmin:
             self.__replace_valid_segment_traits(replace_existing_segment_traits)
         if additional_secret_traits is not None:
             self.__add_additional_secret_traits(additional_secret_traits)
+        if isinstance(self.__transport, Transport):
+            # Transports that keep request or result XML redact these secrets too.
+            self.__transport._add_secret_traits(self.__secret_traits)
+        (
+            self.__segment_headers,
+            self.__segment_line_kinds,
+        ) = SecurityAdmin.__build_segment_line_classifier(
+            tuple(self._valid_segment_traits)
+        )
+        # The line classifier and formatter are looked up once instead of for every line.
+        self.__profile_line_pattern = self.__profile_line_patterns.get(profile_type)
+        self.__format_profile_line = {
+            "dataSet": self.__format_data_set_generic_profile_line,
+            "resource": self.__format_data_set_generic_profile_line,
+            "user": self.__format_user_profile_line,
+            "group": self.__format_group_profile_line,
+        }.get(profile_type)
 
     # ============================================================================
     # Customize Segment Traits
@@ -120,10 +245,66 @@ class SecurityAdmin:
         security_request: SecurityRequest,
     ) -> dict:
         """Extract a RACF profile."""
-        result = self._make_request(security_request)
-        if self.__generate_requests_only:
-            return result
+        profile_key = security_request._get_profile_key()
+        segments = self.__get_requested_segments(security_request)
+        profile_cache = self.__get_profile_cache()
+        profile_version = 0
+        if profile_cache is not None:
+            profile_version = profile_cache.get_version(profile_key)
+            result = profile_cache.get(profile_key, segments)
+            if result is not None:
+                if self.__debug:
+                    self.__logger.log_dictionary(
+                        "Result Dictionary (Cached Profile)", result
+                    )
+                return result
+            not_found_result = profile_cache.get_not_found(profile_key)
+            if not_found_result is not None:
+                if self.__debug:
+                    self.__logger.log_dictionary(
+                        "Result Dictionary (Cached Profile Not Found)", not_found_result
+                    )
+                raise SecurityRequestError(not_found_result)
+        if (
+            self.__generate_requests_only
+            or SecurityBatch._get_active_batch() is not None
+        ):
+            # Queued and generated requests can't be shared.
+            return self._make_request(security_request, extract=True)
+        return self.__extract_single_flight.do(
+            (profile_key, segments),
+            lambda: self.__extract_and_format_profile(
+                security_request, profile_cache, profile_version
+            ),
+        )
+
+    def __extract_and_format_profile(
+        self,
+        security_request: SecurityRequest,
+        profile_cache: Union[ProfileCache, None],
+        profile_version: int,
+    ) -> dict:
+        """Extract a RACF profile, format it and cache it."""
+        try:
+            result = self._make_request(security_request, extract=True)
+        except SecurityRequestError as security_request_error:
+            if profile_cache is not None and self.__is_profile_not_found(
+                security_request_error.result
+            ):
+                profile_cache.put_not_found(
+                    security_request._get_profile_key(),
+                    security_request_error.result,
+                    profile_version,
+                )
+            raise
         self._format_profile(result)
+        if profile_cache is not None:
+            profile_cache.put(
+                security_request._get_profile_key(),
+                self.__get_requested_segments(security_request),
+                result,
+                profile_version,
+            )
         if self.__debug:
             # No need to redact anything here since the result dictionary
             # already has secrets redacted when it is built, and profile
@@ -137,15 +318,17 @@ class SecurityAdmin:
         self,
         security_request: SecurityRequest,
         irrsmo00_precheck: bool = False,
-    ) -> Union[dict, bytes]:
+        extract: bool = False,
+    ) -> Union[dict, bytes, None]:
         """
         Make request to IRRSMO00.
         Note: Secrets are redacted from all data returned to the user and log messages.
+        Note: When a batch is active, the request is queued in the batch and 'None' is returned.
         """
         if self.__debug:
             self.__logger.log_dictionary(
                 "Request Dictionary",
-                self.__preserved_segment_traits,
+                security_request._segment_traits,
                 secret_traits=self.__secret_traits,
             )
             self.__logger.log_xml(
@@ -158,27 +341,31 @@ class SecurityAdmin:
                 security_request.dump_request_xml(encoding="utf-8"),
                 secret_traits=self.__secret_traits,
             )
-            self.__clear_state(security_request)
             return request_xml
-        result_xml = self.__logger.redact_result_xml(
-            self.__irrsmo00.call_racf(
-                security_request.dump_request_xml(), irrsmo00_precheck
-            ),
-            self.__secret_traits,
-        )
-        self.__clear_state(security_request)
-        if self.__debug:
-            # No need to redact anything here since the raw result XML
-            # already has secrets redacted when it is built.
-            self.__logger.log_xml("Result XML", result_xml)
-        results = SecurityResult(result_xml)
-        if self.__debug:
-            # No need to redact anything here since the result dictionary
-            # already has secrets redacted when it is built.
-            self.__logger.log_dictionary(
-                "Result Dictionary", results.get_result_dictionary()
+        if not extract:
+            self._invalidate_cached_profile(security_request)
+        security_batch = SecurityBatch._get_active_batch()
+        if security_batch is not None:
+            security_batch._queue_request(
+                self, security_request, irrsmo00_precheck, extract
             )
-        result_dictionary = results.get_result_dictionary()
+            return None
+        result_xml = self._redact_result_xml(
+            self._call_racf(security_request, irrsmo00_precheck)
+        )
+        if not extract:
+            # Don't cache anything that was extracted while the profile was changing.
+            self._invalidate_cached_profile(security_request)
+        self._log_result_xml(result_xml)
+        if extract:
+            # Extracts are formatted right away, so they are parsed while the
+            # result XML is still in the IRRSMO00 response buffer.
+            result_dictionary = SecurityResult(result_xml).get_result_dictionary()
+        else:
+            # Only the return codes are decoded until the rest of the result is
+            # accessed, which means keeping a copy of the result XML.
+            result_dictionary = {"securityResult": LazyResultDictionary(result_xml)}
+        self._log_result_dictionary(result_dictionary)
         if result_dictionary["securityResult"]["returnCode"] != 0:
             # All non-zero return codes should cause a SecurityRequestError to be raised.
             # Even if a return code of 4 is not indicative of a problem, it it is
@@ -188,7 +375,92 @@ class SecurityAdmin:
             raise SecurityRequestError(result_dictionary)
         return result_dictionary
 
-    def _to_steps(self, results: Union[List[dict], dict, bytes]) -> Union[dict, bytes]:
+    def _call_racf(
+        self, security_request: SecurityRequest, irrsmo00_precheck: bool = False
+    ) -> Union[str, bytes, memoryview]:
+        """
+        Send request XML to IRRSMO00 and return the raw result XML.
+        Unless debug logging is enabled, the result XML is returned undecoded
+        so that it can be parsed straight out of the IRRSMO00 response buffer.
+        Note: When a request governor is installed, the request waits until it fits.
+        """
+        request_governor = RequestGovernor._get_installed_governor()
+        governed = (
+            nullcontext()
+            if request_governor is None
+            else request_governor._govern(security_request._is_read_only())
+        )
+        with governed:
+            return self.__transport.call_racf(
+                security_request.dump_request_xml(),
+                irrsmo00_precheck,
+                zero_copy=not self.__debug,
+            )
+
+    def _stream_extract(
+        self, security_request: SecurityRequest, function_name: str
+    ) -> Union[SecurityResultStream, bytes]:
+        """
+        Extract a RACF profile as a stream of result events instead of a result
+        dictionary. IRRSMO00 response chunks are parsed as they are returned, so the
+        result XML is never held in memory all at once. Nothing is sent to IRRSMO00
+        until the stream is iterated, and the stream can only be iterated once.
+        Note: Extract results are not redacted, since they don't contain secrets in
+        the 'TRAIT (value)' form that is redacted from other results.
+        """
+        if self.__generate_requests_only:
+            return self._make_request(security_request, extract=True)
+        self._check_batch_is_not_active(function_name)
+        if self.__debug:
+            self.__logger.log_xml(
+                "Request XML",
+                security_request.dump_request_xml(encoding="utf-8"),
+                secret_traits=self.__secret_traits,
+            )
+        return SecurityResultStream(self.__call_racf_chunks(security_request))
+
+    def __call_racf_chunks(
+        self, security_request: SecurityRequest
+    ) -> Iterator[Union[str, bytes, memoryview]]:
+        """Send request XML to IRRSMO00 and yield the result XML one chunk at a time."""
+        request_governor = RequestGovernor._get_installed_governor()
+        governed = (
+            nullcontext()
+            if request_governor is None
+            else request_governor._govern(security_request._is_read_only())
+        )
+        with governed:
+            yield from self.__transport.call_racf_chunks(
+                security_request.dump_request_xml(), zero_copy=True
+            )
+
+    def _is_debug_enabled(self) -> bool:
+        """Check if debug logging is enabled for this admin object."""
+        return self.__debug
+
+    def _log_result_xml(self, result_xml: Union[str, bytes]) -> None:
+        """Log result XML when debug logging is enabled."""
+        if self.__debug:
+            # No need to redact anything here since the raw result XML
+            # already has secrets redacted when it is built.
+            self.__logger.log_xml("Result XML", result_xml)
+
+    def _log_result_dictionary(self, result_dictionary: dict) -> None:
+        """Log a result dictionary when debug logging is enabled."""
+        if self.__debug:
+            # No need to redact anything here since the result dictionary
+            # already has secrets redacted when it is built.
+            self.__logger.log_dictionary("Result Dictionary", result_dictionary)
+
+    def _redact_result_xml(
+        self, result_xml: Union[str, bytes, memoryview]
+    ) -> Union[str, bytes, memoryview]:
+        """Redact this admin's secret traits from result XML."""
+        return self.__logger.redact_result_xml(result_xml, self.__secret_traits)
+
+    def _to_steps(
+        self, results: Union[List[dict], dict, bytes, None]
+    ) -> Union[dict, bytes, None]:
         """
         Build a steps dictionary composed of each result dictionary
         in a result dictionary list, where the result dictionary list is
@@ -197,9 +469,12 @@ class SecurityAdmin:
 
         Note: for generate request only mode (for testing purposes),
         all of the request xml bytes should just be concatenated together.
+        Note: 'None' is returned when every request was queued in a batch.
         """
-        if isinstance(results, dict) or isinstance(results, bytes):
+        if isinstance(results, dict) or isinstance(results, bytes) or results is None:
             results = [results]
+        if all(result is None for result in results):
+            return None
         if self.__generate_requests_only:
             concatenated_xml = b""
             for request_xml in results:
@@ -221,17 +496,89 @@ class SecurityAdmin:
         return steps_dictionary
 
     # ============================================================================
-    # Request Dictionary Building
+    # Profile Cache
+    # ============================================================================
+    def _invalidate_cached_profile(self, security_request: SecurityRequest) -> None:
+        """
+        Remove cached extract results for every profile that a request changes,
+        and stop sharing extracts of those profiles that are already in flight.
+        """
+        for profile_key in security_request._get_affected_profile_keys():
+            self.__extract_single_flight.forget(
+                lambda key: key[0][: len(profile_key)] == profile_key
+            )
+            if self.__profile_cache is not None:
+                self.__profile_cache.invalidate(profile_key)
+
+    def __get_profile_cache(self) -> Union[ProfileCache, None]:
+        """Get the profile cache, unless results can't be cached right now."""
+        if self.__generate_requests_only:
+            return None
+        if SecurityBatch._get_active_batch() is not None:
+            return None
+        return self.__profile_cache
+
+    def __is_profile_not_found(self, result: dict) -> bool:
+        """Check if a failed profile extract didn't find the profile."""
+        for profile_result in result["securityResult"].values():
+            if not isinstance(profile_result, dict):
+                continue
+            for command in profile_result.get("commands", []):
+                for message in command.get("messages", []):
+                    if message.startswith(self.__profile_not_found_message_ids):
+                        return True
+        return False
+
+    def __get_requested_segments(self, security_request: SecurityRequest) -> tuple:
+        """Get the segments requested by a profile extract."""
+        return tuple(
+            sorted(
+                segment
+                for segment, requested in security_request._segment_traits.items()
+                if requested
+            )
+        )
+
+    # ============================================================================
+    # Parallel Profile Extract
     # ============================================================================
-    def __clear_state(self, security_request: SecurityRequest) -> None:
-        """Clear state for new request."""
-        self._segment_traits = {}
-        self._trait_map = {}
-        self.__preserved_segment_traits = {}
-        del security_request
+    def _extract_many(
+        self,
+        profile_names: List[str],
+        extract: Callable[[str], Union[dict, bytes]],
+        max_workers: Union[int, None] = None,
+    ) -> Iterator[Tuple[str, Union[dict, bytes, SecurityRequestError]]]:
+        """
+        Extract many profiles concurrently using a thread pool.
+        Yields a '(profile name, profile or error)' tuple for each profile as each
+        extract completes. A 'SecurityRequestError' raised by an individual extract
+        is yielded in place of the result so that one failure does not stop the rest.
+        Note: Extracts made by worker threads are never queued in an active batch.
+        """
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {
+                executor.submit(extract, profile_name): profile_name
+                for profile_name in profile_names
+            }
+            for future in as_completed(futures):
+                try:
+                    yield (futures[future], future.result())
+                except SecurityRequestError as security_request_error:
+                    yield (futures[future], security_request_error)
+        finally:
+            # Don't make any more requests if the caller stops iterating early.
+            executor.shutdown(wait=True, cancel_futures=True)
 
+    # ============================================================================
+    # Request Dictionary Building
+    # ============================================================================
     def __validate_and_add_trait(
-        self, trait: str, segment: str, value: Union[str, dict]
+        self,
+        security_request: SecurityRequest,
+        trait: str,
+        segment: str,
+        value: Union[str, dict],
     ):
         """Validate the specified trait exists in the specified segment."""
         if segment not in self._valid_segment_traits:
@@ -250,27 +597,64 @@ class SecurityAdmin:
             if isinstance(value, bool) and not value:
                 operation = "delete"
             value_operation_dictionary = {"value": value, "operation": operation}
-        if segment not in self._segment_traits:
-            self._segment_traits[segment] = {}
-        self._segment_traits[segment][trait] = value_operation_dictionary
-        self._trait_map[trait] = self._valid_segment_traits[segment][trait]
+        segment_traits = security_request._segment_traits
+        if segment not in segment_traits:
+            segment_traits[segment] = {}
+        racf_trait = self._valid_segment_traits[segment][trait]
+        if (
+            operation in ["add", "remove"]
+            and trait in segment_traits[segment]
+            and segment_traits[segment][trait]["operation"] != operation
+        ):
+            # Values can be added to and removed from a list trait in one request.
+            trait = f"{operation}:{trait}"
+        segment_traits[segment][trait] = value_operation_dictionary
+        security_request._trait_map[trait] = racf_trait
         return True
 
-    def _build_bool_segment_dictionaries(self, segments: dict) -> None:
+    def _build_list_trait_changes(
+        self, trait: str, current_values: List[str], desired_values: List[str]
+    ) -> dict:
+        """
+        Build the 'add:' and 'remove:' traits that change the values of a list trait
+        from the current values to the desired values, ignoring case.
+        """
+        current_values_lower = [value.lower() for value in current_values]
+        desired_values_lower = [value.lower() for value in desired_values]
+        traits = {}
+        added_values = [
+            value
+            for value in desired_values
+            if value.lower() not in current_values_lower
+        ]
+        if added_values:
+            traits[f"add:{trait}"] = added_values
+        removed_values = [
+            value
+            for value in current_values
+            if value.lower() not in desired_values_lower
+        ]
+        if removed_values:
+            traits[f"remove:{trait}"] = removed_values
+        return traits
+
+    def _build_bool_segment_dictionaries(
+        self, security_request: SecurityRequest, segments: dict
+    ) -> None:
         """Build segment dictionaries for profile extract."""
         for segment in segments:
             if segment in self._valid_segment_traits:
-                self._segment_traits[segment] = segments[segment]
-        # preserve segment traits for debug logging.
-        self.__preserved_segment_traits = self._segment_traits
+                security_request._segment_traits[segment] = segments[segment]
 
-    def _build_segment_dictionaries(self, traits: dict) -> None:
+    def _build_segment_dictionaries(
+        self, security_request: SecurityRequest, traits: dict
+    ) -> None:
         """Build segemnt dictionaries for each segment."""
         for trait in traits:
             for segment in self._valid_segment_traits:
-                self.__validate_and_add_trait(trait, segment, traits[trait])
-        # preserve segment traits for debug logging.
-        self.__preserved_segment_traits = self._segment_traits
+                self.__validate_and_add_trait(
+                    security_request, trait, segment, traits[trait]
+                )
 
     def _build_xml_segments(
         self,
@@ -280,17 +664,20 @@ class SecurityAdmin:
     ) -> None:
         """Build XML representation of segments."""
         security_request._build_segments(
-            self._segment_traits, self._trait_map, alter=alter, extract=extract
+            security_request._segment_traits,
+            security_request._trait_map,
+            alter=alter,
+            extract=extract,
         )
 
     def _add_traits_directly_to_request_xml_with_no_segments(
         self, security_request: SecurityRequest, alter: bool = False
     ) -> None:
         """Add traits as directly to request xml without building segments."""
-        for segment, traits in self._segment_traits.items():
+        for segment, traits in security_request._segment_traits.items():
             if segment == "base":
                 security_request._build_segment(
-                    None, traits, self._trait_map, alter=alter
+                    None, traits, security_request._trait_map, alter=alter
                 )
 
     # ============================================================================
@@ -300,8 +687,9 @@ class SecurityAdmin:
         self, result: Union[dict, bytes], index: int = 0
     ) -> Union[dict, bytes]:
         """Extract the profile section from a result dictionary."""
-        if self.__generate_requests_only:
-            # Allows this function to work with "self.__generate_requests_only" mode.
+        if self.__generate_requests_only or result is None:
+            # Allows this function to work with "self.__generate_requests_only" mode
+            # and with requests that are queued in a batch.
             return result
         return result["securityResult"][self.__profile_type]["commands"][0]["profiles"][
             index
@@ -311,223 +699,234 @@ class SecurityAdmin:
         self, profile: Union[dict, bytes], segment: str, field: str
     ) -> Union[bytes, Any, None]:
         """Extract the value of a field from a segment in a profile."""
-        if self.__generate_requests_only:
-            # Allows this function to work with "self.__generate_requests_only" mode.
+        if self.__generate_requests_only or profile is None:
+            # Allows this function to work with "self.__generate_requests_only" mode
+            # and with requests that are queued in a batch.
             return profile
         try:
             return profile[segment][field]
         except KeyError:
             return None
 
+    def _check_batch_is_not_active(self, function_name: str) -> None:
+        """
+        Functions that change a profile based on an extract of it can't be queued
+        in a batch, since the extract isn't made until the batch is submitted.
+        """
+        if SecurityBatch._get_active_batch() is not None:
+            raise RuntimeError(
+                f"'{function_name}()' needs the result of a profile extract, "
+                + "so it can't be used while a security batch is active."
+            )
+
+    def _get_fields(
+        self, extract: Callable[[dict], Union[dict, bytes]], fields: List[str]
+    ) -> Union[dict, bytes]:
+        """
+        Get the values of several fields (i.e., 'omvs:uid') from one profile extract
+        that only requests the segments that the fields are in.
+        """
+        segments = {}
+        for field in fields:
+            segment = field.partition(":")[0]
+            if segment != "base":
+                segments[segment] = True
+        profile = extract(segments)
+        if not isinstance(profile, dict):
+            # Allows this function to work with "self.__generate_requests_only" mode.
+            return profile
+        fields_dictionary = {}
+        for field in fields:
+            segment, _, field_name = field.partition(":")
+            fields_dictionary[field] = self._get_field(profile, segment, field_name)
+        return fields_dictionary
+
     def _format_profile(self, result: dict):
         """Placeholder for format profile function for profile extract."""
 
-    def _format_profile_generic(self, messages: str) -> None:
-        """Generic profile formatter shared by two or more RACF profile formats."""
+    def _format_profile_generic(self, messages: List[str]) -> dict:
+        """
+        Generic profile formatter shared by two or more RACF profile formats.
+        Every line is classified once, up front, and the profile line formatter
+        then uses the kinds of lines to decide how each line is formatted.
+        """
         profile = {}
         current_segment = "base"
-        (
-            additional_segment_keys,
-            no_segment_information_keys,
-        ) = self.__build_additional_segment_keys()
         profile[current_segment] = {}
+        segment_line_kinds = self.__segment_line_kinds
+        match_profile_line = self.__profile_line_pattern.match
+        kinds = [
+            (
+                "skip"
+                if message is None
+                else segment_line_kinds.get(message)
+                or match_profile_line(message).lastgroup
+            )
+            for message in messages
+        ]
+        format_profile_line = self.__format_profile_line
+        messages_length = len(messages)
         i = 0
-        while i < len(messages):
-            if (
-                messages[i] == " "
-                or messages[i] in no_segment_information_keys
-                or messages[i] is None
-            ):
+        while i < messages_length:
+            kind = kinds[i]
+            if kind == "skip":
+                i += 1
+            elif kind == "segment":
+                if i < messages_length - 1:
+                    current_segment = self.__segment_headers[messages[i]]
+                    profile[current_segment] = {}
+                    # The segment header is underlined.
+                    i += 1
+                i += 1
+            else:
+                i = format_profile_line(messages, kinds, profile[current_segment], i)
                 i += 1
-                continue
-            if i < len(messages) - 1 and messages[i] in additional_segment_keys:
-                current_segment = messages[i].split()[0].lower()
-                profile[current_segment] = {}
-                i += 2
-            if self.__profile_type in ("dataSet", "resource"):
-                i = self.__format_data_set_generic_profile_data(
-                    messages, profile, current_segment, i
-                )
-            if self.__profile_type == "user":
-                i = self.__format_user_profile_data(
-                    messages, profile, current_segment, i
-                )
-            if self.__profile_type == "group":
-                i = self.__format_group_profile_data(
-                    messages, profile, current_segment, i
-                )
-            i += 1
         return profile
 
-    def __format_data_set_generic_profile_data(
-        self, messages: List[str], profile: dict, current_segment: str, i: int
+    def __format_data_set_generic_profile_line(
+        self, messages: List[str], kinds: List[str], segment: dict, i: int
     ) -> int:
         """Specialized logic for formatting DataSet/General Resource profile data."""
-        list_fields = ["volumes"]
-        messages[i] = (
-            messages[i]
-            .replace("DATASET", "DATA SET")
-            .replace("VOLUMES ON WHICH DATA SET RESIDES", "VOLUMES")
+        kind = kinds[i]
+        message = self.__data_set_field_pattern.sub(
+            self.__replace_data_set_field, messages[i]
         )
-        if "=" in messages[i]:
-            self.__add_key_value_pair_to_profile(
-                messages[i],
-                profile,
-                current_segment,
-            )
-        elif (
-            i < len(messages) - 2
-            and ("  " in messages[i])
-            and ("--" in messages[i + 1])
-        ):
-            self.__format_semi_tabular_data(messages, profile, current_segment, i)
-            i += 2
-        elif (
-            i < len(messages) - 2
-            and messages[i + 1] is not None
-            and ("-" in messages[i + 1])
-        ):
-            field = " ".join(
-                [
-                    txt.lower().strip()
-                    for txt in list(filter(None, messages[i].split(" ")))
-                ]
-            )
-            field = self._profile_field_to_camel_case(field)
+        if kind == "pair":
+            self.__add_key_value_pair_to_segment(segment, message)
+        elif i < len(messages) - 2 and kinds[i + 1] == "rule":
+            if kind == "heading":
+                self.__format_semi_tabular_data(
+                    segment, message, messages[i + 1], messages[i + 2]
+                )
+                return i + 2
+            field = self._profile_field_to_camel_case(message.lower())
             value = messages[i + 2]
             if "(" in value:
                 value_tokens = value.split("(")
                 subfield = self._profile_field_to_camel_case(value_tokens[0].lower())
-                profile[current_segment][field] = {
+                segment[field] = {
                     subfield: self._clean_and_separate(value_tokens[-1].rstrip(")"))
                 }
-            elif field in list_fields:
-                profile[current_segment][field] = []
-                profile[current_segment][field].append(self._clean_and_separate(value))
+            elif field in self.__data_set_list_fields:
+                segment[field] = [self._clean_and_separate(value)]
             else:
-                profile[current_segment][field] = self._clean_and_separate(value)
-            i += 1
-        elif "NO INSTALLATION DATA" in messages[i]:
-            profile[current_segment]["installationData"] = None
-        if "INFORMATION FOR DATA SET" in messages[i]:
-            profile[current_segment]["name"] = (
-                messages[i].split("INFORMATION FOR DATA SET ")[1].lower()
-            )
+                segment[field] = self._clean_and_separate(value)
+            return i + 1
+        elif kind == "no_installation_data":
+            segment["installationData"] = None
+        elif kind == "name":
+            segment["name"] = message.split("INFORMATION FOR DATA SET ")[1].lower()
         return i
 
-    def __format_user_profile_data(
-        self, messages: List[str], profile: dict, current_segment: str, i: int
+    def __replace_data_set_field(self, match: re.Match) -> str:
+        """Spell data set profile field names the same way in every line."""
+        if match.lastgroup == "volumes":
+            return "VOLUMES"
+        return "DATA SET"
+
+    def __format_user_profile_line(
+        self, messages: List[str], kinds: List[str], segment: dict, i: int
     ) -> int:
         """Specialized logic for formatting user profile data."""
-        if messages[i][:1] == " ":
-            messages[i] = (
-                messages[i]
-                .replace("PASSDATE=", "PASSWORD-DATE=")
-                .replace("PASS-INTERVAL=", "PASSWORD-INTERVAL=")
-                .replace("PHRASEDATE=", "PASSPHRASE-DATE=")
-            )
-        if (
-            i < len(messages) - 1
-            and messages[i + 1] == " ---------------------------------------------"
-        ):
-            semi_tabular_data = messages[i : i + 3]
+        kind = kinds[i]
+        message = messages[i]
+        if message[:1] == " ":
+            message = self.__user_field_pattern.sub(self.__replace_user_field, message)
+        if i < len(messages) - 1 and kinds[i + 1] == "rule":
             self.__add_semi_tabular_data_to_segment(
-                profile[current_segment], semi_tabular_data
+                segment, [message] + messages[i + 1 : i + 3]
             )
-            i += 2
-        elif messages[i][:8] == "  GROUP=":
-            if "groups" not in profile[current_segment]:
-                profile[current_segment]["groups"] = {}
-            group = messages[i].split("=")[1].split()[0]
-            profile[current_segment]["groups"][group] = {}
-            message = messages[i] + messages[i + 1] + messages[i + 2] + messages[i + 3]
+            return i + 2
+        if kind == "connect":
+            if "groups" not in segment:
+                segment["groups"] = {}
+            group = message.split("=")[1].split()[0]
+            segment["groups"][group] = {}
+            message = message + messages[i + 1] + messages[i + 2] + messages[i + 3]
             self.__add_key_value_pairs_to_segment(
-                profile[current_segment]["groups"][group], message[17:]
+                segment["groups"][group], message[17:]
             )
-            i += 3
-        elif "=" not in messages[i] and messages[i].strip()[:3] != "NO-":
-            messages[i] = f"{messages[i]}={messages[i+1]}"
-            self.__add_key_value_pairs_to_segment(profile[current_segment], messages[i])
-            i += 1
-        else:
-            self.__add_key_value_pairs_to_segment(profile[current_segment], messages[i])
-        return i
+            return i + 3
+        if kind == "pairs":
+            self.__add_key_value_pairs_to_segment(segment, message)
+            return i
+        # A field whose value is on the next line.
+        self.__add_key_value_pairs_to_segment(segment, f"{message}={messages[i+1]}")
+        return i + 1
+
+    def __replace_user_field(self, match: re.Match) -> str:
+        """Spell user profile field names the same way in every line."""
+        return self.__user_field_replacements[match[0]]
 
-    def __format_group_profile_data(
-        self, messages: List[str], profile: dict, current_segment: str, i: int
+    def __format_group_profile_line(
+        self, messages: List[str], kinds: List[str], segment: dict, i: int
     ) -> int:
-        """Specialized logic for formatting user profile data."""
-        list_fields = ["users", "subgroups"]
-        if "users" in profile[current_segment].keys() and i < len(messages) - 2:
-            self.__format_user_list_data(messages, profile, current_segment, i)
-            i += 2
-        elif (
-            "USER(S)=      ACCESS=      ACCESS COUNT=      UNIVERSAL ACCESS="
-            in messages[i]
-        ):
-            profile[current_segment]["users"] = []
-        elif "=" in messages[i]:
-            self.__add_key_value_pairs_to_segment(profile[current_segment], messages[i])
-        elif "NO " in messages[i]:
+        """Specialized logic for formatting group profile data."""
+        if "users" in segment and i < len(messages) - 2:
+            # Every line after the user list heading starts another user.
+            self.__format_user_list_data(messages, segment, i)
+            return i + 2
+        kind = kinds[i]
+        message = messages[i]
+        if kind == "users":
+            segment["users"] = []
+        elif kind == "pairs":
+            self.__add_key_value_pairs_to_segment(segment, message)
+        elif kind == "no":
             field_name = self._profile_field_to_camel_case(
-                messages[i].split("NO ")[1].strip().lower()
+                message.split("NO ")[1].strip().lower()
             )
-            if field_name in list_fields:
-                profile[current_segment][field_name] = []
-            else:
-                profile[current_segment][field_name] = None
-        elif "TERMUACC" in messages[i]:
-            if "NO" in messages[i]:
-                profile[current_segment]["terminalUniversalAccess"] = False
+            if field_name in self.__group_list_fields:
+                segment[field_name] = []
             else:
-                profile[current_segment]["terminalUniversalAccess"] = True
-        elif "INFORMATION FOR GROUP" in messages[i]:
-            profile[current_segment]["name"] = (
-                messages[i].split("INFORMATION FOR GROUP ")[1].lower()
-            )
+                segment[field_name] = None
+        elif kind == "termuacc":
+            segment["terminalUniversalAccess"] = "NO" not in message
+        elif kind == "name":
+            segment["name"] = message.split("INFORMATION FOR GROUP ")[1].lower()
         return i
 
     def __format_user_list_data(
-        self, messages: list, profile: dict, current_segment: str, i: int
+        self, messages: List[str], segment: dict, i: int
     ) -> None:
-        profile[current_segment]["users"].append({})
-        user_index = len(profile[current_segment]["users"]) - 1
-        user_fields = [
-            field.strip() for field in messages[i].split(" ") if field.strip()
-        ]
+        segment["users"].append({})
+        user = segment["users"][-1]
+        user_fields = messages[i].split()
 
-        profile[current_segment]["users"][user_index]["userid"] = self._cast_from_str(
-            user_fields[0]
-        )
-        profile[current_segment]["users"][user_index]["access"] = self._cast_from_str(
-            user_fields[1]
-        )
-        profile[current_segment]["users"][user_index][
-            "accessCount"
-        ] = self._cast_from_str(user_fields[2])
-        profile[current_segment]["users"][user_index][
-            "universalAccess"
-        ] = self._cast_from_str(user_fields[3])
-
-        self.__add_key_value_pairs_to_segment(
-            profile[current_segment]["users"][user_index], messages[i + 1]
-        )
+        (
+            user["userid"],
+            user["access"],
+            user["accessCount"],
+            user["universalAccess"],
+        ) = self._cast_many_from_str(user_fields[:4])
 
-        self.__add_key_value_pairs_to_segment(
-            profile[current_segment]["users"][user_index], messages[i + 2]
-        )
+        self.__add_key_value_pairs_to_segment(user, messages[i + 1])
+
+        self.__add_key_value_pairs_to_segment(user, messages[i + 2])
 
-    def __build_additional_segment_keys(self) -> Tuple[str, str]:
-        """Build keys for detecting additional segments in RACF profile data."""
-        additional_segment_keys = [
-            f"{segment.upper()} INFORMATION"
-            for segment in self._valid_segment_traits
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __build_segment_line_classifier(
+        segments: Tuple[str, ...],
+    ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Build the tables used to classify segment lines of RACF profile data.
+        Segment header lines map to the segment they start, and every segment line
+        maps to its kind, which is 'segment' for segment headers and 'skip' for blank
+        lines or lines saying that a segment has no information. The tables are only
+        built once for each set of segments, which is once per admin class.
+        """
+        segment_headers = {
+            f"{segment.upper()} INFORMATION": segment.lower()
+            for segment in segments
             if segment != "base"
-        ]
-        no_segment_information_keys = [
-            f"NO {segment}" for segment in additional_segment_keys
-        ]
-        return (additional_segment_keys, no_segment_information_keys)
+        }
+        segment_line_kinds = {
+            " ": "skip",
+            **{f"NO {segment_header}": "skip" for segment_header in segment_headers},
+            **dict.fromkeys(segment_headers, "segment"),
+        }
+        return (segment_headers, segment_line_kinds)
 
     def __add_semi_tabular_data_to_segment(
         self, segment: dict, semi_tabular_data: List[str]
@@ -543,14 +942,10 @@ class SecurityAdmin:
             segment[key] = self._cast_from_str(values[i])
 
     def __format_semi_tabular_data(
-        self,
-        messages: List[str],
-        profile: dict,
-        current_segment: str,
-        i: int,
+        self, segment: dict, heading: str, rule: str, row: str
     ) -> None:
         """Generic function for parsing semitabular data from RACF profile data."""
-        tmp_ind = [j for j in range(len(messages[i + 1])) if messages[i + 1][j] == "-"]
+        tmp_ind = [j for j in range(len(rule)) if rule[j] == "-"]
         indexes = [
             tmp_ind[j]
             for j in range(len(tmp_ind))
@@ -562,15 +957,13 @@ class SecurityAdmin:
                 ind_e0 = indexes[j + 1] - 1
                 ind_e1 = indexes[j + 1] - 1
             else:
-                ind_e0 = len(messages[i])
-                ind_e1 = len(messages[i + 2])
+                ind_e0 = len(heading)
+                ind_e1 = len(row)
 
             field = self._profile_field_to_camel_case(
-                messages[i][indexes[j] : ind_e0].strip().lower()
-            )
-            profile[current_segment][field] = self._clean_and_separate(
-                messages[i + 2][indexes[j] : ind_e1]
+                heading[indexes[j] : ind_e0].strip().lower()
             )
+            segment[field] = self._clean_and_separate(row[indexes[j] : ind_e1])
 
     def __add_key_value_pairs_to_segment(
         self,
@@ -578,7 +971,6 @@ class SecurityAdmin:
         message: str,
     ) -> None:
         """Add a key value pair to a segment dictionary."""
-        list_fields = ["attributes", "classAuthorizations", "connectAttributes"]
         tokens = message.strip().split("=")
         key = tokens[0]
         for i in range(1, len(tokens)):
@@ -588,14 +980,12 @@ class SecurityAdmin:
                 key = key[3:]
                 value = "N/A"
             current_key = self._profile_field_to_camel_case(key.lower())
-            if current_key in list_fields:
+            if current_key in self.__key_value_list_fields:
                 if current_key not in segment:
                     segment[current_key] = []
-                values = [
-                    self._cast_from_str(value)
-                    for value in value.split()
-                    if value != "NONE"
-                ]
+                values = self._cast_many_from_str(
+                    [value for value in value.split() if value != "NONE"]
+                )
                 segment[current_key] += values
             else:
                 segment[current_key] = self._cast_from_str(value)
@@ -608,22 +998,19 @@ class SecurityAdmin:
                 else:
                     key = sub_tokens[0]
 
-    def __add_key_value_pair_to_profile(
-        self, message: str, profile: dict, current_segment: str
-    ) -> None:
+    def __add_key_value_pair_to_segment(self, segment: dict, message: str) -> None:
         """Generic function for extracting key-value pair from RACF profile data."""
-        field = self._profile_field_to_camel_case(message.split("=")[0].strip().lower())
-        profile[current_segment][field] = self._clean_and_separate(
-            message.split("=")[1]
-        )
+        (key, _, value) = message.partition("=")
+        field = self._profile_field_to_camel_case(key.strip().lower())
+        segment[field] = self._clean_and_separate(value.split("=")[0])
 
     def _clean_and_separate(self, value: str) -> Union[list, str]:
         """Clean cast and separate comma and space delimited data."""
         cln_val = value.strip().lower()
         if "," in cln_val:
-            out = [self._cast_from_str(val.strip()) for val in cln_val.split(",")]
+            out = self._cast_many_from_str([val.strip() for val in cln_val.split(",")])
         elif " " in cln_val:
-            out = [self._cast_from_str(val.strip()) for val in cln_val.split(" ")]
+            out = self._cast_many_from_str([val.strip() for val in cln_val.split(" ")])
         else:
             out = self._cast_from_str(cln_val)
         if isinstance(out, list):
@@ -651,58 +1038,51 @@ class SecurityAdmin:
 
     def _cast_from_str(self, value: str) -> Union[None, bool, int, float, str]:
         """Cast null values floats and integers."""
+        return SecurityAdmin.__cast(value)
+
+    def _cast_many_from_str(
+        self, values: List[str]
+    ) -> List[Union[None, bool, int, float, str]]:
+        """Cast a whole list of raw profile values at once."""
+        cast = SecurityAdmin.__cast
+        return [cast(value) for value in values]
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def __cast(value: str) -> Union[None, bool, int, float, str]:
+        """
+        Cast a raw profile value.
+        The same few values (i.e., 'n/a', 'none' or 'read') make up most of every
+        profile, so casts are memoized. Cast values are immutable, so they can be shared.
+        """
         value = value.lower()
-        if value in ("n/a", "none", "none specified", "no", "None"):
-            return None
-        if value in (
-            "in effect",
-            "active",
-            "active.",
-            "being done.",
-            "in effect.",
-            "allowed.",
-            "being done",
-            "true",
-        ):
-            return True
-        if value in (
-            "not in effect",
-            "inactive",
-            "not allowed.",
-            "not being done",
-            "false",
-        ):
-            return False
+        constant = SecurityAdmin.__cast_constants.get(
+            value, SecurityAdmin.__no_constant
+        )
+        if constant is not SecurityAdmin.__no_constant:
+            return constant
         if "days" in value and any(chr.isdigit() for chr in value):
             digits = "".join([chr for chr in value if chr.isdigit()])
             return int(digits)
         if "in effect for the " in value and " function." in value:
             return value.split("in effect for the ")[1].split(" function.")[0]
-        return self.__cast_num(value)
+        return SecurityAdmin.__cast_num(value)
 
-    def __cast_num(self, value: str) -> Union[int, float, str]:
+    @staticmethod
+    def __cast_num(value: str) -> Union[int, float, str]:
         value = value.strip()
+        number_or_date = SecurityAdmin.__cast_num_pattern.fullmatch(value)
+        if number_or_date is not None:
+            match number_or_date.lastgroup:
+                case "integer":
+                    return int(value)
+                case "decimal":
+                    return float(value)
+                case "julian_date":
+                    # Convert Julian timestamps to standard date format.
+                    return JulianDateDecoder.decode(value)
+        # Less common number formats (i.e., '1,000' or '1.5e3').
         if "." in value:
-            try:
-                # Convert Julian timestamps to standard date format.
-                t = "-"
-                if platform.system() == "Windows":
-                    # Allows unit tests to be run on Windows.
-                    t = "#"
-                julian_regex = r"\d\d.\d\d\d$"
-                julian_with_time_regex = r"\d\d.\d\d\d/\d\d:\d\d:\d\d$"
-                if re.match(julian_regex, value):
-                    read_julian_date = "%y.%j"
-                    build_standard_date = f"%{t}m/%{t}d/%Y"
-                    date = datetime.strptime(value, read_julian_date)
-                    return date.strftime(build_standard_date)
-                elif re.match(julian_with_time_regex, value):
-                    read_julian_date_with_time = "%y.%j/%H:%M:%S"
-                    build_standard_date_with_time = f"%{t}m/%{t}d/%Y %{t}I:%M %p"
-                    date = datetime.strptime(value, read_julian_date_with_time)
-                    return date.strftime(build_standard_date_with_time)
-            except ValueError:
-                return None
             try:
                 return float(value)
             except ValueError:
@@ -714,6 +1094,12 @@ class SecurityAdmin:
 
     def _profile_field_to_camel_case(self, field: str) -> str:
         """Convert a space delimited profile field to camel case."""
+        return SecurityAdmin.__field_to_camel_case(field)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def __field_to_camel_case(field: str) -> str:
+        """The same few fields appear in every profile, so conversions are cached."""
         field_tokens = field.replace("-", " ").replace(",", "").split()
         return field_tokens[0] + "".join(
             [field_token.title() for field_token in field_tokens[1:]]
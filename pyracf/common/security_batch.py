@@ -0,0 +1,178 @@
+"""Batch multiple security definitions into a single IRRSMO00 request."""
+
+from contextvars import ContextVar
+from typing import List, Tuple, Union
+
+from .security_request import SecurityRequest
+from .security_request_error import SecurityRequestError
+from .security_result import SecurityResult, _to_pascal_case
+
+_active_security_batch = ContextVar("_active_security_batch", default=None)
+
+
+class SecurityBatch:
+    """
+    Batch multiple security definitions into a single IRRSMO00 request.
+
+    While a batch is active (inside a 'with' block), requests made through any
+    admin object are queued instead of being sent to IRRSMO00. 'submit()' then sends
+    all queued definitions in as few IRRSMO00 calls as possible and returns a steps
+    dictionary containing one result dictionary per queued definition.
+
+        batch = SecurityBatch()
+        with batch:
+            user_admin.add("squidwrd", traits={"base:name": "Squidward"})
+            group_admin.add("testgrp0")
+            connection_admin.add("squidwrd", "testgrp0")
+        result = batch.submit()
+
+    Note: When IRRSMO00 rejects a whole request (i.e., because the request XML is
+    malformed), it doesn't return a result for each definition, so every definition
+    without a result gets an error and the return code and reason code of the request.
+
+    Note: Definitions that require an IRRSMO00 precheck (i.e., alter requests)
+    cannot be sent in the same IRRSMO00 call as definitions that do not, so
+    consecutive definitions with the same precheck setting are grouped together
+    to preserve the order in which the requests were queued.
+    """
+
+    def __init__(self) -> None:
+        self.__queued_requests = []
+        self.__context_tokens = []
+
+    def __enter__(self) -> "SecurityBatch":
+        self.__context_tokens.append(_active_security_batch.set(self))
+        return self
+
+    def __exit__(self, *_) -> None:
+        _active_security_batch.reset(self.__context_tokens.pop())
+
+    def __len__(self) -> int:
+        return len(self.__queued_requests)
+
+    @staticmethod
+    def _get_active_batch() -> Union["SecurityBatch", None]:
+        """Get the batch that requests are currently being queued in, if any."""
+        return _active_security_batch.get()
+
+    def _queue_request(
+        self,
+        security_admin,
+        security_request: SecurityRequest,
+        irrsmo00_precheck: bool,
+        extract: bool,
+    ) -> None:
+        """Queue a request built by an admin object."""
+        self.__queued_requests.append(
+            (security_admin, security_request, irrsmo00_precheck, extract)
+        )
+
+    def submit(self) -> dict:
+        """
+        Send all queued definitions to IRRSMO00.
+        Raises a SecurityRequestError if any of the definitions failed.
+        """
+        queued_requests = self.__queued_requests
+        self.__queued_requests = []
+        results = []
+        for irrsmo00_precheck, queued_run in self.__group_by_precheck(queued_requests):
+            results += self.__make_request(queued_run, irrsmo00_precheck)
+        steps_dictionary = {}
+        failed = False
+        for step, result_dictionary in enumerate(results):
+            steps_dictionary[f"step{step+1}"] = result_dictionary
+            if result_dictionary["securityResult"]["returnCode"] != 0:
+                failed = True
+        if failed:
+            raise SecurityRequestError(steps_dictionary)
+        return steps_dictionary
+
+    def __group_by_precheck(
+        self, queued_requests: List[tuple]
+    ) -> List[Tuple[bool, List[tuple]]]:
+        """Group consecutive queued requests that have the same precheck setting."""
+        queued_runs = []
+        for (
+            security_admin,
+            security_request,
+            irrsmo00_precheck,
+            extract,
+        ) in queued_requests:
+            if not queued_runs or queued_runs[-1][0] != irrsmo00_precheck:
+                queued_runs.append((irrsmo00_precheck, []))
+            queued_runs[-1][1].append((security_admin, security_request, extract))
+        return queued_runs
+
+    def __make_request(
+        self, queued_run: List[tuple], irrsmo00_precheck: bool
+    ) -> List[dict]:
+        """Send a group of definitions to IRRSMO00 and split up the results."""
+        batch_request = SecurityRequest()
+        for _, security_request, _ in queued_run:
+            batch_request._add_security_definition(security_request)
+        security_admins = []
+        for security_admin, _, _ in queued_run:
+            if security_admin not in security_admins:
+                security_admins.append(security_admin)
+        # Result XML is only decoded for logging when debug logging is enabled
+        # for the admin object that sends the request.
+        calling_admin = next(
+            (
+                security_admin
+                for security_admin in security_admins
+                if security_admin._is_debug_enabled()
+            ),
+            security_admins[0],
+        )
+        result_xml = calling_admin._call_racf(batch_request, irrsmo00_precheck)
+        for security_admin, security_request, extract in queued_run:
+            if not extract:
+                security_admin._invalidate_cached_profile(security_request)
+        for security_admin in security_admins:
+            result_xml = security_admin._redact_result_xml(result_xml)
+        for security_admin in security_admins:
+            security_admin._log_result_xml(result_xml)
+        security_result = SecurityResult(result_xml)
+        results = security_result.get_definition_result_dictionaries()
+        if len(results) < len(queued_run):
+            # IRRSMO00 doesn't return a result for every definition when the whole
+            # request fails (i.e., when the request XML is rejected).
+            results += [
+                self.__get_missing_result_dictionary(
+                    security_request, security_result.get_result_dictionary()
+                )
+                for _, security_request, _ in queued_run[len(results) :]
+            ]
+        for (security_admin, _, extract), result_dictionary in zip(queued_run, results):
+            security_admin._log_result_dictionary(result_dictionary)
+            if extract and result_dictionary["securityResult"]["returnCode"] == 0:
+                security_admin._format_profile(result_dictionary)
+        return results
+
+    def __get_missing_result_dictionary(
+        self, security_request: SecurityRequest, result_dictionary: dict
+    ) -> dict:
+        """
+        Build a result dictionary for a definition that IRRSMO00 returned no result for
+        using the return code and reason code of the whole request.
+        """
+        definition = security_request._security_definition
+        return {
+            "securityResult": {
+                _to_pascal_case(definition.tag): {
+                    **{
+                        attribute: value
+                        for attribute, value in definition.attrib.items()
+                        if attribute != "requestid"
+                    },
+                    "requestId": definition.attrib.get("requestid"),
+                    "error": {
+                        "errorMessage": (
+                            "IRRSMO00 did not return a result for this definition."
+                        )
+                    },
+                },
+                "returnCode": result_dictionary["securityResult"]["returnCode"],
+                "reasonCode": result_dictionary["securityResult"]["reasonCode"],
+            }
+        }
@@ -2,7 +2,7 @@
 
 import platform
 import xml.etree.ElementTree as XMLBuilder
-from typing import Union
+from typing import List, Union
 
 
 class SecurityRequest:
@@ -17,6 +17,11 @@ class SecurityRequest:
         self._security_definition = XMLBuilder.SubElement(
             self.__racf_request, "undefined"
         )
+        # Segment traits and trait map used to build this request.
+        self._segment_traits = {}
+        self._trait_map = {}
+        # Whether this request alters an existing profile instead of creating one.
+        self._alter = False
 
     def _get_volume_and_generic_security_definition_values(
         self, volume: Union[str, None], generic: bool
@@ -38,6 +43,7 @@ class SecurityRequest:
         extract: bool = False,
     ) -> None:
         """Build XML representation of segments."""
+        self._alter = alter
         for segment, segment_traits in segment_traits_dictionary.items():
             self._build_segment(
                 segment,
@@ -85,6 +91,43 @@ class SecurityRequest:
         if len(list(segment.iter())) == 1 and not extract:
             self._security_definition.remove(segment)
 
+    def _get_profile_key(self) -> tuple:
+        """Get a key that identifies the profile that this request is for."""
+        attributes = self._security_definition.attrib
+        return (self._security_definition.tag,) + tuple(
+            attributes.get(attribute, "").upper()
+            for attribute in ["name", "class", "group", "volume", "generic"]
+        )
+
+    def _get_affected_profile_keys(self) -> List[tuple]:
+        """
+        Get keys for every profile that this request changes.
+        A key may be shortened to a prefix of a profile key (i.e., '("group",)'),
+        in which case it stands for every profile key that starts with it.
+        """
+        return [self._get_profile_key()]
+
+    def _get_trait_value(self, segment: str, trait: str) -> Union[str, None]:
+        """Get the value that this request sets a trait to, if any."""
+        trait_value = self._segment_traits.get(segment, {}).get(trait)
+        if trait_value is None or not isinstance(trait_value["value"], str):
+            return None
+        return trait_value["value"]
+
+    def _is_read_only(self) -> bool:
+        """Check if every security definition in this request only extracts data."""
+        return all(
+            security_definition.get("operation") == "listdata"
+            for security_definition in self.__racf_request
+        )
+
+    def _add_security_definition(self, security_request: "SecurityRequest") -> None:
+        """Add the security definition of another request to this request."""
+        if self._security_definition.tag == "undefined":
+            self.__racf_request.remove(self._security_definition)
+        self._security_definition = security_request._security_definition
+        self.__racf_request.append(self._security_definition)
+
     def dump_request_xml(self, encoding: str = "cp1047") -> bytes:
         """Dump XML as EBCDIC encoded bytes. (Encoding can be overridden)."""
         if platform.system() != "OS/390" and encoding == "cp1047":
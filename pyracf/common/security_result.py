@@ -1,5 +1,8 @@
 """Generic Security Result Parser."""
 
+import codecs
+from functools import lru_cache
+from typing import List, Tuple, Union
 from xml.etree.ElementTree import Element  # Only used for type hints.
 
 import defusedxml.ElementTree as XMLParser
@@ -8,23 +11,81 @@ import defusedxml.ElementTree as XMLParser
 class SecurityResult:
     """Generic Security Result Parser."""
 
-    def __init__(self, result_xml: str) -> None:
-        self.__result = XMLParser.fromstring(result_xml)
+    # Size of each block of undecoded result XML that is fed to the XML parser.
+    __block_size = 65536
+
+    def __init__(
+        self, result_xml: Union[str, bytes, memoryview], encoding: str = "cp1047"
+    ) -> None:
+        if isinstance(result_xml, str):
+            self.__result = XMLParser.fromstring(result_xml)
+        else:
+            self.__result = self.__parse_result_bytes(result_xml, encoding)
         self.__result_dictionary = {"securityResult": {}}
+        self.__definitions = []
         self.__extract_results()
 
+    def __parse_result_bytes(
+        self, result_xml: Union[bytes, memoryview], encoding: str
+    ) -> Element:
+        """
+        Parse undecoded result XML without first decoding the whole result into a str.
+        Expat only understands ASCII compatible encodings, so EBCDIC result XML is
+        translated to Latin-1 one block at a time as it is fed to the parser.
+        """
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            # If not running on z/OS, EBCDIC is most likely not supported.
+            encoding = "utf-8"
+        result_view = memoryview(result_xml).cast("B")
+        if "<".encode(encoding) == b"<":
+            parser = XMLParser.DefusedXMLParser(encoding=encoding)
+            parser.feed(result_view)
+            return parser.close()
+        translation_table = _get_latin_1_translation_table(encoding)
+        if translation_table is None:
+            return XMLParser.fromstring(str(result_view, encoding))
+        parser = XMLParser.DefusedXMLParser(encoding="iso-8859-1")
+        for i in range(0, len(result_view), self.__block_size):
+            block = result_view[i : i + self.__block_size]
+            parser.feed(block.tobytes().translate(translation_table))
+        return parser.close()
+
     def __extract_results(self) -> None:
         """Extract XML results into a dictionary."""
-        self.definition = self.__result[0]
+        for element in self.__result:
+            element_tag = element.tag.split("}")[-1]
+            if element_tag == "returncode":
+                self.__result_dictionary["securityResult"]["returnCode"] = int(
+                    element.text
+                )
+            elif element_tag == "reasoncode":
+                self.__result_dictionary["securityResult"]["reasonCode"] = int(
+                    element.text
+                )
+            else:
+                self.__extract_definition(element)
+
+    def __extract_definition(self, definition: Element) -> None:
+        """Extract a single security definition into a dictionary."""
+        self.definition = definition
         self.definition.attrib["requestId"] = self.definition.attrib["requestid"]
         del self.definition.attrib["requestid"]
-        definition_tag = self.__to_pascal_case(self.definition.tag.split("}")[-1])
-        self.__result_dictionary["securityResult"][
-            definition_tag
-        ] = self.definition.attrib
-        self.definition_dictionary = self.__result_dictionary["securityResult"][
-            definition_tag
-        ]
+        definition_tag = _to_pascal_case(self.definition.tag.split("}")[-1])
+        self.definition_dictionary = self.definition.attrib
+        self.__definitions.append((definition_tag, self.definition_dictionary))
+        security_result = self.__result_dictionary["securityResult"]
+        if definition_tag not in security_result:
+            security_result[definition_tag] = self.definition_dictionary
+        elif isinstance(security_result[definition_tag], list):
+            security_result[definition_tag].append(self.definition_dictionary)
+        else:
+            # Multiple definitions of the same type are returned as a list.
+            security_result[definition_tag] = [
+                security_result[definition_tag],
+                self.definition_dictionary,
+            ]
         try:
             if self.definition[0].tag.split("}")[-1] == "info":
                 self.__extract_info()
@@ -36,10 +97,6 @@ class SecurityResult:
             # Index Error indicates that there is no
             # additional information to extract from the definition.
             pass
-        return_code = self.__result[1]
-        self.__result_dictionary["securityResult"]["returnCode"] = int(return_code.text)
-        reason_code = self.__result[2]
-        self.__result_dictionary["securityResult"]["reasonCode"] = int(reason_code.text)
 
     def __extract_info(self) -> None:
         """Extract info section from XML into a list."""
@@ -63,7 +120,7 @@ class SecurityResult:
         command_dictionary = {}
         commands.append(command_dictionary)
         for item in command:
-            item_tag = self.__to_pascal_case(item.tag.split("}")[-1])
+            item_tag = _to_pascal_case(item.tag.split("}")[-1])
             if item_tag == "message":
                 if "messages" not in command_dictionary:
                     command_dictionary["messages"] = []
@@ -79,42 +136,98 @@ class SecurityResult:
         self.definition_dictionary["error"] = {}
         error = self.definition[0]
         for item in error:
-            item_tag = self.__to_pascal_case(item.tag.split("}")[-1])
+            item_tag = _to_pascal_case(item.tag.split("}")[-1])
             try:
                 self.definition_dictionary["error"][item_tag] = int(item.text)
             except ValueError:
                 self.definition_dictionary["error"][item_tag] = item.text
 
-    def __to_pascal_case(self, key: str) -> str:
-        """Convert result dictionary keys to pascal case."""
-        match (key):
-            case "returncode":
-                return "returnCode"
-            case "reasoncode":
-                return "reasonCode"
-            case "safreturncode":
-                return "safReturnCode"
-            case "errorfunction":
-                return "errorFunction"
-            case "errorcode":
-                return "errorCode"
-            case "errorreason":
-                return "errorReason"
-            case "errormessage":
-                return "errorMessage"
-            case "erroroffset":
-                return "errorOffset"
-            case "textinerror":
-                return "textInError"
-            case "groupconnection":
-                return "groupConnection"
-            case "dataset":
-                return "dataSet"
-            case "systemsettings":
-                return "systemSettings"
-            case _:
-                return key
-
     def get_result_dictionary(self) -> dict:
         """Return result dictionary."""
         return self.__result_dictionary
+
+    def get_definition_result_dictionaries(self) -> List[dict]:
+        """
+        Return one result dictionary per security definition.
+        When there is more than one definition, the return code of each result
+        dictionary is derived from the commands and errors of that definition since
+        IRRSMO00 only returns a single return code and reason code for the entire request.
+        """
+        return_code = self.__result_dictionary["securityResult"]["returnCode"]
+        reason_code = self.__result_dictionary["securityResult"]["reasonCode"]
+        definition_result_dictionaries = []
+        for definition_tag, definition_dictionary in self.__definitions:
+            if len(self.__definitions) > 1:
+                (return_code, reason_code) = self.__get_definition_return_codes(
+                    definition_dictionary
+                )
+            definition_result_dictionaries.append(
+                {
+                    "securityResult": {
+                        definition_tag: definition_dictionary,
+                        "returnCode": return_code,
+                        "reasonCode": reason_code,
+                    }
+                }
+            )
+        return definition_result_dictionaries
+
+    def __get_definition_return_codes(
+        self, definition_dictionary: dict
+    ) -> Tuple[int, int]:
+        """Derive the return code and reason code of a single security definition."""
+        if "error" in definition_dictionary:
+            return (
+                self.__result_dictionary["securityResult"]["returnCode"],
+                self.__result_dictionary["securityResult"]["reasonCode"],
+            )
+        for command in definition_dictionary.get("commands", []):
+            if (
+                command.get("safReturnCode", 0) != 0
+                or command.get("returnCode", 0) != 0
+            ):
+                return (4, 0)
+        return (0, 0)
+
+
+@lru_cache(maxsize=None)
+def _get_latin_1_translation_table(encoding: str) -> Union[bytes, None]:
+    """
+    Build a table that translates a single byte encoding (i.e., cp1047) to Latin-1.
+    Returns None if the encoding does not map every byte to a Latin-1 character.
+    """
+    try:
+        return bytes(range(256)).decode(encoding).encode("latin-1")
+    except (UnicodeDecodeError, UnicodeEncodeError):
+        return None
+
+
+def _to_pascal_case(key: str) -> str:
+    """Convert result dictionary keys to pascal case."""
+    match (key):
+        case "returncode":
+            return "returnCode"
+        case "reasoncode":
+            return "reasonCode"
+        case "safreturncode":
+            return "safReturnCode"
+        case "errorfunction":
+            return "errorFunction"
+        case "errorcode":
+            return "errorCode"
+        case "errorreason":
+            return "errorReason"
+        case "errormessage":
+            return "errorMessage"
+        case "erroroffset":
+            return "errorOffset"
+        case "textinerror":
+            return "textInError"
+        case "groupconnection":
+            return "groupConnection"
+        case "dataset":
+            return "dataSet"
+        case "systemsettings":
+            return "systemSettings"
+        case _:
+            return key
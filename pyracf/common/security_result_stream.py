@@ -0,0 +1,211 @@
+"""Streaming Security Result Parser."""
+
+import codecs
+import itertools
+from typing import Iterable, Iterator, List, Tuple, Union
+
+import defusedxml.ElementTree as XMLParser
+
+from .security_result import _get_latin_1_translation_table, _to_pascal_case
+
+
+class SecurityResultStream:
+    """
+    Streaming Security Result Parser.
+    Result XML is fed to the XML parser one block at a time and events are yielded
+    as soon as they are decoded, without building an element tree or a result
+    dictionary. Only the text of the element that is currently being parsed is
+    kept in memory, so a listdata result with tens of thousands of message lines
+    can be processed with bounded memory.
+    Result XML may also be given as an iterable of chunks (i.e., the chunks yielded
+    by 'IRRSMO00.call_racf_chunks()'), which are fed to the XML parser as they are
+    produced. Each chunk is done being parsed before the next one is requested,
+    so chunks may be memoryviews over a buffer that is reused for the next chunk.
+
+    Events are yielded as '(event, value)' tuples in document order:
+      ("definition", (definition_tag, definition_dictionary))
+      ("info", info)
+      ("error", error_dictionary)
+      ("command", command_dictionary)  # Yielded before the messages of the command.
+      ("message", message)
+      ("result", {"returnCode": return_code, "reasonCode": reason_code})
+
+    Note: Secrets are not redacted from the messages of the result XML, so it is up
+    to the caller to only stream results of requests that contain no secrets.
+    """
+
+    # Size of each block of result XML that is fed to the XML parser.
+    __block_size = 65536
+
+    class __Target:
+        """XML parser target that turns elements into result events."""
+
+        def __init__(self) -> None:
+            self.events: List[Tuple[str, object]] = []
+            self.depth = 0
+            self.text: List[str] = []
+            self.definition_child = None
+            self.fields = {}
+            self.command_started = False
+            self.result = {}
+
+        def start(self, tag: str, attrib: dict) -> None:
+            self.depth += 1
+            self.text = []
+            tag = tag.split("}")[-1]
+            if self.depth == 2 and tag not in ("returncode", "reasoncode"):
+                definition_dictionary = dict(attrib)
+                if "requestid" in definition_dictionary:
+                    definition_dictionary["requestId"] = definition_dictionary.pop(
+                        "requestid"
+                    )
+                self.events.append(
+                    ("definition", (_to_pascal_case(tag), definition_dictionary))
+                )
+            elif self.depth == 3:
+                self.definition_child = tag
+                self.fields = {}
+                self.command_started = False
+            elif (
+                self.depth == 4
+                and self.definition_child == "command"
+                and tag == "message"
+                and not self.command_started
+            ):
+                self.__start_command()
+
+        def end(self, tag: str) -> None:
+            self.depth -= 1
+            tag = tag.split("}")[-1]
+            text = "".join(self.text) or None
+            self.text = []
+            if self.depth == 1:
+                if tag in ("returncode", "reasoncode"):
+                    self.result[_to_pascal_case(tag)] = self.__to_value(text)
+            elif self.depth == 2:
+                if tag == "info":
+                    self.events.append(("info", text))
+                elif tag == "error":
+                    self.events.append(("error", self.fields))
+                elif tag == "command" and not self.command_started:
+                    self.__start_command()
+                self.definition_child = None
+            elif self.depth == 3:
+                if tag == "message":
+                    self.events.append(("message", text))
+                else:
+                    self.fields[_to_pascal_case(tag)] = self.__to_value(text)
+            elif self.depth == 0:
+                self.events.append(("result", self.result))
+
+        def data(self, data: str) -> None:
+            self.text.append(data)
+
+        def close(self) -> None:
+            return None
+
+        def __start_command(self) -> None:
+            """Yield the fields of a command that precede its messages."""
+            self.command_started = True
+            self.events.append(("command", self.fields))
+
+        def __to_value(self, text: Union[str, None]) -> Union[int, str, None]:
+            try:
+                return int(text)
+            except (TypeError, ValueError):
+                return text
+
+    def __init__(
+        self,
+        result_xml: Union[
+            str, bytes, memoryview, Iterable[Union[str, bytes, memoryview]]
+        ],
+        encoding: str = "cp1047",
+    ) -> None:
+        self.__result_xml = result_xml
+        self.__encoding = encoding
+
+    def __iter__(self) -> Iterator[Tuple[str, object]]:
+        """Parse the result XML and yield each event as soon as it is decoded."""
+        target = self.__Target()
+        (parser, blocks) = self.__get_parser_and_blocks(target)
+        for block in blocks:
+            parser.feed(block)
+            yield from target.events
+            target.events.clear()
+        parser.close()
+        yield from target.events
+        target.events.clear()
+
+    def iter_messages(self) -> Iterator[str]:
+        """Yield only the message lines of every command in the result XML."""
+        for event, value in self:
+            if event == "message":
+                yield value
+
+    def __get_parser_and_blocks(
+        self, target: "SecurityResultStream.__Target"
+    ) -> Tuple[XMLParser.DefusedXMLParser, Iterator[Union[str, bytes]]]:
+        """
+        Create an XML parser for the result XML and the blocks to feed it.
+        Expat only understands ASCII compatible encodings, so EBCDIC result XML is
+        translated to Latin-1 one block at a time as it is fed to the parser.
+        Chunks are all expected to be of the same type as the first chunk.
+        """
+        chunks = self.__iter_chunks()
+        first_chunk = next(chunks, "")
+        chunks = itertools.chain([first_chunk], chunks)
+        if isinstance(first_chunk, str):
+            return (
+                XMLParser.DefusedXMLParser(target=target),
+                self.__iter_blocks(chunks),
+            )
+        encoding = self.__encoding
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            # If not running on z/OS, EBCDIC is most likely not supported.
+            encoding = "utf-8"
+        if "<".encode(encoding) == b"<":
+            return (
+                XMLParser.DefusedXMLParser(target=target, encoding=encoding),
+                self.__iter_blocks(chunks),
+            )
+        translation_table = _get_latin_1_translation_table(encoding)
+        if translation_table is None:
+            return (
+                XMLParser.DefusedXMLParser(target=target),
+                self.__decode_blocks(chunks, encoding),
+            )
+        return (
+            XMLParser.DefusedXMLParser(target=target, encoding="iso-8859-1"),
+            (
+                block.tobytes().translate(translation_table)
+                for block in self.__iter_blocks(chunks)
+            ),
+        )
+
+    def __iter_chunks(self) -> Iterator[Union[str, bytes, memoryview]]:
+        """Get the chunks of the result XML, which may be all in one chunk."""
+        if isinstance(self.__result_xml, (str, bytes, bytearray, memoryview)):
+            return iter([self.__result_xml])
+        return iter(self.__result_xml)
+
+    def __iter_blocks(
+        self, chunks: Iterator[Union[str, bytes, memoryview]]
+    ) -> Iterator[Union[str, memoryview]]:
+        """Split each chunk of result XML into blocks to feed to the XML parser."""
+        for chunk in chunks:
+            if not isinstance(chunk, str):
+                chunk = memoryview(chunk).cast("B")
+            for i in range(0, len(chunk), self.__block_size):
+                yield chunk[i : i + self.__block_size]
+
+    def __decode_blocks(
+        self, chunks: Iterator[Union[bytes, memoryview]], encoding: str
+    ) -> Iterator[str]:
+        """Decode blocks of result XML, even if a character spans two blocks."""
+        decoder = codecs.getincrementaldecoder(encoding)()
+        for block in self.__iter_blocks(chunks):
+            yield decoder.decode(block)
+        yield decoder.decode(b"", final=True)
@@ -0,0 +1,76 @@
+"""Single-Flight Call Coalescing."""
+
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable, Union
+
+
+class SingleFlight:
+    """
+    Single-Flight Call Coalescing.
+    Concurrent calls made with the same key share one in-flight call. The first
+    caller makes the call and every caller that arrives while it is in flight waits
+    for it to finish, so a burst of identical profile extracts (i.e., 200 threads
+    checking the same group) only costs one IRRSMO00 request. Every caller gets its
+    own copy of the result, or of the exception that was raised.
+
+    Thread Safety:
+    A single-flight object may be shared by multiple threads.
+    """
+
+    class __Call:
+        """A call that is in flight."""
+
+        def __init__(self) -> None:
+            self.done = threading.Event()
+            self.waiters = 0
+            self.result = None
+            self.error: Union[BaseException, None] = None
+
+    def __init__(self) -> None:
+        self.__calls: Dict[Hashable, SingleFlight.__Call] = {}
+        self.__lock = threading.Lock()
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """Call 'function', or wait for an in-flight call with the same key."""
+        with self.__lock:
+            call = self.__calls.get(key)
+            in_flight = call is not None
+            if in_flight:
+                call.waiters += 1
+            else:
+                call = self.__Call()
+                self.__calls[key] = call
+        if in_flight:
+            return self.__wait(call)
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self.__lock:
+                if self.__calls.get(key) is call:
+                    del self.__calls[key]
+                waiters = call.waiters
+            call.done.set()
+        if waiters:
+            # Waiters copy the result after this, so the caller gets its own copy too.
+            return copy.deepcopy(call.result)
+        return call.result
+
+    def forget(self, match: Callable[[Hashable], bool]) -> None:
+        """
+        Stop sharing the in-flight calls whose keys match, so that later callers
+        make a new call instead of waiting for one that started earlier.
+        """
+        with self.__lock:
+            for key in [key for key in self.__calls if match(key)]:
+                del self.__calls[key]
+
+    def __wait(self, call: "SingleFlight.__Call") -> Any:
+        """Wait for an in-flight call and get a copy of its result."""
+        call.done.wait()
+        if call.error is not None:
+            raise copy.deepcopy(call.error)
+        return copy.deepcopy(call.result)
@@ -0,0 +1,247 @@
+"""Profile Extract Cache Shared by Processes Using SQLite."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Union
+
+from .profile_cache import ProfileCache
+
+
+class SQLiteProfileCache(ProfileCache):
+    """
+    Profile Extract Cache Shared by Processes Using SQLite.
+    Formatted profile extract results are stored as JSON in a SQLite database file,
+    so every process on the same host that uses the same database file shares the
+    same cached profiles, versions and invalidations. Entries expire 'ttl' seconds
+    after they are cached, and the least recently used entries are evicted once
+    there are more than 'max_size'. Only the versions of the 'max_size' most
+    recently invalidated profiles are kept.
+
+    Cache hits only read the database. The times that entries were last used are
+    written in batches, and always before entries are evicted.
+
+    Thread Safety:
+    Each thread of each process uses its own database connection.
+    """
+
+    # Incremented whenever the layout of the database changes.
+    __schema_version = 2
+    # Number of cache hits to remember before their last used times are written.
+    __last_used_batch_size = 64
+
+    def __init__(
+        self,
+        database_file: str,
+        ttl: float = 60.0,
+        max_size: int = 1000,
+        not_found_ttl: float = 0.0,
+    ) -> None:
+        super().__init__(ttl=ttl, max_size=max_size, not_found_ttl=not_found_ttl)
+        self.database_file = database_file
+        self.__connections = threading.local()
+        self.__create_tables()
+
+    def __len__(self) -> int:
+        connection = self.__get_connection()
+        return connection.execute("SELECT count(*) FROM profile_cache").fetchone()[0]
+
+    def get(
+        self, profile_key: tuple, segments: Union[tuple, None]
+    ) -> Union[dict, None]:
+        """Get a cached result, or 'None' if it is not cached, expired or outdated."""
+        connection = self.__get_connection()
+        profile_key = json.dumps(profile_key)
+        segments = json.dumps(segments)
+        current_time = time.time()
+        row = connection.execute(
+            "SELECT result FROM profile_cache "
+            + "WHERE profile_key = ? AND segments = ? AND expiration_time > ?",
+            (profile_key, segments, current_time),
+        ).fetchone()
+        if row is None:
+            return None
+        last_used = self.__connections.last_used
+        last_used[(profile_key, segments)] = current_time
+        if len(last_used) >= self.__last_used_batch_size:
+            with self.__transaction(connection):
+                self.__write_last_used(connection)
+        return json.loads(row[0])
+
+    def get_version(self, profile_key: tuple) -> int:
+        """Get the current version of a profile."""
+        connection = self.__get_connection()
+        return self.__get_version(connection, profile_key)
+
+    def put(
+        self,
+        profile_key: tuple,
+        segments: Union[tuple, None],
+        result: dict,
+        version: int,
+        ttl: Union[float, None] = None,
+    ) -> None:
+        """
+        Cache a result, evicting the least recently used entries if needed.
+        'version' is the version of the profile from before the result was extracted.
+        'ttl' overrides the TTL of the cache for this result.
+        """
+        connection = self.__get_connection()
+        current_time = time.time()
+        with self.__transaction(connection):
+            if self.__get_version(connection, profile_key) != version:
+                return
+            self.__write_last_used(connection)
+            connection.execute(
+                "INSERT OR REPLACE INTO profile_cache VALUES (?, ?, ?, ?, ?)",
+                (
+                    json.dumps(profile_key),
+                    json.dumps(segments),
+                    current_time + (self.ttl if ttl is None else ttl),
+                    current_time,
+                    json.dumps(result),
+                ),
+            )
+            connection.execute(
+                "DELETE FROM profile_cache WHERE rowid IN (SELECT rowid "
+                + "FROM profile_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_size,),
+            )
+
+    def invalidate(self, profile_key: tuple) -> None:
+        """
+        Remove all cached results for a profile, or for every profile whose key
+        starts with 'profile_key', and change their versions.
+        """
+        connection = self.__get_connection()
+        profile_key = json.dumps(profile_key)
+        # Matches the JSON of every longer profile key that starts with this one.
+        profile_key_prefix = profile_key[:-1] + ", "
+        with self.__transaction(connection):
+            connection.execute(
+                "UPDATE profile_cache_state SET last_version = last_version + 1"
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO profile_versions "
+                + "SELECT ?, last_version FROM profile_cache_state",
+                (profile_key,),
+            )
+            # Versions that are dropped are remembered as the 'dropped_version',
+            # which every profile without a version of its own then has.
+            connection.execute(
+                "UPDATE profile_cache_state SET dropped_version = max("
+                + "dropped_version, coalesce((SELECT max(version) FROM ("
+                + "SELECT version FROM profile_versions ORDER BY version DESC "
+                + "LIMIT -1 OFFSET ?)), 0))",
+                (self.max_size,),
+            )
+            connection.execute(
+                "DELETE FROM profile_versions WHERE version <= "
+                + "(SELECT dropped_version FROM profile_cache_state)"
+            )
+            connection.execute(
+                "DELETE FROM profile_cache WHERE profile_key = ? "
+                + "OR substr(profile_key, 1, ?) = ?",
+                (profile_key, len(profile_key_prefix), profile_key_prefix),
+            )
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        connection = self.__get_connection()
+        with self.__transaction(connection):
+            connection.execute("DELETE FROM profile_cache")
+
+    # ============================================================================
+    # Database
+    # ============================================================================
+    def __get_connection(self) -> sqlite3.Connection:
+        """
+        Get the database connection for the current thread, opening it if needed.
+        Connections are never shared with a child process after a fork.
+        """
+        connection = getattr(self.__connections, "connection", None)
+        if connection is None or self.__connections.pid != os.getpid():
+            # Transactions are started explicitly.
+            connection = sqlite3.connect(
+                self.database_file, timeout=30.0, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            self.__connections.connection = connection
+            self.__connections.pid = os.getpid()
+            # Last used times of cache hits that haven't been written yet.
+            self.__connections.last_used = {}
+        return connection
+
+    def __get_version(self, connection: sqlite3.Connection, profile_key: tuple) -> int:
+        """
+        Get the version of a profile, which is the newest version of the profile
+        key and its prefixes.
+        """
+        profile_keys = [
+            json.dumps(profile_key[:length])
+            for length in range(1, len(profile_key) + 1)
+        ]
+        return connection.execute(
+            "SELECT max(dropped_version, coalesce((SELECT max(version) "
+            + "FROM profile_versions WHERE profile_key IN "
+            + f"({', '.join('?' for _ in profile_keys)})), 0)) "
+            + "FROM profile_cache_state",
+            profile_keys,
+        ).fetchone()[0]
+
+    def __write_last_used(self, connection: sqlite3.Connection) -> None:
+        """Write the last used times of cache hits. Must be run in a transaction."""
+        last_used = self.__connections.last_used
+        connection.executemany(
+            "UPDATE profile_cache SET last_used = max(last_used, ?) "
+            + "WHERE profile_key = ? AND segments = ?",
+            [
+                (current_time, profile_key, segments)
+                for (profile_key, segments), current_time in last_used.items()
+            ],
+        )
+        last_used.clear()
+
+    @contextmanager
+    def __transaction(self, connection: sqlite3.Connection) -> Iterator[None]:
+        """Run a block of statements in a transaction that holds the write lock."""
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def __create_tables(self) -> None:
+        """Create the cache tables, replacing tables that use an older layout."""
+        connection = self.__get_connection()
+        with self.__transaction(connection):
+            schema_version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if schema_version != self.__schema_version:
+                connection.execute("DROP TABLE IF EXISTS profile_cache")
+                connection.execute("DROP TABLE IF EXISTS profile_versions")
+                connection.execute("DROP TABLE IF EXISTS profile_cache_state")
+                connection.execute(f"PRAGMA user_version = {self.__schema_version}")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS profile_cache_state ("
+                + "last_version INTEGER NOT NULL, dropped_version INTEGER NOT NULL)"
+            )
+            connection.execute(
+                "INSERT INTO profile_cache_state SELECT 0, 0 "
+                + "WHERE NOT EXISTS (SELECT * FROM profile_cache_state)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS profile_versions ("
+                + "profile_key TEXT PRIMARY KEY, version INTEGER NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS profile_cache ("
+                + "profile_key TEXT NOT NULL, segments TEXT NOT NULL, "
+                + "expiration_time REAL NOT NULL, "
+                + "last_used REAL NOT NULL, result TEXT NOT NULL, "
+                + "PRIMARY KEY (profile_key, segments))"
+            )
@@ -0,0 +1,38 @@
+"""Base Class for Security Request Transports."""
+
+from abc import ABC, abstractmethod
+from typing import Iterator, Union
+
+
+class Transport(ABC):
+    """
+    Base Class for Security Request Transports.
+    A transport sends security request XML to RACF (or something that behaves like RACF)
+    and returns the security result XML. Security admin objects use IRRSMO00 as their
+    transport unless a different transport is provided.
+    """
+
+    @abstractmethod
+    def call_racf(
+        self, request_xml: bytes, precheck: bool = False, zero_copy: bool = False
+    ) -> Union[str, bytes, memoryview]:
+        """
+        Send request XML to RACF and return the result XML.
+        Transports that return undecoded result XML when 'zero_copy' is True must
+        return the result XML as a str when 'zero_copy' is False.
+        """
+
+    def call_racf_chunks(
+        self, request_xml: bytes, precheck: bool = False, zero_copy: bool = False
+    ) -> Iterator[Union[str, bytes, memoryview]]:
+        """
+        Send request XML to RACF and yield the result XML one chunk at a time.
+        Transports that don't produce result XML in chunks yield it as one chunk.
+        """
+        yield self.call_racf(request_xml, precheck=precheck, zero_copy=zero_copy)
+
+    def _add_secret_traits(self, secret_traits: dict) -> None:
+        """
+        Add secret traits of a security admin object that uses this transport.
+        Transports that keep request XML or result XML must redact these secrets.
+        """
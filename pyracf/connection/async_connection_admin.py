@@ -0,0 +1,11 @@
+"""Asynchronous RACF Connection Administration."""
+
+from pyracf.common.async_security_admin import AsyncSecurityAdmin
+
+from .connection_admin import ConnectionAdmin
+
+
+class AsyncConnectionAdmin(AsyncSecurityAdmin):
+    """Asynchronous RACF Connection Administration."""
+
+    _security_admin_class = ConnectionAdmin
@@ -2,7 +2,9 @@
 
 from typing import List, Union
 
+from pyracf.common.profile_cache import ProfileCache
 from pyracf.common.security_admin import SecurityAdmin
+from pyracf.common.transport import Transport
 from pyracf.connection.connection_request import ConnectionRequest
 
 
@@ -16,6 +18,8 @@ class ConnectionAdmin(SecurityAdmin):
         update_existing_segment_traits: Union[dict, None] = None,
         replace_existing_segment_traits: Union[dict, None] = None,
         additional_secret_traits: Union[List[str], None] = None,
+        transport: Union[Transport, None] = None,
+        profile_cache: Union[ProfileCache, None] = None,
     ) -> None:
         self._valid_segment_traits = {
             "base": {
@@ -44,6 +48,8 @@ class ConnectionAdmin(SecurityAdmin):
             update_existing_segment_traits=update_existing_segment_traits,
             replace_existing_segment_traits=replace_existing_segment_traits,
             additional_secret_traits=additional_secret_traits,
+            transport=transport,
+            profile_cache=profile_cache,
         )
 
     # ============================================================================
@@ -123,15 +129,15 @@ class ConnectionAdmin(SecurityAdmin):
     # ============================================================================
     def add(self, userid: str, group: str, traits: dict = {}) -> Union[dict, bytes]:
         """Create a new group connection."""
-        self._build_segment_dictionaries(traits)
         connection_request = ConnectionRequest(userid, group, "set")
+        self._build_segment_dictionaries(connection_request, traits)
         self._add_traits_directly_to_request_xml_with_no_segments(connection_request)
         return self._make_request(connection_request)
 
     def alter(self, userid: str, group: str, traits: dict = {}) -> Union[dict, bytes]:
         """Alter an existing group connection."""
-        self._build_segment_dictionaries(traits)
         connection_request = ConnectionRequest(userid, group, "set")
+        self._build_segment_dictionaries(connection_request, traits)
         self._add_traits_directly_to_request_xml_with_no_segments(
             connection_request, alter=True
         )
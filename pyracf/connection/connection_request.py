@@ -1,5 +1,7 @@
 """Connection Request Builder."""
 
+from typing import List
+
 from pyracf.common.security_request import SecurityRequest
 
 
@@ -22,3 +24,11 @@ class ConnectionRequest(SecurityRequest):
                 "requestid": "ConnectionRequest",
             }
         )
+
+    def _get_affected_profile_keys(self) -> List[tuple]:
+        """Connections are listed in both the user profile and the group profile."""
+        attributes = self._security_definition.attrib
+        return [
+            ("user", attributes["name"].upper()),
+            ("group", attributes["group"].upper()),
+        ]
@@ -0,0 +1,11 @@
+"""Asynchronous RACF Data Set Profile Administration."""
+
+from pyracf.common.async_security_admin import AsyncSecurityAdmin
+
+from .data_set_admin import DataSetAdmin
+
+
+class AsyncDataSetAdmin(AsyncSecurityAdmin):
+    """Asynchronous RACF Data Set Profile Administration."""
+
+    _security_admin_class = DataSetAdmin
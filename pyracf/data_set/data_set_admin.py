@@ -1,8 +1,12 @@
 """RACF Data Set Profile Administration."""
 
-from typing import List, Union
+from typing import Iterator, List, Tuple, Union
 
+from pyracf.common.profile_cache import ProfileCache
 from pyracf.common.security_admin import SecurityAdmin
+from pyracf.common.security_request_error import SecurityRequestError
+from pyracf.common.security_result_stream import SecurityResultStream
+from pyracf.common.transport import Transport
 
 from .data_set_request import DataSetRequest
 
@@ -17,6 +21,8 @@ class DataSetAdmin(SecurityAdmin):
         update_existing_segment_traits: Union[dict, None] = None,
         replace_existing_segment_traits: Union[dict, None] = None,
         additional_secret_traits: Union[List[str], None] = None,
+        transport: Union[Transport, None] = None,
+        profile_cache: Union[ProfileCache, None] = None,
     ) -> None:
         self._valid_segment_traits = {
             "base": {
@@ -68,6 +74,8 @@ class DataSetAdmin(SecurityAdmin):
             update_existing_segment_traits=update_existing_segment_traits,
             replace_existing_segment_traits=replace_existing_segment_traits,
             additional_secret_traits=additional_secret_traits,
+            transport=transport,
+            profile_cache=profile_cache,
         )
         self._valid_segment_traits["base"].update(
             self._common_base_traits_data_set_generic
@@ -94,6 +102,30 @@ class DataSetAdmin(SecurityAdmin):
         profile = self.extract(data_set, profile_only=True)
         return self._get_field(profile, "base", "yourAccess")
 
+    # ============================================================================
+    # Multiple Fields
+    # ============================================================================
+    def get_fields(
+        self,
+        data_set: str,
+        fields: List[str],
+        volume: Union[str, None] = None,
+        generic: bool = False,
+    ) -> Union[dict, bytes]:
+        """
+        Get several fields (i.e., 'base:owner') of a data set profile with one extract.
+        """
+        return self._get_fields(
+            lambda segments: self.extract(
+                data_set,
+                segments=segments,
+                volume=volume,
+                generic=generic,
+                profile_only=True,
+            ),
+            fields,
+        )
+
     # ============================================================================
     # Base Functions
     # ============================================================================
@@ -105,8 +137,8 @@ class DataSetAdmin(SecurityAdmin):
         generic: bool = False,
     ) -> Union[dict, bytes]:
         """Create a new data set profile."""
-        self._build_segment_dictionaries(traits)
         data_set_request = DataSetRequest(data_set, "set", volume, generic)
+        self._build_segment_dictionaries(data_set_request, traits)
         self._build_xml_segments(data_set_request)
         return self._make_request(data_set_request)
 
@@ -118,8 +150,8 @@ class DataSetAdmin(SecurityAdmin):
         generic: bool = False,
     ) -> Union[dict, bytes]:
         """Alter an existing data set profile."""
-        self._build_segment_dictionaries(traits)
         data_set_request = DataSetRequest(data_set, "set", volume, generic)
+        self._build_segment_dictionaries(data_set_request, traits)
         self._build_xml_segments(data_set_request, alter=True)
         return self._make_request(data_set_request, irrsmo00_precheck=True)
 
@@ -132,14 +164,52 @@ class DataSetAdmin(SecurityAdmin):
         profile_only: bool = False,
     ) -> Union[dict, bytes]:
         """Extract a data set profile."""
-        self._build_bool_segment_dictionaries(segments)
         data_set_request = DataSetRequest(data_set, "listdata", volume, generic)
+        self._build_bool_segment_dictionaries(data_set_request, segments)
         self._build_xml_segments(data_set_request, extract=True)
         result = self._extract_and_check_result(data_set_request)
         if profile_only:
             return self._get_profile(result)
         return result
 
+    def extract_stream(
+        self,
+        data_set: str,
+        segments: dict = {},
+        volume: Union[str, None] = None,
+        generic: bool = False,
+    ) -> Union[SecurityResultStream, bytes]:
+        """
+        Extract a data set profile as a stream of result events, so that the
+        messages of very large profiles can be processed with bounded memory.
+        """
+        data_set_request = DataSetRequest(data_set, "listdata", volume, generic)
+        self._build_bool_segment_dictionaries(data_set_request, segments)
+        self._build_xml_segments(data_set_request, extract=True)
+        return self._stream_extract(data_set_request, "extract_stream")
+
+    def extract_many(
+        self,
+        data_sets: List[str],
+        segments: dict = {},
+        volume: Union[str, None] = None,
+        generic: bool = False,
+        profile_only: bool = False,
+        max_workers: Union[int, None] = None,
+    ) -> Iterator[Tuple[str, Union[dict, bytes, SecurityRequestError]]]:
+        """Extract many data set profiles concurrently."""
+        return self._extract_many(
+            data_sets,
+            lambda data_set: self.extract(
+                data_set,
+                segments=segments,
+                volume=volume,
+                generic=generic,
+                profile_only=profile_only,
+            ),
+            max_workers=max_workers,
+        )
+
     def delete(
         self,
         data_set: str,
@@ -0,0 +1,11 @@
+"""Asynchronous Group Administration."""
+
+from pyracf.common.async_security_admin import AsyncSecurityAdmin
+
+from .group_admin import GroupAdmin
+
+
+class AsyncGroupAdmin(AsyncSecurityAdmin):
+    """Asynchronous Group Administration."""
+
+    _security_admin_class = GroupAdmin
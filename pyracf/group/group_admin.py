@@ -1,12 +1,32 @@
 """Group Administration."""
 
-from typing import List, Union
+from typing import Dict, Iterator, List, Tuple, Union
 
+from pyracf.common.profile_cache import ProfileCache
 from pyracf.common.security_admin import SecurityAdmin
+from pyracf.common.security_request_error import SecurityRequestError
+from pyracf.common.security_result_stream import SecurityResultStream
+from pyracf.common.transport import Transport
 
 from .group_request import GroupRequest
 
 
+class _GroupProfile(dict):
+    """
+    Formatted group profile that keeps an index of the connect attributes of the
+    users in the group by lower case userid, so the index is only built once per
+    extract. The index is kept when the profile is copied (i.e., by a profile cache),
+    but not when it is serialized (i.e., by a SQLite profile cache).
+    """
+
+    def __init__(self, profile: dict) -> None:
+        super().__init__(profile)
+        self.connect_index = {
+            user["userid"].lower(): user["connectAttributes"] or []
+            for user in profile["base"]["users"] or []
+        }
+
+
 class GroupAdmin(SecurityAdmin):
     """Group Administration."""
 
@@ -17,6 +37,8 @@ class GroupAdmin(SecurityAdmin):
         update_existing_segment_traits: Union[dict, None] = None,
         replace_existing_segment_traits: Union[dict, None] = None,
         additional_secret_traits: Union[List[str], None] = None,
+        transport: Union[Transport, None] = None,
+        profile_cache: Union[ProfileCache, None] = None,
     ) -> None:
         self._valid_segment_traits = {
             "base": {
@@ -53,6 +75,8 @@ class GroupAdmin(SecurityAdmin):
             update_existing_segment_traits=update_existing_segment_traits,
             replace_existing_segment_traits=replace_existing_segment_traits,
             additional_secret_traits=additional_secret_traits,
+            transport=transport,
+            profile_cache=profile_cache,
         )
 
     # ============================================================================
@@ -63,7 +87,13 @@ class GroupAdmin(SecurityAdmin):
     ) -> Union[bool, bytes]:
         """Check if a user is connected to a group with group special authority."""
         profile = self.extract(group, profile_only=True)
-        return self.__has_connect_attribute(userid, profile, "special")
+        if not isinstance(profile, dict):
+            # Allows this function to work with "self.__generate_requests_only" mode
+            # and with requests that are queued in a batch.
+            return profile
+        return self.__has_connect_attribute(
+            userid, self.__get_connect_index(profile), "special"
+        )
 
     # ============================================================================
     # Group Operations
@@ -73,7 +103,13 @@ class GroupAdmin(SecurityAdmin):
     ) -> Union[bool, bytes]:
         """Check if a user is connected to a group with group operations authority."""
         profile = self.extract(group, profile_only=True)
-        return self.__has_connect_attribute(userid, profile, "operations")
+        if not isinstance(profile, dict):
+            # Allows this function to work with "self.__generate_requests_only" mode
+            # and with requests that are queued in a batch.
+            return profile
+        return self.__has_connect_attribute(
+            userid, self.__get_connect_index(profile), "operations"
+        )
 
     # ============================================================================
     # Group Auditor
@@ -83,7 +119,13 @@ class GroupAdmin(SecurityAdmin):
     ) -> Union[bool, bytes]:
         """Check if a user is connected to a group with group auditor authority."""
         profile = self.extract(group, profile_only=True)
-        return self.__has_connect_attribute(userid, profile, "auditor")
+        if not isinstance(profile, dict):
+            # Allows this function to work with "self.__generate_requests_only" mode
+            # and with requests that are queued in a batch.
+            return profile
+        return self.__has_connect_attribute(
+            userid, self.__get_connect_index(profile), "auditor"
+        )
 
     # ============================================================================
     # Group Access
@@ -91,7 +133,59 @@ class GroupAdmin(SecurityAdmin):
     def has_group_access_attribute(self, group: str, userid: str) -> Union[bool, bytes]:
         """Check if a user is connected to a group with the group access attribute."""
         profile = self.extract(group, profile_only=True)
-        return self.__has_connect_attribute(userid, profile, "grpacc")
+        if not isinstance(profile, dict):
+            # Allows this function to work with "self.__generate_requests_only" mode
+            # and with requests that are queued in a batch.
+            return profile
+        return self.__has_connect_attribute(
+            userid, self.__get_connect_index(profile), "grpacc"
+        )
+
+    # ============================================================================
+    # Connect Authorities
+    # ============================================================================
+    def get_connect_authorities(self, group: str, userid: str) -> Union[dict, bytes]:
+        """
+        Check which of group special, group operations and group auditor authority
+        and the group access attribute a user is connected to a group with.
+        """
+        profile = self.extract(group, profile_only=True)
+        if not isinstance(profile, dict):
+            # Allows this function to work with "self.__generate_requests_only" mode.
+            return profile
+        connect_index = self.__get_connect_index(profile)
+        return {
+            attribute: self.__has_connect_attribute(userid, connect_index, attribute)
+            for attribute in ["special", "operations", "auditor", "grpacc"]
+        }
+
+    def get_connect_attributes(
+        self, group: str, userids: Union[List[str], None] = None
+    ) -> Union[dict, bytes]:
+        """
+        Get the connect attributes (i.e., 'special' and 'grpacc') of many users in
+        a group with one extract. Users that aren't connected to the group map to
+        'None'. When no userids are given, every user connected to the group is
+        included, keyed by lower case userid.
+        """
+        profile = self.extract(group, profile_only=True)
+        if not isinstance(profile, dict):
+            # Allows this function to work with "self.__generate_requests_only" mode.
+            return profile
+        connect_index = self.__get_connect_index(profile)
+        if userids is None:
+            return connect_index
+        return {userid: connect_index.get(userid.lower()) for userid in userids}
+
+    # ============================================================================
+    # Multiple Fields
+    # ============================================================================
+    def get_fields(self, group: str, fields: List[str]) -> Union[dict, bytes]:
+        """Get several fields (i.e., 'omvs:gid') of a group's profile with one extract."""
+        return self._get_fields(
+            lambda segments: self.extract(group, segments=segments, profile_only=True),
+            fields,
+        )
 
     # ============================================================================
     # OMVS GID
@@ -124,15 +218,15 @@ class GroupAdmin(SecurityAdmin):
     # ============================================================================
     def add(self, group: str, traits: dict = {}) -> Union[dict, bytes]:
         """Create a new group."""
-        self._build_segment_dictionaries(traits)
         group_request = GroupRequest(group, "set")
+        self._build_segment_dictionaries(group_request, traits)
         self._build_xml_segments(group_request)
         return self._make_request(group_request)
 
     def alter(self, group: str, traits: dict = {}) -> Union[dict, bytes]:
         """Alter an existing group."""
-        self._build_segment_dictionaries(traits)
         group_request = GroupRequest(group, "set")
+        self._build_segment_dictionaries(group_request, traits)
         self._build_xml_segments(group_request, alter=True)
         return self._make_request(group_request, irrsmo00_precheck=True)
 
@@ -140,14 +234,42 @@ class GroupAdmin(SecurityAdmin):
         self, group: str, segments: dict = {}, profile_only: bool = False
     ) -> Union[dict, bytes]:
         """Extract a group's profile."""
-        self._build_bool_segment_dictionaries(segments)
         group_request = GroupRequest(group, "listdata")
+        self._build_bool_segment_dictionaries(group_request, segments)
         self._build_xml_segments(group_request, extract=True)
         result = self._extract_and_check_result(group_request)
         if profile_only:
             return self._get_profile(result)
         return result
 
+    def extract_stream(
+        self, group: str, segments: dict = {}
+    ) -> Union[SecurityResultStream, bytes]:
+        """
+        Extract a group's profile as a stream of result events, so that the messages
+        of very large profiles can be processed with bounded memory.
+        """
+        group_request = GroupRequest(group, "listdata")
+        self._build_bool_segment_dictionaries(group_request, segments)
+        self._build_xml_segments(group_request, extract=True)
+        return self._stream_extract(group_request, "extract_stream")
+
+    def extract_many(
+        self,
+        groups: List[str],
+        segments: dict = {},
+        profile_only: bool = False,
+        max_workers: Union[int, None] = None,
+    ) -> Iterator[Tuple[str, Union[dict, bytes, SecurityRequestError]]]:
+        """Extract many groups' profiles concurrently."""
+        return self._extract_many(
+            groups,
+            lambda group: self.extract(
+                group, segments=segments, profile_only=profile_only
+            ),
+            max_workers=max_workers,
+        )
+
     def delete(self, group: str) -> Union[dict, bytes]:
         """Delete a group."""
         group_request = GroupRequest(group, "del")
@@ -172,24 +294,23 @@ class GroupAdmin(SecurityAdmin):
             )
             if "subgroup(s)" in profile.keys():
                 profile["subgroup(s)"] = profile["subgroups"]
-            profiles.append(profile)
+            profiles.append(_GroupProfile(profile))
 
         # Post processing
         del result["securityResult"]["group"]["commands"][0]["messages"]
         result["securityResult"]["group"]["commands"][0]["profiles"] = profiles
 
+    def __get_connect_index(self, profile: dict) -> Dict[str, List[str]]:
+        """Get the connect attributes of the users in a group profile by userid."""
+        if not isinstance(profile, _GroupProfile):
+            profile = _GroupProfile(profile)
+        return profile.connect_index
+
     def __has_connect_attribute(
-        self, userid: str, profile: dict, attribute: str
+        self, userid: str, connect_index: Dict[str, List[str]], attribute: str
     ) -> bool:
-        """check if a user has a connect attribute in a group profile."""
-        if profile["base"]["users"] is None:
+        """check if a user has a connect attribute in a group connect index."""
+        connect_attributes = connect_index.get(userid.lower())
+        if connect_attributes is None:
             return False
-        connect_profile = [
-            user
-            for user in profile["base"]["users"]
-            if user["userid"].lower() == userid.lower()
-        ]
-        if connect_profile:
-            if attribute in connect_profile[0]["connectAttributes"]:
-                return True
-        return False
+        return attribute in connect_attributes
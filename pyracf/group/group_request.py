@@ -1,5 +1,7 @@
 """Group Administration Request Builder."""
 
+from typing import List
+
 from pyracf.common.security_request import SecurityRequest
 
 
@@ -14,3 +16,23 @@ class GroupRequest(SecurityRequest):
             "operation": operation,
             "requestid": "GroupRequest",
         }
+
+    def _get_affected_profile_keys(self) -> List[tuple]:
+        """
+        Subgroups are listed in the profile of their superior group. Creating a group
+        adds it to its superior group, which is the issuer's current connect group
+        unless one is given. Deleting a group or changing its superior group also
+        changes a superior group that can't be known without extracting the group first.
+        """
+        profile_keys = super()._get_affected_profile_keys()
+        operation = self._security_definition.attrib["operation"]
+        superior_group = self._get_trait_value("base", "base:supgroup")
+        if operation == "set" and not self._alter and superior_group:
+            profile_keys.append(("group", superior_group.upper()))
+        elif operation == "set" and not self._alter:
+            profile_keys.append(("group",))
+        elif operation == "set" and superior_group:
+            profile_keys.append(("group",))
+        elif operation == "del":
+            profile_keys.append(("group",))
+        return profile_keys
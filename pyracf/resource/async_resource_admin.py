@@ -0,0 +1,11 @@
+"""Asynchronous General Resource Profile Administration."""
+
+from pyracf.common.async_security_admin import AsyncSecurityAdmin
+
+from .resource_admin import ResourceAdmin
+
+
+class AsyncResourceAdmin(AsyncSecurityAdmin):
+    """Asynchronous General Resource Profile Administration."""
+
+    _security_admin_class = ResourceAdmin
@@ -1,8 +1,12 @@
 """General Resource Profile Administration."""
 
-from typing import List, Union
+from typing import Iterator, List, Tuple, Union
 
+from pyracf.common.profile_cache import ProfileCache
 from pyracf.common.security_admin import SecurityAdmin
+from pyracf.common.security_request_error import SecurityRequestError
+from pyracf.common.security_result_stream import SecurityResultStream
+from pyracf.common.transport import Transport
 
 from .resource_request import ResourceRequest
 
@@ -17,6 +21,8 @@ class ResourceAdmin(SecurityAdmin):
         update_existing_segment_traits: Union[dict, None] = None,
         replace_existing_segment_traits: Union[dict, None] = None,
         additional_secret_traits: Union[List[str], None] = None,
+        transport: Union[Transport, None] = None,
+        profile_cache: Union[ProfileCache, None] = None,
     ) -> None:
         self._valid_segment_traits = {
             "base": {
@@ -183,6 +189,8 @@ class ResourceAdmin(SecurityAdmin):
             update_existing_segment_traits=update_existing_segment_traits,
             replace_existing_segment_traits=replace_existing_segment_traits,
             additional_secret_traits=additional_secret_traits,
+            transport=transport,
+            profile_cache=profile_cache,
         )
 
     # ============================================================================
@@ -212,6 +220,23 @@ class ResourceAdmin(SecurityAdmin):
         profile = self.extract(resource, class_name, profile_only=True)
         return self._get_field(profile, "base", "yourAccess")
 
+    # ============================================================================
+    # Multiple Fields
+    # ============================================================================
+    def get_fields(
+        self, resource: str, class_name: str, fields: List[str]
+    ) -> Union[dict, bytes]:
+        """
+        Get several fields (i.e., 'base:owner') of a general resource profile
+        with one extract.
+        """
+        return self._get_fields(
+            lambda segments: self.extract(
+                resource, class_name, segments=segments, profile_only=True
+            ),
+            fields,
+        )
+
     # ============================================================================
     # Base Functions
     # ============================================================================
@@ -219,8 +244,8 @@ class ResourceAdmin(SecurityAdmin):
         self, resource: str, class_name: str, traits: dict = {}
     ) -> Union[dict, bytes]:
         """Create a new general resource profile."""
-        self._build_segment_dictionaries(traits)
         profile_request = ResourceRequest(resource, class_name, "set")
+        self._build_segment_dictionaries(profile_request, traits)
         self._build_xml_segments(profile_request)
         return self._make_request(profile_request)
 
@@ -228,8 +253,8 @@ class ResourceAdmin(SecurityAdmin):
         self, resource: str, class_name: str, traits: dict = {}
     ) -> Union[dict, bytes]:
         """Alter an existing general resource profile."""
-        self._build_segment_dictionaries(traits)
         profile_request = ResourceRequest(resource, class_name, "set")
+        self._build_segment_dictionaries(profile_request, traits)
         self._build_xml_segments(profile_request, alter=True)
         return self._make_request(profile_request, irrsmo00_precheck=True)
 
@@ -237,14 +262,43 @@ class ResourceAdmin(SecurityAdmin):
         self, resource: str, class_name: str, segments={}, profile_only: bool = False
     ) -> Union[dict, bytes]:
         """Extract a general resource profile."""
-        self._build_bool_segment_dictionaries(segments)
         resource_request = ResourceRequest(resource, class_name, "listdata")
+        self._build_bool_segment_dictionaries(resource_request, segments)
         self._build_xml_segments(resource_request, extract=True)
         result = self._extract_and_check_result(resource_request)
         if profile_only:
             return self._get_profile(result)
         return result
 
+    def extract_stream(
+        self, resource: str, class_name: str, segments: dict = {}
+    ) -> Union[SecurityResultStream, bytes]:
+        """
+        Extract a general resource profile as a stream of result events, so that
+        the messages of very large profiles can be processed with bounded memory.
+        """
+        resource_request = ResourceRequest(resource, class_name, "listdata")
+        self._build_bool_segment_dictionaries(resource_request, segments)
+        self._build_xml_segments(resource_request, extract=True)
+        return self._stream_extract(resource_request, "extract_stream")
+
+    def extract_many(
+        self,
+        resources: List[str],
+        class_name: str,
+        segments: dict = {},
+        profile_only: bool = False,
+        max_workers: Union[int, None] = None,
+    ) -> Iterator[Tuple[str, Union[dict, bytes, SecurityRequestError]]]:
+        """Extract many general resource profiles concurrently."""
+        return self._extract_many(
+            resources,
+            lambda resource: self.extract(
+                resource, class_name, segments=segments, profile_only=profile_only
+            ),
+            max_workers=max_workers,
+        )
+
     def delete(self, resource: str, class_name: str) -> Union[dict, bytes]:
         """Delete a general resource profile."""
         profile_request = ResourceRequest(resource, class_name, "del")
@@ -0,0 +1,11 @@
+"""Asynchronous Set RACF Options Administration."""
+
+from pyracf.common.async_security_admin import AsyncSecurityAdmin
+
+from .setropts_admin import SetroptsAdmin
+
+
+class AsyncSetroptsAdmin(AsyncSecurityAdmin):
+    """Asynchronous Set RACF Options Administration."""
+
+    _security_admin_class = SetroptsAdmin
@@ -1,14 +1,26 @@
 """Set RACF Options Administration."""
 
+import threading
+import time
 from typing import List, Tuple, Union
 
+from pyracf.common.profile_cache import ProfileCache
 from pyracf.common.security_admin import SecurityAdmin
+from pyracf.common.transport import Transport
 
 from .setropts_requset import SetroptsRequest
+from .setropts_snapshot import SetroptsSnapshot
 
 
 class SetroptsAdmin(SecurityAdmin):
-    """Set RACF Options Administration."""
+    """
+    Set RACF Options Administration.
+
+    Snapshots:
+    When 'snapshot_ttl' is greater than zero, the snapshot of RACF options used to
+    answer questions about RACF options is reused for 'snapshot_ttl' seconds, or until
+    RACF options are altered using this admin object, whichever comes first.
+    """
 
     def __init__(
         self,
@@ -17,6 +29,9 @@ class SetroptsAdmin(SecurityAdmin):
         update_existing_segment_traits: Union[dict, None] = None,
         replace_existing_segment_traits: Union[dict, None] = None,
         additional_secret_traits: Union[List[str], None] = None,
+        transport: Union[Transport, None] = None,
+        profile_cache: Union[ProfileCache, None] = None,
+        snapshot_ttl: float = 0.0,
     ) -> None:
         self._valid_segment_traits = {
             "base": {
@@ -111,15 +126,26 @@ class SetroptsAdmin(SecurityAdmin):
             update_existing_segment_traits=update_existing_segment_traits,
             replace_existing_segment_traits=replace_existing_segment_traits,
             additional_secret_traits=additional_secret_traits,
+            transport=transport,
+            profile_cache=profile_cache,
         )
+        self.__snapshot_ttl = snapshot_ttl
+        self.__snapshot = None
+        self.__snapshot_expiration_time = 0.0
+        # Incremented whenever RACF options are altered using this admin object.
+        self.__snapshot_generation = 0
+        self.__snapshot_lock = threading.Lock()
 
     # ============================================================================
     # Password Rules
     # ============================================================================
     def get_password_rules(self) -> Union[dict, bytes]:
         """Get RACF password rules."""
-        profile = self.list_racf_options(options_only=True)
-        return self._get_field(profile, "passwordProcessingOptions", "syntaxRules")
+        snapshot = self.get_snapshot()
+        if not isinstance(snapshot, SetroptsSnapshot):
+            # Allows this function to work with "self.__generate_requests_only" mode.
+            return snapshot
+        return snapshot.get_password_rules()
 
     # ============================================================================
     # Raclist Refresh
@@ -134,15 +160,47 @@ class SetroptsAdmin(SecurityAdmin):
     # ============================================================================
     def get_class_attributes(self, class_name: str) -> Union[list, bytes]:
         """Get RACF get attributes."""
-        profile = self.list_racf_options(options_only=True)
-        if not isinstance(profile, dict):
+        snapshot = self.get_snapshot()
+        if not isinstance(snapshot, SetroptsSnapshot):
             # Allows this function to work with "self.__generate_requests_only" mode.
-            return profile
-        return [
-            class_type
-            for class_type in profile["classes"].keys()
-            if class_name.lower() in profile["classes"][class_type]
-        ]
+            return snapshot
+        return snapshot.get_class_attributes(class_name)
+
+    # ============================================================================
+    # Snapshot
+    # ============================================================================
+    def get_snapshot(self) -> Union[SetroptsSnapshot, bytes]:
+        """
+        Get a snapshot of RACF options that can be queried any number of times.
+        A new snapshot is only extracted if there is no snapshot that can be reused.
+        """
+        with self.__snapshot_lock:
+            if (
+                self.__snapshot is not None
+                and time.monotonic() < self.__snapshot_expiration_time
+            ):
+                return self.__snapshot
+            snapshot_generation = self.__snapshot_generation
+        options = self.list_racf_options(options_only=True)
+        if not isinstance(options, dict):
+            # Allows this function to work with "self.__generate_requests_only" mode.
+            return options
+        snapshot = SetroptsSnapshot(options)
+        if self.__snapshot_ttl > 0:
+            with self.__snapshot_lock:
+                # Don't keep a snapshot that was extracted while options were altered.
+                if snapshot_generation == self.__snapshot_generation:
+                    self.__snapshot = snapshot
+                    self.__snapshot_expiration_time = (
+                        time.monotonic() + self.__snapshot_ttl
+                    )
+        return snapshot
+
+    def __invalidate_snapshot(self) -> None:
+        """Stop reusing the current snapshot of RACF options."""
+        with self.__snapshot_lock:
+            self.__snapshot = None
+            self.__snapshot_generation += 1
 
     # ============================================================================
     # Audit Class
@@ -283,8 +341,8 @@ class SetroptsAdmin(SecurityAdmin):
     # ============================================================================
     def list_racf_options(self, options_only: bool = False) -> Union[dict, bytes]:
         """List RACF options."""
-        self._build_segment_dictionaries({"base:list": True})
         setropts_request = SetroptsRequest()
+        self._build_segment_dictionaries(setropts_request, {"base:list": True})
         self._add_traits_directly_to_request_xml_with_no_segments(setropts_request)
         result = self._extract_and_check_result(setropts_request)
         if options_only:
@@ -293,10 +351,14 @@ class SetroptsAdmin(SecurityAdmin):
 
     def alter(self, options: dict = {}) -> Union[dict, bytes]:
         """Update RACF options."""
-        self._build_segment_dictionaries(options)
         setropts_request = SetroptsRequest()
+        self._build_segment_dictionaries(setropts_request, options)
         self._add_traits_directly_to_request_xml_with_no_segments(setropts_request)
-        return self._make_request(setropts_request)
+        self.__invalidate_snapshot()
+        try:
+            return self._make_request(setropts_request)
+        finally:
+            self.__invalidate_snapshot()
 
     # ============================================================================
     # Private/Protected Utility Functions
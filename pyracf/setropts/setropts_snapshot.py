@@ -0,0 +1,55 @@
+"""Snapshot of RACF Options."""
+
+from typing import Dict, FrozenSet, List, Union
+
+
+class SetroptsSnapshot:
+    """
+    Snapshot of RACF Options.
+    Built from a single SETROPTS LIST so that any number of questions about
+    RACF options (i.e., 'is the FACILITY class raclisted?') can be answered
+    without listing RACF options again.
+    """
+
+    def __init__(self, options: dict) -> None:
+        self.options = options
+        # Class names for each class attribute, for constant time lookups.
+        self.__classes: Dict[str, FrozenSet[str]] = {
+            class_attribute: frozenset(class_names or [])
+            for class_attribute, class_names in options.get("classes", {}).items()
+        }
+
+    # ============================================================================
+    # Class Attributes
+    # ============================================================================
+    def get_class_attributes(self, class_name: str) -> List[str]:
+        """Get the attributes of a class (i.e., 'active' and 'raclist')."""
+        class_name = class_name.lower()
+        return [
+            class_attribute
+            for class_attribute, class_names in self.__classes.items()
+            if class_name in class_names
+        ]
+
+    def has_class_attribute(self, class_name: str, class_attribute: str) -> bool:
+        """Check if a class has an attribute."""
+        return class_name.lower() in self.__classes.get(class_attribute, frozenset())
+
+    def is_class_active(self, class_name: str) -> bool:
+        """Check if RACF performs access authorization checking for a class."""
+        return self.has_class_attribute(class_name, "active")
+
+    def is_class_raclisted(self, class_name: str) -> bool:
+        """Check if a class has in-storage profile sharing activated."""
+        return self.has_class_attribute(class_name, "raclist")
+
+    def is_class_generic(self, class_name: str) -> bool:
+        """Check if a class has generic profile checking enabled."""
+        return self.has_class_attribute(class_name, "genericProfile")
+
+    # ============================================================================
+    # Password Rules
+    # ============================================================================
+    def get_password_rules(self) -> Union[dict, None]:
+        """Get RACF password rules."""
+        return self.options.get("passwordProcessingOptions", {}).get("syntaxRules")
@@ -0,0 +1,151 @@
+"""In-Memory RACF Database."""
+
+import threading
+from datetime import date
+from typing import Dict, List, Tuple, Union
+
+
+class RACFDatabase:
+    """
+    In-Memory RACF Database.
+    The segments of each profile are stored as dictionaries that map the local name
+    of each trait XML tag (i.e., 'uid' for '<uid>' and 'special' for '<racf:special>')
+    to its value, so they can be updated straight from security request XML.
+    """
+
+    def __init__(self, userid: str = "IBMUSER") -> None:
+        # The simulator serves requests from many threads at once.
+        self.lock = threading.RLock()
+        self.userid = userid.upper()
+        self.users: Dict[str, dict] = {}
+        self.groups: Dict[str, dict] = {}
+        self.connections: Dict[Tuple[str, str], dict] = {}
+        self.data_sets: Dict[Tuple[str, bool], dict] = {}
+        self.resources: Dict[Tuple[str, str], dict] = {}
+        self.add_group("SYS1", {"base": {"owner": self.userid}})
+        self.add_user(
+            self.userid,
+            {"base": {"owner": self.userid, "special": True, "password": True}},
+        )
+
+    # ============================================================================
+    # Users
+    # ============================================================================
+    def add_user(self, userid: str, segments: dict) -> None:
+        """Define a user and connect it to its default group."""
+        profile = self.__new_profile(segments)
+        profile["segments"]["base"].setdefault("owner", self.userid)
+        profile["segments"]["base"].setdefault("defgroup", "SYS1")
+        self.users[userid] = profile
+        self.connect(userid, profile["segments"]["base"]["defgroup"].upper(), {})
+
+    def delete_user(self, userid: str) -> None:
+        """Delete a user and all of its group connections."""
+        del self.users[userid]
+        for connection in list(self.connections):
+            if connection[0] == userid:
+                del self.connections[connection]
+
+    def get_user_connections(self, userid: str) -> List[Tuple[str, dict]]:
+        """Get the groups a user is connected to, starting with its default group."""
+        default_group = self.users[userid]["segments"]["base"]["defgroup"].upper()
+        connections = [
+            (group, connection)
+            for (connected_userid, group), connection in self.connections.items()
+            if connected_userid == userid
+        ]
+        return sorted(
+            connections, key=lambda connection: connection[0] != default_group
+        )
+
+    # ============================================================================
+    # Groups
+    # ============================================================================
+    def add_group(self, group: str, segments: dict) -> None:
+        """Define a group."""
+        profile = self.__new_profile(segments)
+        profile["segments"]["base"].setdefault("owner", self.userid)
+        profile["segments"]["base"].setdefault(
+            "supgroup", "SYS1" if group != "SYS1" else ""
+        )
+        self.groups[group] = profile
+
+    def delete_group(self, group: str) -> None:
+        """Delete a group and all of its connections."""
+        del self.groups[group]
+        for connection in list(self.connections):
+            if connection[1] == group:
+                del self.connections[connection]
+
+    def get_group_connections(self, group: str) -> List[Tuple[str, dict]]:
+        """Get the users connected to a group."""
+        return [
+            (userid, connection)
+            for (userid, connected_group), connection in self.connections.items()
+            if connected_group == group
+        ]
+
+    def get_subgroups(self, group: str) -> List[str]:
+        """Get the groups that have a group as their superior group."""
+        return sorted(
+            subgroup
+            for subgroup, profile in self.groups.items()
+            if profile["segments"]["base"]["supgroup"].upper() == group
+        )
+
+    # ============================================================================
+    # Group Connections
+    # ============================================================================
+    def connect(self, userid: str, group: str, traits: dict) -> dict:
+        """Connect a user to a group, or update an existing connection."""
+        connection = self.connections.setdefault(
+            (userid, group),
+            {"owner": self.userid, "created": self.today(), "auth": "USE"},
+        )
+        connection.update(traits)
+        return connection
+
+    # ============================================================================
+    # Data Set and General Resource Profiles
+    # ============================================================================
+    def add_data_set(self, data_set: str, generic: bool, segments: dict) -> None:
+        """Define a data set profile."""
+        profile = self.__new_profile(segments)
+        profile["segments"]["base"].setdefault("owner", data_set.split(".")[0])
+        profile["access_list"] = {}
+        self.data_sets[(data_set, generic)] = profile
+
+    def add_resource(self, resource: str, class_name: str, segments: dict) -> None:
+        """Define a general resource profile."""
+        profile = self.__new_profile(segments)
+        profile["segments"]["base"].setdefault("owner", self.userid)
+        profile["access_list"] = {}
+        self.resources[(class_name, resource)] = profile
+
+    def get_access_list_profile(
+        self, name: str, class_name: str, generic: bool
+    ) -> Union[dict, None]:
+        """Get the data set or general resource profile that an access list belongs to."""
+        if class_name == "DATASET":
+            return self.data_sets.get((name, generic))
+        return self.resources.get((class_name, name))
+
+    def is_defined(self, userid_or_group: str) -> bool:
+        """Check whether a user or group is defined."""
+        return userid_or_group in self.users or userid_or_group in self.groups
+
+    # ============================================================================
+    # Utilities
+    # ============================================================================
+    def today(self) -> str:
+        """Get today's date in the 'yy.ddd' format RACF uses in profile listings."""
+        return date.today().strftime("%y.%j")
+
+    def __new_profile(self, segments: dict) -> dict:
+        """Build a new profile from segment dictionaries."""
+        profile = {
+            "created": self.today(),
+            "segments": {segment: dict(traits) for segment, traits in segments.items()},
+        }
+        profile["segments"].setdefault("base", {})
+        return profile
@@ -0,0 +1,292 @@
+"""RACF Profile Listings for the RACF Simulator."""
+
+from typing import List, Union
+
+from .racf_database import RACFDatabase
+
+
+class RACFListings:
+    """
+    Build the messages that RACF list commands (LISTUSER, LISTGRP, LISTDSD and RLIST)
+    return for profiles in an in-memory RACF database.
+    The messages follow the layout of real RACF profile listings closely enough
+    to be formatted by the profile formatters of the security admin classes.
+    """
+
+    # Field names used in segment listings where they differ from the trait XML tag.
+    __segment_field_names = {
+        "omvs": {
+            "pgm": "PROGRAM",
+            "cputime": "CPUTIMEMAX",
+            "assize": "ASSIZEMAX",
+            "fileproc": "FILEPROCMAX",
+            "proc": "PROCUSERMAX",
+            "threads": "THREADSMAX",
+            "mmaparea": "MMAPAREAMAX",
+        }
+    }
+    # Fields that RACF lists for a segment even when they are not set.
+    __segment_default_fields = {
+        "omvs": [
+            "CPUTIMEMAX",
+            "ASSIZEMAX",
+            "FILEPROCMAX",
+            "PROCUSERMAX",
+            "THREADSMAX",
+            "MMAPAREAMAX",
+        ]
+    }
+    __user_attributes = {
+        "special": "SPECIAL",
+        "oper": "OPERATIONS",
+        "auditor": "AUDITOR",
+        "roaudit": "ROAUDIT",
+        "grpacc": "GRPACC",
+        "adsp": "ADSP",
+    }
+
+    def __init__(self, database: RACFDatabase) -> None:
+        self.__database = database
+
+    # ============================================================================
+    # LISTUSER
+    # ============================================================================
+    def list_user(self, userid: str, segments: List[str]) -> List[str]:
+        """Build LISTUSER messages."""
+        profile = self.__database.users[userid]
+        base = profile["segments"]["base"]
+        name = str(base.get("name", "UNKNOWN")).upper()
+        attributes = [
+            attribute
+            for trait, attribute in self.__user_attributes.items()
+            if base.get(trait)
+        ]
+        protected = not base.get("password") and not base.get("phrase")
+        if protected:
+            attributes.append("PROTECTED")
+        class_authorizations = " ".join(base.get("clauth", [])).upper()
+        messages = [
+            f"USER={userid:<8}  NAME={name:<20}  OWNER={self.__upper(base['owner']):<8}"
+            + f"  CREATED={profile['created']}",
+            f" DEFAULT-GROUP={self.__upper(base['defgroup']):<8} "
+            + f"PASSDATE={'N/A' if protected else '00.000':<6} "
+            + f"PASS-INTERVAL={'N/A' if protected else '186'} "
+            + f"PHRASEDATE={'00.000' if base.get('phrase') else 'N/A'}",
+            f" ATTRIBUTES={' '.join(attributes) or 'NONE'}",
+            f" REVOKE DATE={self.__upper(base.get('revokedate', 'NONE'))}   "
+            + f"RESUME DATE={self.__upper(base.get('resumedate', 'NONE'))}",
+            " LAST-ACCESS=UNKNOWN",
+            f" CLASS AUTHORIZATIONS={class_authorizations or 'NONE'}",
+            self.__optional_field(" ", "INSTALLATION-DATA", base.get("data")),
+            self.__optional_field(" ", "MODEL-NAME", base.get("model")),
+            " LOGON ALLOWED   (DAYS)          (TIME)",
+            " ---------------------------------------------",
+            " ANYDAY                          ANYTIME",
+        ]
+        for group, connection in self.__database.get_user_connections(userid):
+            connect_attributes = [
+                attribute
+                for trait, attribute in self.__user_attributes.items()
+                if connection.get(trait)
+            ]
+            messages += [
+                f"  GROUP={group:<8}  AUTH={self.__upper(connection['auth']):<8}"
+                + f"  CONNECT-OWNER={self.__upper(connection['owner']):<8}"
+                + f"  CONNECT-DATE={connection['created']}",
+                "    CONNECTS=    00  "
+                + f"UACC={self.__upper(connection.get('uacc', 'NONE')):<8}"
+                + "  LAST-CONNECT=UNKNOWN",
+                f"    CONNECT ATTRIBUTES={' '.join(connect_attributes) or 'NONE'}",
+                "    REVOKE DATE=NONE   RESUME DATE=NONE",
+            ]
+        messages += [
+            "SECURITY-LEVEL=NONE SPECIFIED",
+            "CATEGORY-AUTHORIZATION",
+            " NONE SPECIFIED",
+            "SECURITY-LABEL=NONE SPECIFIED",
+        ]
+        return messages + self.__list_segments(profile, segments)
+
+    # ============================================================================
+    # LISTGRP
+    # ============================================================================
+    def list_group(self, group: str, segments: List[str]) -> List[str]:
+        """Build LISTGRP messages."""
+        profile = self.__database.groups[group]
+        base = profile["segments"]["base"]
+        messages = [
+            f"INFORMATION FOR GROUP {group}",
+            f"    SUPERIOR GROUP={self.__upper(base['supgroup']) or 'NONE':<8}     "
+            + f"OWNER={self.__upper(base['owner']):<8}    CREATED={profile['created']}",
+            self.__optional_field("    ", "INSTALLATION DATA", base.get("data")),
+            self.__optional_field("    ", "MODEL DATA SET", base.get("model")),
+            "    TERMUACC" if base.get("termuacc", True) else "    NO TERMUACC",
+        ]
+        subgroups = self.__database.get_subgroups(group)
+        if subgroups:
+            messages.append(f"    SUBGROUP(S)= {' '.join(subgroups)}")
+        else:
+            messages.append("    NO SUBGROUPS")
+        connections = self.__database.get_group_connections(group)
+        if not connections:
+            messages.append("    NO USERS")
+        else:
+            messages.append(
+                "    USER(S)=      ACCESS=      ACCESS COUNT=      UNIVERSAL ACCESS="
+            )
+        for userid, connection in connections:
+            connect_attributes = [
+                attribute
+                for trait, attribute in self.__user_attributes.items()
+                if connection.get(trait)
+            ]
+            messages += [
+                f"      {userid:<8}      {self.__upper(connection['auth']):<8}      "
+                + f"000000               {self.__upper(connection.get('uacc', 'NONE'))}",
+                f"         CONNECT ATTRIBUTES={' '.join(connect_attributes) or 'NONE'}",
+                "         REVOKE DATE=NONE                 RESUME DATE=NONE",
+            ]
+        return messages + self.__list_segments(profile, segments)
+
+    # ============================================================================
+    # LISTDSD
+    # ============================================================================
+    def list_data_set(
+        self, data_set: str, generic: bool, volume: Union[str, None]
+    ) -> List[str]:
+        """Build LISTDSD messages."""
+        profile = self.__database.data_sets[(data_set, generic)]
+        base = profile["segments"]["base"]
+        messages = [
+            f"INFORMATION FOR DATASET {data_set}{' (G)' if generic else ''}",
+            None,
+            "LEVEL  OWNER    UNIVERSAL ACCESS   WARNING   ERASE",
+            "-----  -------- ----------------   -------   -----",
+            self.__columns(
+                [0, 7, 16, 35, 45],
+                [
+                    " 00",
+                    self.__upper(base["owner"]),
+                    self.__upper(base.get("uacc", "NONE")),
+                    "YES" if base.get("warning") else "NO",
+                    "YES" if base.get("erase") else "NO",
+                ],
+            ),
+            None,
+            "AUDITING",
+            "--------",
+            "FAILURES(READ)",
+            None,
+            "NOTIFY",
+            "--------",
+            self.__notify(base),
+            None,
+            "YOUR ACCESS  CREATION GROUP  DATASET TYPE",
+            "-----------  --------------  ------------",
+            self.__columns([0, 13, 29], [" ALTER", "SYS1", "NON-VSAM"]),
+            None,
+        ]
+        if not generic:
+            messages += [
+                "VOLUMES ON WHICH DATASET RESIDES",
+                "--------------------------------",
+                self.__upper(volume or base.get("volume", "SIMVOL")),
+                None,
+            ]
+        messages.append(
+            self.__optional_field("", "INSTALLATION DATA", base.get("data"))
+        )
+        return messages
+
+    # ============================================================================
+    # RLIST
+    # ============================================================================
+    def list_resource(self, resource: str, class_name: str) -> List[str]:
+        """Build RLIST messages."""
+        profile = self.__database.resources[(class_name, resource)]
+        base = profile["segments"]["base"]
+        universal_access = self.__upper(base.get("uacc", "NONE"))
+        return [
+            "CLASS      NAME",
+            "-----      ----",
+            f"{class_name:<8}   {resource}",
+            " ",
+            "LEVEL  OWNER      UNIVERSAL ACCESS  YOUR ACCESS  WARNING",
+            "-----  --------   ----------------  -----------  -------",
+            self.__columns(
+                [0, 7, 18, 36, 49],
+                [
+                    " 00",
+                    self.__upper(base["owner"]),
+                    universal_access,
+                    "ALTER",
+                    "YES" if base.get("warning") else "NO",
+                ],
+            ),
+            " ",
+            "INSTALLATION DATA",
+            "-----------------",
+            self.__upper(base.get("data", "NONE")),
+            " ",
+            "APPLICATION DATA",
+            "----------------",
+            self.__upper(base.get("appldata", "NONE")),
+            " ",
+            "AUDITING",
+            "--------",
+            "FAILURES(READ)",
+            " ",
+            "NOTIFY",
+            "------",
+            self.__notify(base),
+        ]
+
+    # ============================================================================
+    # Utilities
+    # ============================================================================
+    def __list_segments(self, profile: dict, segments: List[str]) -> List[str]:
+        """Build messages for the additional segments that were requested."""
+        messages = []
+        for segment in segments:
+            if segment == "base":
+                continue
+            messages.append(" ")
+            traits = profile["segments"].get(segment)
+            if not traits:
+                messages.append(f"NO {segment.upper()} INFORMATION")
+                continue
+            messages += [f"{segment.upper()} INFORMATION", "----------------"]
+            field_names = self.__segment_field_names.get(segment, {})
+            fields = {}
+            for trait, value in traits.items():
+                field = field_names.get(trait, trait.upper())
+                if trait in ("uid", "gid"):
+                    value = str(value).zfill(10)
+                fields[field] = value
+            for field in self.__segment_default_fields.get(segment, []):
+                fields.setdefault(field, "NONE")
+            messages += [f"{field}= {value}" for field, value in fields.items()]
+        return messages
+
+    def __optional_field(self, indent: str, field: str, value: Union[str, None]) -> str:
+        """Build the message for a field that RACF lists as 'NO <FIELD>' when unset."""
+        if value is None:
+            return f"{indent}NO{'-' if '-' in field else ' '}{field}"
+        return f"{indent}{field}={self.__upper(value)}"
+
+    def __columns(self, offsets: List[int], values: List[str]) -> str:
+        """Line up values in the columns of a RACF listing table."""
+        line = ""
+        for offset, value in zip(offsets, values):
+            line = f"{line:<{offset}}{value}"
+        return line
+
+    def __notify(self, base: dict) -> str:
+        """Build the message for the user notified of access violations."""
+        if base.get("notify"):
+            return self.__upper(base["notify"])
+        return "NO USER TO BE NOTIFIED"
+
+    def __upper(self, value: Union[str, bool, int]) -> str:
+        """Convert a trait value to the upper case form used in listings."""
+        return str(value).upper()
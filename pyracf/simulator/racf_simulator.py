@@ -0,0 +1,580 @@
+"""In-Memory RACF Simulator."""
+
+import platform
+import re
+import time
+import xml.etree.ElementTree as XMLBuilder
+from typing import List, Tuple, Union
+from xml.etree.ElementTree import Element  # Only used for type hints.
+
+import defusedxml.ElementTree as XMLParser
+
+from pyracf.common.transport import Transport
+
+from .racf_database import RACFDatabase
+from .racf_listings import RACFListings
+
+
+class RACFSimulator(Transport):
+    """
+    In-Memory RACF Simulator.
+    Answers security request XML with security result XML the way IRRSMO00 does,
+    using an in-memory RACF database of users, groups, group connections, data set
+    profiles, general resource profiles and permissions. This allows pyRACF and
+    anything built on it to be tested and benchmarked end to end off platform.
+    Request types that are not simulated (i.e., RACF options) are answered with
+    an IRRSMO00 style error.
+    """
+
+    # RACF command keywords for trait XML tags that don't match the keyword.
+    __keywords = {
+        "authid": "ID",
+        "defgroup": "DFLTGRP",
+        "oper": "OPERATIONS",
+        "pgm": "PROGRAM",
+        "resumedate": "RESUME",
+        "revokedate": "REVOKE",
+    }
+    # Traits whose values are lists of names.
+    __list_traits = ["clauth"]
+    # Traits whose values must never be stored.
+    __secret_traits = ["password", "phrase"]
+
+    def __init__(self, userid: str = "IBMUSER", latency: float = 0.0) -> None:
+        self.database = RACFDatabase(userid)
+        # Seconds to wait before answering each request to mimic the cost of IRRSMO00.
+        self.latency = latency
+        self.__listings = RACFListings(self.database)
+
+    def call_racf(
+        self, request_xml: bytes, precheck: bool = False, zero_copy: bool = False
+    ) -> str:
+        """Process request XML and return result XML."""
+        if self.latency:
+            time.sleep(self.latency)
+        encoding = "cp1047" if platform.system() == "OS/390" else "utf-8"
+        security_request = XMLParser.fromstring(request_xml.decode(encoding))
+        security_result = XMLBuilder.Element(
+            "securityresult",
+            {"xmlns": "http://www.ibm.com/systems/zos/saf/IRRSMO00Result1"},
+        )
+        return_codes = []
+        with self.database.lock:
+            for definition in security_request:
+                definition_result, return_code = self.__process_definition(
+                    definition, precheck
+                )
+                security_result.append(definition_result)
+                return_codes.append(return_code)
+        return_code, reason_code = max(return_codes, default=(0, 0))
+        XMLBuilder.SubElement(security_result, "returncode").text = str(return_code)
+        XMLBuilder.SubElement(security_result, "reasoncode").text = str(reason_code)
+        XMLBuilder.indent(security_result, space="  ")
+        return '<?xml version="1.0" encoding="IBM-1047"?>\n' + XMLBuilder.tostring(
+            security_result, encoding="unicode"
+        )
+
+    # ============================================================================
+    # Security Definitions
+    # ============================================================================
+    def __process_definition(
+        self, definition: Element, precheck: bool
+    ) -> Tuple[Element, Tuple[int, int]]:
+        """Process a single security definition and build its result."""
+        definition_tag = self.__local_name(definition.tag)
+        operation = definition.attrib["operation"]
+        definition_result = XMLBuilder.Element(definition_tag, dict(definition.attrib))
+        if "name" in definition.attrib:
+            definition_result.attrib["name"] = definition.attrib["name"].upper()
+        match (definition_tag):
+            case "user":
+                commands = self.__process_user(
+                    definition, operation, precheck, definition_result
+                )
+            case "group":
+                commands = self.__process_group(
+                    definition, operation, precheck, definition_result
+                )
+            case "dataset":
+                commands = self.__process_data_set(
+                    definition, operation, precheck, definition_result
+                )
+            case "resource":
+                commands = self.__process_resource(
+                    definition, operation, precheck, definition_result
+                )
+            case "groupconnection":
+                commands = self.__process_connection(definition, operation)
+            case "permission":
+                commands = self.__process_permission(definition, operation)
+            case _:
+                self.__add_error(definition_result, definition_tag)
+                return (definition_result, (2000, 4))
+        for command in commands:
+            definition_result.append(command)
+        if any(command.find("returncode").text != "0" for command in commands):
+            return (definition_result, (4, 0))
+        return (definition_result, (0, 0))
+
+    def __process_user(
+        self,
+        definition: Element,
+        operation: str,
+        precheck: bool,
+        definition_result: Element,
+    ) -> List[Element]:
+        """Process a user definition."""
+        userid = definition.attrib["name"].upper()
+        users = self.database.users
+        if operation == "listdata":
+            segments = self.__get_requested_segments(definition)
+            image = f"LISTUSER {userid}  {' '.join(segments).upper()}"
+            if userid not in users:
+                return [
+                    self.__failed(
+                        image, [f"ICH30001I UNABLE TO LOCATE USER    ENTRY {userid}"]
+                    )
+                ]
+            return [self.__command(image, self.__listings.list_user(userid, segments))]
+        if operation == "del":
+            if userid not in users:
+                return [
+                    self.__failed(
+                        f"DELUSER {userid}", [f"IKJ56702I INVALID USERID, {userid}"], 8
+                    )
+                ]
+            self.database.delete_user(userid)
+            return [self.__command(f"DELUSER {userid}")]
+        segments = self.__get_segment_traits(definition)
+        commands = self.__add_profile(
+            userid in users,
+            precheck,
+            definition_result,
+            f"ADDUSER {userid} ",
+            f"IKJ56702I INVALID USERID, {userid}",
+        )
+        if userid not in users:
+            self.database.add_user(userid, {})
+            base = segments.get("base", [])
+            if not any(trait[0] in self.__secret_traits for trait in base):
+                commands[-1].append(
+                    self.__message(f"ICH01024I User {userid} is defined as PROTECTED.")
+                )
+        if segments:
+            profile = users[userid]
+            self.__apply_segment_traits(profile["segments"], segments)
+            for trait, operation, value in segments.get("base", []):
+                if trait == "defgroup" and operation != "del":
+                    self.database.connect(userid, value.upper(), {})
+            commands.append(
+                self.__command(f"ALTUSER {userid} {self.__segments_image(segments)}")
+            )
+        return commands
+
+    def __process_group(
+        self,
+        definition: Element,
+        operation: str,
+        precheck: bool,
+        definition_result: Element,
+    ) -> List[Element]:
+        """Process a group definition."""
+        group = definition.attrib["name"].upper()
+        groups = self.database.groups
+        if operation == "listdata":
+            segments = self.__get_requested_segments(definition)
+            image = f"LISTGRP {group}  {' '.join(segments).upper()}"
+            if group not in groups:
+                return [
+                    self.__failed(image, ["ICH51003I NAME NOT FOUND IN RACF DATA SET"])
+                ]
+            return [self.__command(image, self.__listings.list_group(group, segments))]
+        if operation == "del":
+            if group not in groups:
+                return [
+                    self.__failed(
+                        f"DELGROUP {group}", [f"IKJ56702I INVALID GROUP, {group}"], 8
+                    )
+                ]
+            self.database.delete_group(group)
+            return [self.__command(f"DELGROUP {group}")]
+        segments = self.__get_segment_traits(definition)
+        commands = self.__add_profile(
+            group in groups,
+            precheck,
+            definition_result,
+            f"ADDGROUP {group} ",
+            f"IKJ56702I INVALID GROUP, {group}",
+        )
+        if group not in groups:
+            self.database.add_group(group, {})
+        if segments:
+            self.__apply_segment_traits(groups[group]["segments"], segments)
+            commands.append(
+                self.__command(f"ALTGROUP {group} {self.__segments_image(segments)}")
+            )
+        return commands
+
+    def __process_data_set(
+        self,
+        definition: Element,
+        operation: str,
+        precheck: bool,
+        definition_result: Element,
+    ) -> List[Element]:
+        """Process a data set definition."""
+        data_set = definition.attrib["name"].upper()
+        generic = definition.attrib.get("generic") == "yes"
+        key = (data_set, generic)
+        data_sets = self.database.data_sets
+        if operation == "listdata":
+            image = f"LISTDSD  DATASET     ('{data_set}')"
+            if key not in data_sets:
+                return [
+                    self.__failed(
+                        image, [f"ICH35003I NO RACF DESCRIPTION FOUND FOR {data_set}"]
+                    )
+                ]
+            messages = self.__listings.list_data_set(
+                data_set, generic, definition.attrib.get("volume")
+            )
+            return [self.__command(image, messages)]
+        if operation == "del":
+            image = f"DELDSD               ('{data_set}')"
+            if key not in data_sets:
+                return [
+                    self.__failed(image, [f"ICH09020I {data_set} NOT DEFINED TO RACF"])
+                ]
+            del data_sets[key]
+            return [self.__command(image)]
+        segments = self.__get_segment_traits(definition)
+        owner = self.__get_trait_value(segments.get("base", []), "owner")
+        if owner is not None and not self.database.is_defined(owner.upper()):
+            return [
+                self.__failed(
+                    f"ADDSD                ('{data_set}')",
+                    [f"ICH09006I USER OR GROUP {owner.upper():<8} NOT DEFINED TO RACF"],
+                )
+            ]
+        commands = self.__add_profile(
+            key in data_sets,
+            precheck,
+            definition_result,
+            f"ADDSD                ('{data_set}'){' GENERIC' if generic else ''}",
+            f"ICH09005I {data_set} ALREADY DEFINED TO RACF",
+        )
+        if key not in data_sets:
+            self.database.add_data_set(data_set, generic, {})
+            high_level_qualifier = data_set.split(".")[0]
+            if not self.database.is_defined(high_level_qualifier):
+                data_sets[key]["segments"]["base"]["owner"] = self.database.userid
+        if segments:
+            self.__apply_segment_traits(data_sets[key]["segments"], segments)
+            commands.append(
+                self.__command(
+                    f"ALTDSD               ('{data_set}')  "
+                    + self.__traits_image(segments.get("base", []))
+                )
+            )
+        return commands
+
+    def __process_resource(
+        self,
+        definition: Element,
+        operation: str,
+        precheck: bool,
+        definition_result: Element,
+    ) -> List[Element]:
+        """Process a general resource definition."""
+        resource = definition.attrib["name"].upper()
+        class_name = definition.attrib["class"].upper()
+        key = (class_name, resource)
+        resources = self.database.resources
+        if operation == "listdata":
+            image = f"RLIST   {class_name:<20} ({resource})"
+            if key not in resources:
+                return [self.__failed(image, [f"ICH13003I {resource} NOT FOUND"])]
+            messages = self.__listings.list_resource(resource, class_name)
+            return [self.__command(image, messages)]
+        if operation == "del":
+            image = f"RDELETE {class_name:<20} ({resource})"
+            if key not in resources:
+                return [
+                    self.__failed(
+                        image,
+                        [f"ICH12102I {resource} NOT DEFINED TO CLASS {class_name}."],
+                    )
+                ]
+            del resources[key]
+            return [self.__command(image)]
+        segments = self.__get_segment_traits(definition)
+        commands = self.__add_profile(
+            key in resources,
+            precheck,
+            definition_result,
+            f"RDEFINE {class_name:<20} ({resource})",
+            f"ICH10102I {resource} ALREADY DEFINED TO CLASS {class_name}.",
+        )
+        if key not in resources:
+            self.database.add_resource(resource, class_name, {})
+        if segments:
+            self.__apply_segment_traits(resources[key]["segments"], segments)
+            commands.append(
+                self.__command(
+                    f"RALTER  {class_name:<20} ({resource})  "
+                    + self.__segments_image(segments)
+                )
+            )
+        return commands
+
+    def __process_connection(
+        self, definition: Element, operation: str
+    ) -> List[Element]:
+        """Process a group connection definition."""
+        userid = definition.attrib["name"].upper()
+        group = definition.attrib["group"].upper()
+        traits = self.__get_traits(definition)
+        if operation == "del":
+            image = f"REMOVE  {userid}  GROUP       ({group})"
+            if (userid, group) not in self.database.connections:
+                return [
+                    self.__failed(
+                        image, [f"ICH03002I {userid:<8} WAS NOT CONNECTED TO GROUP."]
+                    )
+                ]
+            del self.database.connections[(userid, group)]
+            return [self.__command(image)]
+        image = f"CONNECT {userid}  GROUP       ({group}) {self.__traits_image(traits)}"
+        if userid not in self.database.users or group not in self.database.groups:
+            return [
+                self.__failed(
+                    image,
+                    [
+                        "ICH51003I NAME NOT FOUND IN RACF DATA SET",
+                        "ICH02003I USER(S) NOT CONNECTED.",
+                    ],
+                    8,
+                )
+            ]
+        connection = self.database.connect(userid, group, {})
+        self.__apply_traits(connection, traits)
+        return [self.__command(image)]
+
+    def __process_permission(
+        self, definition: Element, operation: str
+    ) -> List[Element]:
+        """Process a permission definition."""
+        name = definition.attrib["name"].upper()
+        class_name = definition.attrib["class"].upper()
+        generic = definition.attrib.get("generic") == "yes"
+        traits = self.__get_traits(definition)
+        auth_id = str(self.__get_trait_value(traits, "authid")).upper()
+        access = str(self.__get_trait_value(traits, "access") or "READ").upper()
+        image = f"PERMIT               {name} CLASS({class_name})  "
+        profile = self.database.get_access_list_profile(name, class_name, generic)
+        if operation == "del":
+            image += f"DELETE       ID          ({auth_id})"
+            if profile is None or auth_id not in profile["access_list"]:
+                return [
+                    self.__failed(
+                        image,
+                        [f"ICH06002I {auth_id:<8} NOT AUTHORIZED, DELETE IGNORED"],
+                    )
+                ]
+            del profile["access_list"][auth_id]
+            return [self.__command(image)]
+        image += f"ACCESS      ({access}) ID          ({auth_id})"
+        if profile is None:
+            return [self.__failed(image, [f"ICH06004I {name} NOT DEFINED TO RACF"], 8)]
+        if not self.database.is_defined(auth_id):
+            return [self.__failed(image, [f"ICH06007I {auth_id} NOT DEFINED TO RACF"])]
+        profile["access_list"][auth_id] = access
+        messages = []
+        if class_name != "DATASET":
+            messages.append(
+                f"ICH06011I RACLISTED PROFILES FOR {class_name} WILL NOT REFLECT "
+                + "THE UPDATE(S) UNTIL A SETROPTS REFRESH IS ISSUED"
+            )
+        return [self.__command(image, messages)]
+
+    def __add_profile(
+        self,
+        exists: bool,
+        precheck: bool,
+        definition_result: Element,
+        image: str,
+        already_defined_message: str,
+    ) -> List[Element]:
+        """
+        Build the result of the add command IRRSMO00 issues before altering a profile.
+        IRRSMO00 always tries to add the profile first unless the precheck option
+        is used and the profile already exists.
+        """
+        if exists and precheck:
+            XMLBuilder.SubElement(definition_result, "info").text = (
+                "Definition exists. Add command skipped due  to precheck option"
+            )
+            return []
+        if exists:
+            return [self.__failed(image, [already_defined_message], 8)]
+        return [self.__command(image)]
+
+    # ============================================================================
+    # Traits
+    # ============================================================================
+    def __get_requested_segments(self, definition: Element) -> List[str]:
+        """Get the segments requested by a profile extract."""
+        return [self.__local_name(segment.tag) for segment in definition]
+
+    def __get_segment_traits(
+        self, definition: Element
+    ) -> dict[str, List[Tuple[str, Union[str, None], Union[str, bool]]]]:
+        """Get the traits of each segment in a security definition."""
+        return {
+            self.__local_name(segment.tag): self.__get_traits(segment)
+            for segment in definition
+        }
+
+    def __get_traits(
+        self, element: Element
+    ) -> List[Tuple[str, Union[str, None], Union[str, bool]]]:
+        """Get '(trait, operation, value)' tuples for the traits in an element."""
+        return [
+            (
+                self.__local_name(trait.tag),
+                trait.attrib.get("operation"),
+                trait.text if trait.text is not None else True,
+            )
+            for trait in element
+        ]
+
+    def __get_trait_value(
+        self,
+        traits: List[Tuple[str, Union[str, None], Union[str, bool]]],
+        trait_name: str,
+    ) -> Union[str, bool, None]:
+        """Get the value of a trait."""
+        for trait, _, value in traits:
+            if trait == trait_name:
+                return value
+        return None
+
+    def __apply_segment_traits(self, profile_segments: dict, segments: dict) -> None:
+        """Apply the traits of each segment to the segments of a profile."""
+        for segment, traits in segments.items():
+            self.__apply_traits(profile_segments.setdefault(segment, {}), traits)
+
+    def __apply_traits(
+        self,
+        profile_traits: dict,
+        traits: List[Tuple[str, Union[str, None], Union[str, bool]]],
+    ) -> None:
+        """Apply '(trait, operation, value)' tuples to a profile dictionary."""
+        for trait, operation, value in traits:
+            if operation == "del":
+                profile_traits.pop(trait, None)
+            elif trait in self.__secret_traits:
+                profile_traits[trait] = True
+            elif trait in self.__list_traits:
+                values = [item.upper() for item in str(value).split()]
+                current_values = profile_traits.get(trait, [])
+                if operation == "remove":
+                    profile_traits[trait] = [
+                        item for item in current_values if item not in values
+                    ]
+                elif operation == "add":
+                    profile_traits[trait] = current_values + [
+                        item for item in values if item not in current_values
+                    ]
+                else:
+                    profile_traits[trait] = values
+            else:
+                profile_traits[trait] = value
+
+    # ============================================================================
+    # Command Images
+    # ============================================================================
+    def __segments_image(self, segments: dict) -> str:
+        """Build the keywords of a RACF command for the traits of each segment."""
+        keywords = []
+        for segment, traits in segments.items():
+            if not traits:
+                continue
+            if segment == "base":
+                keywords.append(self.__traits_image(traits))
+            else:
+                keywords.append(f"{segment.upper():<8} ({self.__traits_image(traits)})")
+        return " ".join(keywords)
+
+    def __traits_image(
+        self, traits: List[Tuple[str, Union[str, None], Union[str, bool]]]
+    ) -> str:
+        """Build the keywords of a RACF command for a list of traits."""
+        keywords = []
+        for trait, operation, value in traits:
+            keyword = self.__keywords.get(trait, trait.upper())
+            if operation in ("del", "remove"):
+                keyword = f"NO{keyword}"
+            if operation == "del" or value is True:
+                keywords.append(f"{keyword:<12} ")
+                continue
+            if trait in self.__secret_traits:
+                # Like IRRSMO00, never echo secrets in command images.
+                value = " " * len(str(value))
+            elif not re.fullmatch(r"[A-Za-z0-9@#$]+", str(value)) or trait == "name":
+                value = f"'{value}'"
+            keywords.append(f"{keyword:<12}({value}) ")
+        return "".join(keywords)
+
+    # ============================================================================
+    # Result XML
+    # ============================================================================
+    def __command(self, image: str, messages: List[Union[str, None]] = []) -> Element:
+        """Build the result of a RACF command that was successful."""
+        return self.__build_command(image, messages, (0, 0, 0))
+
+    def __failed(
+        self, image: str, messages: List[str], reason_code: int = 4
+    ) -> Element:
+        """Build the result of a RACF command that failed."""
+        return self.__build_command(image, messages, (8, 16, reason_code))
+
+    def __build_command(
+        self,
+        image: str,
+        messages: List[Union[str, None]],
+        return_codes: Tuple[int, int, int],
+    ) -> Element:
+        """Build the result of a RACF command."""
+        command = XMLBuilder.Element("command")
+        for tag, return_code in zip(
+            ["safreturncode", "returncode", "reasoncode"], return_codes
+        ):
+            XMLBuilder.SubElement(command, tag).text = str(return_code)
+        XMLBuilder.SubElement(command, "image").text = image
+        for message in messages:
+            command.append(self.__message(message))
+        return command
+
+    def __message(self, message: Union[str, None]) -> Element:
+        """Build a message element."""
+        message_element = XMLBuilder.Element("message")
+        message_element.text = message
+        return message_element
+
+    def __add_error(self, definition_result: Element, definition_tag: str) -> None:
+        """Add an IRRSMO00 error for a request that is not simulated."""
+        error = XMLBuilder.SubElement(definition_result, "error")
+        for tag, value in [
+            ("errorfunction", "10"),
+            ("errorcode", "2000"),
+            ("errorreason", "4"),
+            ("errormessage", "Request type is not supported by the RACF simulator."),
+            ("erroroffset", "0"),
+            ("textinerror", definition_tag),
+        ]:
+            XMLBuilder.SubElement(error, tag).text = value
+
+    def __local_name(self, tag: str) -> str:
+        """Remove the namespace from an XML tag."""
+        return tag.split("}")[-1]
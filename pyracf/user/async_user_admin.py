@@ -0,0 +1,11 @@
+"""Asynchronous User Administration."""
+
+from pyracf.common.async_security_admin import AsyncSecurityAdmin
+
+from .user_admin import UserAdmin
+
+
+class AsyncUserAdmin(AsyncSecurityAdmin):
+    """Asynchronous User Administration."""
+
+    _security_admin_class = UserAdmin
@@ -1,8 +1,12 @@
 """User Administration."""
 
-from typing import List, Union
+from typing import Any, Iterator, List, Tuple, Union
 
+from pyracf.common.profile_cache import ProfileCache
 from pyracf.common.security_admin import SecurityAdmin
+from pyracf.common.security_request_error import SecurityRequestError
+from pyracf.common.security_result_stream import SecurityResultStream
+from pyracf.common.transport import Transport
 
 from .user_request import UserRequest
 
@@ -10,6 +14,33 @@ from .user_request import UserRequest
 class UserAdmin(SecurityAdmin):
     """User Administration."""
 
+    # Extracted profile fields that traits can be compared with by 'apply()'.
+    __trait_profile_fields = {
+        "base:name": ("base", "name"),
+        "base:owner": ("base", "owner"),
+        "base:dfltgrp": ("base", "defaultGroup"),
+        "base:passint": ("base", "passwordInterval"),
+        "base:seclevel": ("base", "securityLevel"),
+        "base:seclabel": ("base", "securityLabel"),
+        "omvs:uid": ("omvs", "uid"),
+        "omvs:home": ("omvs", "home"),
+        "omvs:program": ("omvs", "program"),
+        "omvs:cputime": ("omvs", "cputimemax"),
+        "omvs:assize": ("omvs", "assizemax"),
+        "omvs:fileproc": ("omvs", "fileprocmax"),
+        "omvs:procuser": ("omvs", "procusermax"),
+        "omvs:threads": ("omvs", "threadsmax"),
+        "omvs:mmaparea": ("omvs", "mmapareamax"),
+    }
+    # Traits that RACF doesn't fold to upper case. Extracted profile data is lower
+    # case, so 'apply()' can't tell if their case changed and always alters them.
+    __case_sensitive_traits = frozenset({"omvs:home", "omvs:program"})
+    __trait_profile_attributes = {
+        "base:special": "special",
+        "base:operations": "operations",
+        "base:auditor": "auditor",
+    }
+
     def __init__(
         self,
         debug: bool = False,
@@ -17,6 +48,8 @@ class UserAdmin(SecurityAdmin):
         update_existing_segment_traits: Union[dict, None] = None,
         replace_existing_segment_traits: Union[dict, None] = None,
         additional_secret_traits: Union[List[str], None] = None,
+        transport: Union[Transport, None] = None,
+        profile_cache: Union[ProfileCache, None] = None,
     ) -> None:
         self._valid_segment_traits = {
             "base": {
@@ -217,6 +250,8 @@ class UserAdmin(SecurityAdmin):
             update_existing_segment_traits=update_existing_segment_traits,
             replace_existing_segment_traits=replace_existing_segment_traits,
             additional_secret_traits=additional_secret_traits,
+            transport=transport,
+            profile_cache=profile_cache,
         )
 
     # ============================================================================
@@ -225,6 +260,10 @@ class UserAdmin(SecurityAdmin):
     def has_special_authority(self, userid: str) -> Union[bool, bytes]:
         """Check if a user has RACF special authority."""
         profile = self.extract(userid, profile_only=True)
+        if not isinstance(profile, dict):
+            # Allows this function to work with "self.__generate_requests_only" mode
+            # and with requests that are queued in a batch.
+            return profile
         return "special" in profile["base"]["attributes"]
 
     def give_special_authority(self, userid: str) -> Union[dict, bytes]:
@@ -246,6 +285,10 @@ class UserAdmin(SecurityAdmin):
     def has_operations_authority(self, userid: str) -> Union[bool, bytes]:
         """Check if a user has operations authority."""
         profile = self.extract(userid, profile_only=True)
+        if not isinstance(profile, dict):
+            # Allows this function to work with "self.__generate_requests_only" mode
+            # and with requests that are queued in a batch.
+            return profile
         return "operations" in profile["base"]["attributes"]
 
     def give_operations_authority(self, userid: str) -> Union[dict, bytes]:
@@ -264,6 +307,10 @@ class UserAdmin(SecurityAdmin):
     def has_auditor_authority(self, userid: str) -> Union[bool, bytes]:
         """Check if a user has auditor authority."""
         profile = self.extract(userid, profile_only=True)
+        if not isinstance(profile, dict):
+            # Allows this function to work with "self.__generate_requests_only" mode
+            # and with requests that are queued in a batch.
+            return profile
         return "auditor" in profile["base"]["attributes"]
 
     def give_auditor_authority(self, userid: str) -> Union[dict, bytes]:
@@ -276,6 +323,21 @@ class UserAdmin(SecurityAdmin):
         result = self.alter(userid, traits={"base:auditor": False})
         return self._to_steps(result)
 
+    # ============================================================================
+    # Authorities
+    # ============================================================================
+    def get_authorities(self, userid: str) -> Union[dict, bytes]:
+        """Check which of special, operations and auditor authority a user has."""
+        profile = self.extract(userid, profile_only=True)
+        if not isinstance(profile, dict):
+            # Allows this function to work with "self.__generate_requests_only" mode.
+            return profile
+        attributes = profile["base"]["attributes"] or []
+        return {
+            authority: authority in attributes
+            for authority in ["special", "operations", "auditor"]
+        }
+
     # ============================================================================
     # Password
     # ============================================================================
@@ -310,15 +372,35 @@ class UserAdmin(SecurityAdmin):
 
     def set_class_authorizations(
         self, userid: str, class_authorizations: List[str]
-    ) -> Union[dict, bytes]:
+    ) -> Union[dict, bool, bytes]:
         """
         Set a user's class authorizations.
-        removes the user's current class authorizations and then recreates
-        the class authorizations list using the list that the user provides.
+        Adds and removes only the class authorizations that differ from the user's
+        current class authorizations using a single request.
+        'False' is returned if the class authorizations are already the same.
         """
-        delete_result = self.delete_all_class_authorizations(userid)
-        add_result = self.add_class_authorizations(userid, class_authorizations)
-        return self._to_steps([delete_result, add_result])
+        self._check_batch_is_not_active("set_class_authorizations")
+        current_class_authorizations = self.get_class_authorizations(userid)
+        if isinstance(current_class_authorizations, bytes):
+            # Allows this function to work with "self.__generate_requests_only" mode.
+            return self._to_steps(
+                [
+                    current_class_authorizations,
+                    self.alter(
+                        userid,
+                        traits={"add:base:class_authorizations": class_authorizations},
+                    ),
+                ]
+            )
+        traits = self._build_list_trait_changes(
+            "base:class_authorizations",
+            current_class_authorizations or [],
+            class_authorizations,
+        )
+        if not traits:
+            return False
+        result = self.alter(userid, traits=traits)
+        return self._to_steps(result)
 
     def add_class_authorizations(
         self, userid: str, class_authorizations: Union[str, List[str]]
@@ -340,6 +422,7 @@ class UserAdmin(SecurityAdmin):
 
     def delete_all_class_authorizations(self, userid: str) -> Union[dict, bool, bytes]:
         """Delete all classes from a users class authorizations."""
+        self._check_batch_is_not_active("delete_all_class_authorizations")
         current_class_authorizations = self.get_class_authorizations(userid)
         if not current_class_authorizations:
             return False
@@ -392,20 +475,85 @@ class UserAdmin(SecurityAdmin):
         result = self.alter(userid, traits={"omvs:program": program})
         return self._to_steps(result)
 
+    # ============================================================================
+    # Multiple Fields
+    # ============================================================================
+    def get_fields(self, userid: str, fields: List[str]) -> Union[dict, bytes]:
+        """Get several fields (i.e., 'omvs:uid') of a user's profile with one extract."""
+        return self._get_fields(
+            lambda segments: self.extract(userid, segments=segments, profile_only=True),
+            fields,
+        )
+
+    # ============================================================================
+    # Desired State
+    # ============================================================================
+    def apply(self, userid: str, desired_traits: dict) -> Union[dict, bool, bytes]:
+        """
+        Make a user's profile match the desired traits.
+        The user's profile is extracted once, and one alter is made with only the
+        traits that differ from the profile. 'False' is returned if nothing differs.
+        Traits that can't be compared with the extracted profile (i.e., passwords)
+        are always altered. Extracted profile data is lower case, so case sensitive
+        traits (i.e., 'omvs:home') are always altered, and the values of other
+        traits are considered to be the same if they only differ by case.
+        """
+        self._check_batch_is_not_active("apply")
+        segments = {
+            self.__trait_profile_fields[trait][0]: True
+            for trait in desired_traits
+            if trait in self.__trait_profile_fields
+        }
+        segments.pop("base", None)
+        profile = self.extract(userid, segments=segments, profile_only=True)
+        if not isinstance(profile, dict):
+            # Allows this function to work with "self.__generate_requests_only" mode.
+            return self._to_steps([profile, self.alter(userid, desired_traits)])
+        changed_traits = {
+            trait: value
+            for trait, value in desired_traits.items()
+            if not self.__trait_matches_profile(profile, trait, value)
+        }
+        if not changed_traits:
+            return False
+        result = self.alter(userid, traits=changed_traits)
+        return self._to_steps(result)
+
+    def __trait_matches_profile(self, profile: dict, trait: str, value: Any) -> bool:
+        """Check if a trait already has the desired value in an extracted profile."""
+        if trait in self.__trait_profile_attributes:
+            attributes = self._get_field(profile, "base", "attributes") or []
+            has_attribute = self.__trait_profile_attributes[trait] in attributes
+            return isinstance(value, bool) and value == has_attribute
+        if trait not in self.__trait_profile_fields:
+            return False
+        segment, field = self.__trait_profile_fields[trait]
+        if segment not in profile:
+            return False
+        current_value = profile[segment].get(field)
+        if value is False or value is None:
+            # Traits are deleted using 'False', which RACF lists as 'NONE'.
+            return current_value is None
+        if isinstance(value, bool) or current_value is None:
+            return False
+        if trait in self.__case_sensitive_traits:
+            return False
+        return str(value).lower() == str(current_value).lower()
+
     # ============================================================================
     # Base Functions
     # ============================================================================
     def add(self, userid: str, traits: dict = {}) -> Union[dict, bytes]:
         """Create a new user."""
-        self._build_segment_dictionaries(traits)
         user_request = UserRequest(userid, "set")
+        self._build_segment_dictionaries(user_request, traits)
         self._build_xml_segments(user_request)
         return self._make_request(user_request)
 
     def alter(self, userid: str, traits: dict = {}) -> Union[dict, bytes]:
         """Alter an existing user."""
-        self._build_segment_dictionaries(traits)
         user_request = UserRequest(userid, "set")
+        self._build_segment_dictionaries(user_request, traits)
         self._build_xml_segments(user_request, alter=True)
         return self._make_request(user_request, irrsmo00_precheck=True)
 
@@ -413,14 +561,42 @@ class UserAdmin(SecurityAdmin):
         self, userid: str, segments: dict = {}, profile_only: bool = False
     ) -> Union[dict, bytes]:
         """Extract a user's profile."""
-        self._build_bool_segment_dictionaries(segments)
         user_request = UserRequest(userid, "listdata")
+        self._build_bool_segment_dictionaries(user_request, segments)
         self._build_xml_segments(user_request, extract=True)
         result = self._extract_and_check_result(user_request)
         if profile_only:
             return self._get_profile(result)
         return result
 
+    def extract_stream(
+        self, userid: str, segments: dict = {}
+    ) -> Union[SecurityResultStream, bytes]:
+        """
+        Extract a user's profile as a stream of result events, so that the messages
+        of very large profiles can be processed with bounded memory.
+        """
+        user_request = UserRequest(userid, "listdata")
+        self._build_bool_segment_dictionaries(user_request, segments)
+        self._build_xml_segments(user_request, extract=True)
+        return self._stream_extract(user_request, "extract_stream")
+
+    def extract_many(
+        self,
+        userids: List[str],
+        segments: dict = {},
+        profile_only: bool = False,
+        max_workers: Union[int, None] = None,
+    ) -> Iterator[Tuple[str, Union[dict, bytes, SecurityRequestError]]]:
+        """Extract many users' profiles concurrently."""
+        return self._extract_many(
+            userids,
+            lambda userid: self.extract(
+                userid, segments=segments, profile_only=profile_only
+            ),
+            max_workers=max_workers,
+        )
+
     def delete(self, userid: str) -> Union[dict, bytes]:
         """Delete a user."""
         user_request = UserRequest(userid, "del")
@@ -1,5 +1,7 @@
 """User Administration Request Builder."""
 
+from typing import List
+
 from pyracf.common.security_request import SecurityRequest
 
 
@@ -14,3 +16,22 @@ class UserRequest(SecurityRequest):
             "operation": operation,
             "requestid": "UserRequest",
         }
+
+    def _get_affected_profile_keys(self) -> List[tuple]:
+        """
+        Creating a user also connects it to its default group, which is the issuer's
+        current connect group unless one is given. Deleting a user also removes it
+        from the profiles of every group it is connected to, which can't be known
+        without extracting the user first.
+        """
+        profile_keys = super()._get_affected_profile_keys()
+        operation = self._security_definition.attrib["operation"]
+        if operation == "set" and not self._alter:
+            default_group = self._get_trait_value("base", "base:dfltgrp")
+            if default_group:
+                profile_keys.append(("group", default_group.upper()))
+            else:
+                profile_keys.append(("group",))
+        elif operation == "del":
+            profile_keys.append(("group",))
+        return profile_keys
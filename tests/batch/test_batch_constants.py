@@ -0,0 +1,52 @@
+"""
+Sample data for testing batched requests.
+"""
+
+from typing import Union
+
+import tests.test_utilities as TestUtilities
+
+
+def get_sample(sample_file: str) -> Union[str, bytes]:
+    return TestUtilities.get_sample(sample_file, "batch")
+
+
+# ============================================================================
+# Batch Result Sample Data
+# ============================================================================
+
+# Add User, Group & Connection
+TEST_ADD_USER_GROUP_AND_CONNECTION_BATCH_RESULT_SUCCESS_XML = get_sample(
+    "add_user_group_and_connection_batch_result_success.xml"
+)
+TEST_ADD_USER_GROUP_AND_CONNECTION_BATCH_RESULT_SUCCESS_DICTIONARY = get_sample(
+    "add_user_group_and_connection_batch_result_success.json"
+)
+TEST_ADD_USER_GROUP_AND_CONNECTION_BATCH_RESULT_ERROR_XML = get_sample(
+    "add_user_group_and_connection_batch_result_error.xml"
+)
+TEST_ADD_USER_GROUP_AND_CONNECTION_BATCH_RESULT_ERROR_DICTIONARY = get_sample(
+    "add_user_group_and_connection_batch_result_error.json"
+)
+TEST_ADD_USER_GROUP_AND_CONNECTION_BATCH_RESULT_REQUEST_ERROR_XML = get_sample(
+    "add_user_group_and_connection_batch_result_request_error.xml"
+)
+
+# Extract Users
+TEST_EXTRACT_USERS_BATCH_RESULT_SUCCESS_XML = get_sample(
+    "extract_users_batch_result_success.xml"
+)
+
+# ============================================================================
+# Batch Request Sample Data
+# ============================================================================
+
+# Add User, Group & Connection
+TEST_ADD_USER_GROUP_AND_CONNECTION_REQUEST_XML = get_sample(
+    "add_user_group_and_connection_request.xml"
+)
+TEST_ADD_USER_REQUEST_TRAITS = {
+    "base:name": "Squidward",
+    "base:owner": "leonard",
+}
+TEST_ADD_GROUP_REQUEST_TRAITS = {"omvs:gid": 6667}
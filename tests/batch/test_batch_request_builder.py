@@ -0,0 +1,126 @@
+"""Test batched request builder."""
+
+import unittest
+from unittest.mock import Mock, patch
+
+import __init__
+
+import tests.batch.test_batch_constants as TestBatchConstants
+import tests.test_utilities as TestUtilities
+from pyracf import ConnectionAdmin, GroupAdmin, SecurityBatch, UserAdmin
+from pyracf.common.irrsmo00 import IRRSMO00
+
+# Resolves F401
+__init__
+
+
+@patch("pyracf.common.irrsmo00.IRRSMO00.call_racf")
+class TestBatchRequestBuilder(unittest.TestCase):
+    maxDiff = None
+    IRRSMO00.__init__ = Mock(return_value=None)
+    user_admin = UserAdmin()
+    group_admin = GroupAdmin()
+    connection_admin = ConnectionAdmin()
+
+    def test_batch_builds_one_request_for_multiple_definitions(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestBatchConstants.TEST_ADD_USER_GROUP_AND_CONNECTION_BATCH_RESULT_SUCCESS_XML
+        )
+        batch = SecurityBatch()
+        with batch:
+            self.user_admin.add(
+                "squidwrd", traits=TestBatchConstants.TEST_ADD_USER_REQUEST_TRAITS
+            )
+            self.group_admin.add(
+                "TESTGRP0", traits=TestBatchConstants.TEST_ADD_GROUP_REQUEST_TRAITS
+            )
+            self.connection_admin.add("squidwrd", "TESTGRP0")
+        call_racf_mock.assert_not_called()
+        self.assertEqual(len(batch), 3)
+        batch.submit()
+        call_racf_mock.assert_called_once()
+        request_xml, irrsmo00_precheck = call_racf_mock.call_args.args
+        self.assertEqual(
+            TestUtilities.minify_xml(request_xml),
+            TestBatchConstants.TEST_ADD_USER_GROUP_AND_CONNECTION_REQUEST_XML,
+        )
+        self.assertFalse(irrsmo00_precheck)
+        self.assertEqual(len(batch), 0)
+
+    def test_batch_splits_requests_with_different_precheck_settings(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestBatchConstants.TEST_ADD_USER_GROUP_AND_CONNECTION_BATCH_RESULT_SUCCESS_XML
+        )
+        batch = SecurityBatch()
+        with batch:
+            self.user_admin.add("squidwrd")
+            self.user_admin.add("eswift")
+            self.user_admin.alter("squidwrd", traits={"base:special": True})
+            self.user_admin.delete("eswift")
+        with patch(
+            "pyracf.common.security_result.SecurityResult.get_definition_result_dictionaries"
+        ) as get_definition_result_dictionaries_mock:
+            get_definition_result_dictionaries_mock.return_value = []
+            batch.submit()
+        self.assertEqual(
+            [call.args[1] for call in call_racf_mock.call_args_list],
+            [False, True, False],
+        )
+
+    def test_batch_does_not_queue_requests_outside_of_with_block(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestBatchConstants.TEST_ADD_USER_GROUP_AND_CONNECTION_BATCH_RESULT_SUCCESS_XML
+        )
+        batch = SecurityBatch()
+        with batch:
+            pass
+        self.user_admin.add("squidwrd")
+        call_racf_mock.assert_called_once()
+        self.assertEqual(len(batch), 0)
+
+    def test_batch_queues_setters_and_getters(
+        self,
+        call_racf_mock: Mock,
+    ):
+        batch = SecurityBatch()
+        with batch:
+            self.assertIsNone(self.user_admin.set_omvs_uid("squidwrd", 2424))
+            self.assertIsNone(self.user_admin.give_special_authority("squidwrd"))
+            self.assertIsNone(self.user_admin.get_omvs_uid("squidwrd"))
+            self.assertIsNone(self.user_admin.get_class_authorizations("squidwrd"))
+            self.assertIsNone(self.user_admin.has_special_authority("squidwrd"))
+            self.assertIsNone(
+                self.user_admin.get_fields("squidwrd", ["omvs:uid", "omvs:home"])
+            )
+            self.assertIsNone(
+                self.group_admin.has_group_special_authority("TESTGRP0", "squidwrd")
+            )
+        call_racf_mock.assert_not_called()
+        self.assertEqual(len(batch), 7)
+
+    def test_batch_does_not_queue_functions_that_need_an_extract_result(
+        self,
+        call_racf_mock: Mock,
+    ):
+        batch = SecurityBatch()
+        with batch:
+            for function in [
+                lambda: self.user_admin.set_class_authorizations(
+                    "squidwrd", ["elijtest"]
+                ),
+                lambda: self.user_admin.delete_all_class_authorizations("squidwrd"),
+                lambda: self.user_admin.apply("squidwrd", {"omvs:uid": 2424}),
+            ]:
+                with self.assertRaises(RuntimeError):
+                    function()
+        call_racf_mock.assert_not_called()
+        self.assertEqual(len(batch), 0)
@@ -0,0 +1,155 @@
+"""Test batched result parser."""
+
+import contextlib
+import io
+import unittest
+from unittest.mock import Mock, patch
+
+import __init__
+
+import tests.batch.test_batch_constants as TestBatchConstants
+import tests.user.test_user_constants as TestUserConstants
+from pyracf import (
+    ConnectionAdmin,
+    GroupAdmin,
+    SecurityBatch,
+    SecurityRequestError,
+    UserAdmin,
+)
+from pyracf.common.irrsmo00 import IRRSMO00
+
+# Resolves F401
+__init__
+
+
+@patch("pyracf.common.irrsmo00.IRRSMO00.call_racf")
+class TestBatchResultParser(unittest.TestCase):
+    maxDiff = None
+    IRRSMO00.__init__ = Mock(return_value=None)
+    user_admin = UserAdmin()
+    group_admin = GroupAdmin()
+    connection_admin = ConnectionAdmin()
+
+    def __queue_add_user_group_and_connection(self, batch: SecurityBatch):
+        with batch:
+            self.user_admin.add(
+                "squidwrd", traits=TestBatchConstants.TEST_ADD_USER_REQUEST_TRAITS
+            )
+            self.group_admin.add(
+                "TESTGRP0", traits=TestBatchConstants.TEST_ADD_GROUP_REQUEST_TRAITS
+            )
+            self.connection_admin.add("squidwrd", "TESTGRP0")
+
+    def test_batch_can_parse_add_user_group_and_connection_success_xml(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestBatchConstants.TEST_ADD_USER_GROUP_AND_CONNECTION_BATCH_RESULT_SUCCESS_XML
+        )
+        batch = SecurityBatch()
+        self.__queue_add_user_group_and_connection(batch)
+        self.assertEqual(
+            batch.submit(),
+            TestBatchConstants.TEST_ADD_USER_GROUP_AND_CONNECTION_BATCH_RESULT_SUCCESS_DICTIONARY,
+        )
+
+    def test_batch_can_parse_add_user_group_and_connection_error_xml(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestBatchConstants.TEST_ADD_USER_GROUP_AND_CONNECTION_BATCH_RESULT_ERROR_XML
+        )
+        batch = SecurityBatch()
+        self.__queue_add_user_group_and_connection(batch)
+        with self.assertRaises(SecurityRequestError) as exception:
+            batch.submit()
+        self.assertEqual(
+            exception.exception.result,
+            TestBatchConstants.TEST_ADD_USER_GROUP_AND_CONNECTION_BATCH_RESULT_ERROR_DICTIONARY,
+        )
+
+    def test_batch_reports_definitions_without_results_as_failed(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestBatchConstants.TEST_ADD_USER_GROUP_AND_CONNECTION_BATCH_RESULT_REQUEST_ERROR_XML
+        )
+        batch = SecurityBatch()
+        self.__queue_add_user_group_and_connection(batch)
+        with self.assertRaises(SecurityRequestError) as exception:
+            batch.submit()
+        result = exception.exception.result
+        self.assertEqual(list(result), ["step1", "step2", "step3"])
+        self.assertEqual(
+            result["step3"],
+            {
+                "securityResult": {
+                    "groupConnection": {
+                        "name": "squidwrd",
+                        "group": "TESTGRP0",
+                        "operation": "set",
+                        "requestId": "ConnectionRequest",
+                        "error": {
+                            "errorMessage": (
+                                "IRRSMO00 did not return a result for this definition."
+                            )
+                        },
+                    },
+                    "returnCode": 2000,
+                    "reasonCode": 20,
+                }
+            },
+        )
+
+    def test_batch_logs_results_when_debug_logging_is_enabled(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestBatchConstants.TEST_ADD_USER_GROUP_AND_CONNECTION_BATCH_RESULT_SUCCESS_XML
+        )
+        batch = SecurityBatch()
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            with batch:
+                UserAdmin(debug=True).add(
+                    "squidwrd", traits=TestBatchConstants.TEST_ADD_USER_REQUEST_TRAITS
+                )
+                self.group_admin.add(
+                    "TESTGRP0", traits=TestBatchConstants.TEST_ADD_GROUP_REQUEST_TRAITS
+                )
+            batch.submit()
+        self.assertFalse(call_racf_mock.call_args.kwargs["zero_copy"])
+        log = stdout.getvalue()
+        self.assertEqual(log.count("Request XML"), 1)
+        self.assertEqual(log.count("Result XML"), 1)
+        self.assertIn("ADDGROUP TESTGRP0", log)
+        self.assertEqual(log.count("Result Dictionary"), 1)
+
+    def test_batch_formats_extracted_profiles(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestBatchConstants.TEST_EXTRACT_USERS_BATCH_RESULT_SUCCESS_XML
+        )
+        batch = SecurityBatch()
+        with batch:
+            self.assertIsNone(
+                self.user_admin.extract(
+                    "squidwrd", segments={"omvs": True}, profile_only=True
+                )
+            )
+            self.user_admin.extract("squidwrd", segments={"omvs": True})
+        result = batch.submit()
+        call_racf_mock.assert_called_once()
+        self.assertEqual(
+            result,
+            {
+                "step1": TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_DICTIONARY,
+                "step2": TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_DICTIONARY,
+            },
+        )
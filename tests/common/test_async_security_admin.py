@@ -0,0 +1,155 @@
+"""Test asyncio security admin interface."""
+
+import asyncio
+import threading
+import unittest
+from typing import Iterator
+from unittest.mock import Mock, patch
+
+import __init__
+
+import tests.resource.test_resource_constants as TestResourceConstants
+import tests.setropts.test_setropts_constants as TestSetroptsConstants
+import tests.user.test_user_constants as TestUserConstants
+from pyracf import (
+    AsyncAccessAdmin,
+    AsyncResourceAdmin,
+    AsyncSetroptsAdmin,
+    AsyncUserAdmin,
+    SecurityRequestError,
+    SecurityResultStream,
+)
+from pyracf.common.irrsmo00 import IRRSMO00
+
+# Resolves F401
+__init__
+
+
+@patch("pyracf.common.irrsmo00.IRRSMO00.call_racf")
+class TestAsyncSecurityAdmin(unittest.IsolatedAsyncioTestCase):
+    maxDiff = None
+    IRRSMO00.__init__ = Mock(return_value=None)
+    user_admin = AsyncUserAdmin()
+    resource_admin = AsyncResourceAdmin()
+
+    async def test_async_user_admin_can_extract_user(self, call_racf_mock: Mock):
+        call_racf_mock.return_value = (
+            TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_XML
+        )
+        self.assertEqual(
+            await self.user_admin.extract("squidwrd", segments={"omvs": True}),
+            TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_DICTIONARY,
+        )
+
+    async def test_async_user_admin_calls_racf_off_the_event_loop(
+        self, call_racf_mock: Mock
+    ):
+        call_racf_threads = []
+
+        def call_racf(*_, **__) -> str:
+            call_racf_threads.append(threading.get_ident())
+            return TestUserConstants.TEST_ALTER_USER_RESULT_SUCCESS_XML
+
+        call_racf_mock.side_effect = call_racf
+        await self.user_admin.alter(
+            "squidwrd", traits=TestUserConstants.TEST_ALTER_USER_REQUEST_TRAITS
+        )
+        self.assertEqual(len(call_racf_threads), 1)
+        self.assertNotEqual(call_racf_threads[0], threading.get_ident())
+
+    async def test_async_user_admin_streams_extract_off_the_event_loop(
+        self, call_racf_mock: Mock
+    ):
+        result_xml = TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_XML
+        call_racf_threads = []
+
+        def call_racf_chunks(*_, **__) -> Iterator[str]:
+            for offset in range(0, len(result_xml), 1000):
+                call_racf_threads.append(threading.get_ident())
+                yield result_xml[offset : offset + 1000]
+
+        with patch.object(
+            IRRSMO00, "call_racf_chunks", side_effect=call_racf_chunks
+        ) as call_racf_chunks_mock:
+            stream = await self.user_admin.extract_stream(
+                "squidwrd", segments={"omvs": True}
+            )
+            call_racf_chunks_mock.assert_not_called()
+            events = [event async for event in stream]
+        self.assertEqual(events, list(SecurityResultStream(result_xml)))
+        self.assertGreater(len(call_racf_threads), 1)
+        self.assertNotIn(threading.get_ident(), call_racf_threads)
+        call_racf_mock.assert_not_called()
+
+    async def test_async_user_admin_raises_security_request_error(
+        self, call_racf_mock: Mock
+    ):
+        call_racf_mock.return_value = (
+            TestUserConstants.TEST_ALTER_USER_RESULT_ERROR_XML
+        )
+        with self.assertRaises(SecurityRequestError) as exception:
+            await self.user_admin.alter(
+                "squidwrd", traits=TestUserConstants.TEST_ALTER_USER_REQUEST_TRAITS
+            )
+        self.assertEqual(
+            exception.exception.result,
+            TestUserConstants.TEST_ALTER_USER_RESULT_ERROR_DICTIONARY,
+        )
+
+    async def test_async_user_admin_concurrent_requests_do_not_share_state(
+        self, call_racf_mock: Mock
+    ):
+        call_racf_mock.return_value = (
+            TestUserConstants.TEST_ALTER_USER_RESULT_SUCCESS_XML
+        )
+        await asyncio.gather(
+            *[self.user_admin.set_omvs_uid("squidwrd", uid) for uid in range(8)]
+        )
+        for call in call_racf_mock.call_args_list:
+            self.assertEqual(call.args[0].count(b"<uid"), 1)
+
+    async def test_async_setropts_admin_can_reuse_snapshot(self, call_racf_mock: Mock):
+        call_racf_mock.return_value = (
+            TestSetroptsConstants.TEST_LIST_SETROPTS_RESULT_SUCCESS_XML
+        )
+        setropts_admin = AsyncSetroptsAdmin(snapshot_ttl=60)
+        self.assertEqual(
+            await setropts_admin.get_class_attributes("FACILITY"),
+            TestSetroptsConstants.TEST_SETROPTS_CLASS_ATTRIBUTES,
+        )
+        self.assertEqual(
+            await setropts_admin.get_password_rules(),
+            TestSetroptsConstants.TEST_SETROPTS_PASSWORD_RULES,
+        )
+        call_racf_mock.assert_called_once()
+
+    async def test_async_resource_admin_extract_many_reports_each_resource(
+        self, call_racf_mock: Mock
+    ):
+        def call_racf(request_xml: bytes, *_, **__) -> str:
+            if b'name="TESTING"' in request_xml:
+                return (
+                    TestResourceConstants.TEST_EXTRACT_RESOURCE_RESULT_BASE_SUCCESS_XML
+                )
+            return TestResourceConstants.TEST_EXTRACT_RESOURCE_RESULT_BASE_ERROR_XML
+
+        call_racf_mock.side_effect = call_racf
+        results = {
+            resource: result
+            async for resource, result in self.resource_admin.extract_many(
+                ["TESTING", "MISSING"], "ELIJTEST"
+            )
+        }
+        self.assertEqual(
+            results["TESTING"],
+            TestResourceConstants.TEST_EXTRACT_RESOURCE_RESULT_BASE_SUCCESS_DICTIONARY,
+        )
+        self.assertIsInstance(results["MISSING"], SecurityRequestError)
+
+    async def test_async_access_admin_does_not_have_extract_many(
+        self, call_racf_mock: Mock
+    ):
+        with self.assertRaises(AttributeError):
+            async for _ in AsyncAccessAdmin().extract_many(["TESTING"], "ELIJTEST"):
+                pass
+        call_racf_mock.assert_not_called()
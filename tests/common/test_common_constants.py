@@ -0,0 +1,29 @@
+"""
+Shared setup for testing common functions against the RACF simulator.
+"""
+
+from typing import Callable, Tuple, Union
+from unittest.mock import Mock
+
+from pyracf import RACFSimulator
+
+
+def get_racf_simulator(
+    before_call_racf: Union[Callable[[], None], None] = None,
+) -> Tuple[RACFSimulator, Mock]:
+    """
+    Get a RACF simulator whose 'call_racf()' is replaced by a mock, so that tests
+    can count the requests that reach the simulator. 'before_call_racf' is called
+    before each request is passed on to the simulator (i.e., to hold requests).
+    """
+    racf_simulator = RACFSimulator()
+    racf_simulator_call_racf = racf_simulator.call_racf
+
+    def call_racf(*args, **kwargs) -> Union[str, bytes]:
+        if before_call_racf is not None:
+            before_call_racf()
+        return racf_simulator_call_racf(*args, **kwargs)
+
+    call_racf_mock = Mock(side_effect=call_racf)
+    racf_simulator.call_racf = call_racf_mock
+    return (racf_simulator, call_racf_mock)
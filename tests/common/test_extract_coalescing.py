@@ -0,0 +1,126 @@
+"""Test coalescing of concurrent identical profile extracts."""
+
+import threading
+import time
+import unittest
+
+import __init__
+
+import tests.common.test_common_constants as TestCommonConstants
+from pyracf import (
+    ConnectionAdmin,
+    GroupAdmin,
+    SecurityRequestError,
+    UserAdmin,
+)
+
+# Resolves F401
+__init__
+
+
+class TestExtractCoalescing(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self) -> None:
+        self.release = threading.Event()
+        self.release.set()
+        # Hold every request until the test releases them.
+        (racf_simulator, self.call_racf_mock) = TestCommonConstants.get_racf_simulator(
+            self.release.wait
+        )
+        self.racf_simulator = racf_simulator
+        self.group_admin = GroupAdmin(transport=racf_simulator)
+        self.group_admin.add("testgrp0")
+        UserAdmin(transport=racf_simulator).add("squidwrd")
+        ConnectionAdmin(transport=racf_simulator).add(
+            "squidwrd", "testgrp0", traits={"base:group_access": True}
+        )
+        self.call_racf_mock.reset_mock()
+
+    def __run_concurrently(self, function, count: int = 20) -> list:
+        """Call a function from many threads at once while requests are held."""
+        results = [None] * count
+
+        def run(index: int) -> None:
+            try:
+                results[index] = function()
+            except SecurityRequestError as security_request_error:
+                results[index] = security_request_error
+
+        self.release.clear()
+        threads = [
+            threading.Thread(target=run, args=(index,)) for index in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        # Give every thread time to join the in-flight extract.
+        time.sleep(0.2)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        return results
+
+    # ============================================================================
+    # Coalesced Extracts
+    # ============================================================================
+    def test_concurrent_identical_extracts_share_one_request(self):
+        results = self.__run_concurrently(
+            lambda: self.group_admin.has_group_access_attribute("testgrp0", "squidwrd")
+        )
+        self.assertEqual(results, [True] * 20)
+        self.assertEqual(self.call_racf_mock.call_count, 1)
+
+    def test_concurrent_identical_extracts_get_independent_copies(self):
+        results = self.__run_concurrently(
+            lambda: self.group_admin.extract("testgrp0", profile_only=True)
+        )
+        results[0]["base"]["owner"] = "changed"
+        self.assertEqual(results[1], results[2])
+        self.assertNotEqual(results[0], results[1])
+        self.assertEqual(len({id(result) for result in results}), 20)
+
+    def test_concurrent_extracts_of_different_profiles_are_not_shared(self):
+        self.group_admin.add("testgrp1")
+        self.call_racf_mock.reset_mock()
+        groups = ["testgrp0", "testgrp1"]
+        self.__run_concurrently(lambda: self.group_admin.extract(groups.pop()), count=2)
+        self.assertEqual(self.call_racf_mock.call_count, 2)
+
+    def test_concurrent_extracts_of_different_segments_are_not_shared(self):
+        segments = [{}, {"omvs": True}]
+        self.__run_concurrently(
+            lambda: self.group_admin.extract("testgrp0", segments=segments.pop()),
+            count=2,
+        )
+        self.assertEqual(self.call_racf_mock.call_count, 2)
+
+    def test_concurrent_failed_extracts_each_get_an_error(self):
+        results = self.__run_concurrently(lambda: self.group_admin.extract("nogroup"))
+        self.assertEqual(self.call_racf_mock.call_count, 1)
+        for result in results:
+            self.assertIsInstance(result, SecurityRequestError)
+        self.assertEqual(len({id(result) for result in results}), 20)
+
+    def test_extracts_are_not_shared_after_they_complete(self):
+        self.group_admin.extract("testgrp0")
+        self.group_admin.extract("testgrp0")
+        self.assertEqual(self.call_racf_mock.call_count, 2)
+
+    def test_extracts_made_after_a_change_do_not_join_earlier_extracts(self):
+        self.release.clear()
+        threads = [
+            threading.Thread(target=self.group_admin.extract, args=("testgrp0",)),
+            threading.Thread(
+                target=self.group_admin.alter,
+                args=("testgrp0",),
+                kwargs={"traits": {"omvs:gid": 1234}},
+            ),
+            threading.Thread(target=self.group_admin.extract, args=("testgrp0",)),
+        ]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.1)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.call_racf_mock.call_count, 3)
@@ -0,0 +1,191 @@
+"""Test IRRSMO00 interface."""
+
+import threading
+import unittest
+from typing import List, Union
+from unittest.mock import Mock, patch
+
+import __init__
+
+from pyracf.common.irrsmo00 import IRRSMO00
+
+# Resolves F401
+__init__
+
+
+@patch("pyracf.common.irrsmo00.call_irrsmo00")
+class TestIRRSMO00(unittest.TestCase):
+    maxDiff = None
+    request_xml = b"<securityrequest />"
+    request_handle = b"\x01" + bytes(63)
+
+    def setUp(self):
+        # Other test classes replace 'IRRSMO00.__init__' with a mock.
+        self.irrsmo00 = IRRSMO00()
+        self.irrsmo00.buffer_size = 100000
+        self.irrsmo00.max_continuations = 3
+        self.irrsmo00._IRRSMO00__response_buffers = threading.local()
+
+    def __responses(
+        self, *responses: List[str], return_codes: Union[List[list], None] = None
+    ):
+        """
+        Build a 'call_irrsmo00' side effect that writes each response in turn,
+        returning a non-zero request handle until the last response is written.
+        Return codes are returned for each response in turn, defaulting to zeros.
+        """
+        responses = list(responses)
+        return_codes = list(return_codes or [])
+
+        def call_irrsmo00(rsp_buffer: bytearray, **_) -> dict:
+            response = responses.pop(0).encode("utf-8")
+            rsp_buffer[: len(response)] = response
+            return {
+                "responseLength": len(response),
+                "requestHandle": self.request_handle if responses else bytes(64),
+                "returnCodes": return_codes.pop(0) if return_codes else [0, 0, 0],
+            }
+
+        return call_irrsmo00
+
+    def test_irrsmo00_call_racf_single_response(self, call_irrsmo00_mock: Mock):
+        call_irrsmo00_mock.side_effect = self.__responses("<securityresult />")
+        self.assertEqual(
+            self.irrsmo00.call_racf(self.request_xml), "<securityresult />"
+        )
+        call_irrsmo00_mock.assert_called_once_with(
+            xml_str=self.request_xml,
+            xml_len=len(self.request_xml),
+            opts=9,
+            req_handle=bytes(64),
+            rsp_buffer=call_irrsmo00_mock.call_args.kwargs["rsp_buffer"],
+        )
+
+    def test_irrsmo00_call_racf_uses_precheck_option(self, call_irrsmo00_mock: Mock):
+        call_irrsmo00_mock.side_effect = self.__responses("<securityresult />")
+        self.irrsmo00.call_racf(self.request_xml, precheck=True)
+        self.assertEqual(call_irrsmo00_mock.call_args.kwargs["opts"], 11)
+
+    def test_irrsmo00_call_racf_continues_partial_responses(
+        self, call_irrsmo00_mock: Mock
+    ):
+        call_irrsmo00_mock.side_effect = self.__responses(
+            "<securityresult>", "<returncode>0</returncode>", "</securityresult>"
+        )
+        self.assertEqual(
+            list(self.irrsmo00.call_racf_chunks(self.request_xml)),
+            ["<securityresult>", "<returncode>0</returncode>", "</securityresult>"],
+        )
+        self.assertEqual(
+            [call.kwargs["req_handle"] for call in call_irrsmo00_mock.call_args_list],
+            [bytes(64), self.request_handle, self.request_handle],
+        )
+
+    def test_irrsmo00_call_racf_stops_after_max_continuations(
+        self, call_irrsmo00_mock: Mock
+    ):
+        call_irrsmo00_mock.side_effect = self.__responses(*["<securityresult>"] * 5)
+        with self.assertRaises(RuntimeError):
+            self.irrsmo00.call_racf(self.request_xml)
+        self.assertEqual(call_irrsmo00_mock.call_count, 4)
+
+    def test_irrsmo00_call_racf_returns_result_of_failed_first_call(
+        self, call_irrsmo00_mock: Mock
+    ):
+        call_irrsmo00_mock.side_effect = self.__responses(
+            "<securityresult>",
+            "</securityresult>",
+            return_codes=[[8, 2000, 20]],
+        )
+        self.assertEqual(
+            self.irrsmo00.call_racf(self.request_xml),
+            "<securityresult></securityresult>",
+        )
+
+    def test_irrsmo00_call_racf_raises_when_continuation_call_fails(
+        self, call_irrsmo00_mock: Mock
+    ):
+        call_irrsmo00_mock.side_effect = self.__responses(
+            "<securityresult>",
+            "<returncode>0</returncode>",
+            "</securityresult>",
+            return_codes=[[0, 0, 0], [8, 2000, 68]],
+        )
+        with self.assertRaises(RuntimeError) as exception:
+            list(self.irrsmo00.call_racf_chunks(self.request_xml))
+        self.assertEqual(
+            str(exception.exception),
+            "IRRSMO00 continuation call 1 failed with SAF return code 8, "
+            + "RACF return code 2000, and RACF reason code 68.",
+        )
+        self.assertEqual(call_irrsmo00_mock.call_count, 2)
+
+    def test_irrsmo00_call_racf_zero_copy_raises_when_continuation_call_fails(
+        self, call_irrsmo00_mock: Mock
+    ):
+        call_irrsmo00_mock.side_effect = self.__responses(
+            "<securityresult>",
+            "</securityresult>",
+            return_codes=[[0, 0, 0], [8, 2000, 68]],
+        )
+        with self.assertRaises(RuntimeError):
+            self.irrsmo00.call_racf(self.request_xml, zero_copy=True)
+
+    def test_irrsmo00_reuses_response_buffer_across_calls(
+        self, call_irrsmo00_mock: Mock
+    ):
+        call_irrsmo00_mock.side_effect = self.__responses("<securityresult />")
+        self.irrsmo00.call_racf(self.request_xml)
+        call_irrsmo00_mock.side_effect = self.__responses("<securityresult />")
+        self.irrsmo00.call_racf(self.request_xml)
+        (first_call, second_call) = call_irrsmo00_mock.call_args_list
+        self.assertIs(first_call.kwargs["rsp_buffer"], second_call.kwargs["rsp_buffer"])
+
+    def test_irrsmo00_sizes_response_buffer_from_buffer_size(
+        self, call_irrsmo00_mock: Mock
+    ):
+        call_irrsmo00_mock.side_effect = self.__responses("<securityresult />")
+        self.irrsmo00.buffer_size = 4096
+        self.irrsmo00.call_racf(self.request_xml)
+        self.assertEqual(len(call_irrsmo00_mock.call_args.kwargs["rsp_buffer"]), 4096)
+
+    def test_irrsmo00_uses_a_separate_response_buffer_per_thread(
+        self, call_irrsmo00_mock: Mock
+    ):
+        call_irrsmo00_mock.side_effect = self.__responses("<securityresult />")
+        self.irrsmo00.call_racf(self.request_xml)
+        call_irrsmo00_mock.side_effect = self.__responses("<securityresult />")
+        thread = threading.Thread(
+            target=self.irrsmo00.call_racf, args=(self.request_xml,)
+        )
+        thread.start()
+        thread.join()
+        (first_call, second_call) = call_irrsmo00_mock.call_args_list
+        self.assertIsNot(
+            first_call.kwargs["rsp_buffer"], second_call.kwargs["rsp_buffer"]
+        )
+
+    # ============================================================================
+    # Zero Copy
+    # ============================================================================
+    def test_irrsmo00_call_racf_zero_copy_returns_memoryview_of_response_buffer(
+        self, call_irrsmo00_mock: Mock
+    ):
+        call_irrsmo00_mock.side_effect = self.__responses("<securityresult />")
+        result_xml = self.irrsmo00.call_racf(self.request_xml, zero_copy=True)
+        self.assertIsInstance(result_xml, memoryview)
+        self.assertEqual(result_xml, b"<securityresult />")
+        self.assertIs(
+            result_xml.obj, call_irrsmo00_mock.call_args.kwargs["rsp_buffer"]
+        )
+
+    def test_irrsmo00_call_racf_zero_copy_joins_partial_responses(
+        self, call_irrsmo00_mock: Mock
+    ):
+        call_irrsmo00_mock.side_effect = self.__responses(
+            "<securityresult>", "<returncode>0</returncode>", "</securityresult>"
+        )
+        self.assertEqual(
+            self.irrsmo00.call_racf(self.request_xml, zero_copy=True),
+            b"<securityresult><returncode>0</returncode></securityresult>",
+        )
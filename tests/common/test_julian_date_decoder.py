@@ -0,0 +1,92 @@
+"""Test decoding of RACF Julian dates."""
+
+import platform
+import unittest
+from datetime import date, datetime
+
+import __init__
+
+from pyracf import JulianDateDecoder
+
+# Resolves F401
+__init__
+
+
+class TestJulianDateDecoder(unittest.TestCase):
+    maxDiff = None
+    # Allows unit tests to be run on Windows.
+    t = "#" if platform.system() == "Windows" else "-"
+
+    def __strptime(self, value: str, julian_date_format: str, standard_format: str):
+        """Decode a Julian date the slow way, for comparison."""
+        try:
+            decoded = datetime.strptime(value, julian_date_format)
+        except ValueError:
+            return (None, None)
+        return (decoded.strftime(standard_format), decoded)
+
+    # ============================================================================
+    # Standard Format
+    # ============================================================================
+    def test_julian_date_decoder_decode(self):
+        self.assertEqual(JulianDateDecoder.decode("23.087"), "3/28/2023")
+        self.assertEqual(JulianDateDecoder.decode("99.001"), "1/1/1999")
+        self.assertEqual(JulianDateDecoder.decode("24.366"), "12/31/2024")
+
+    def test_julian_date_decoder_decode_with_time(self):
+        self.assertEqual(
+            JulianDateDecoder.decode("23.087/12:37:10"), "3/28/2023 12:37 PM"
+        )
+        self.assertEqual(
+            JulianDateDecoder.decode("23.087/00:05:09"), "3/28/2023 12:05 AM"
+        )
+
+    def test_julian_date_decoder_matches_strptime_for_every_day_of_the_year(self):
+        for year in ["00", "23", "24", "68", "69", "99"]:
+            for day_of_year in range(0, 368):
+                value = f"{year}.{day_of_year:03d}"
+                (standard_date, decoded) = self.__strptime(
+                    value, "%y.%j", f"%{self.t}m/%{self.t}d/%Y"
+                )
+                with self.subTest(value=value):
+                    self.assertEqual(JulianDateDecoder.decode(value), standard_date)
+                    self.assertEqual(
+                        JulianDateDecoder.decode(value, as_date=True),
+                        None if decoded is None else decoded.date(),
+                    )
+
+    def test_julian_date_decoder_matches_strptime_for_times(self):
+        for time in ["00:00:00", "11:59:59", "12:00:00", "23:59:59", "24:00:00"]:
+            value = f"23.087/{time}"
+            (standard_date, decoded) = self.__strptime(
+                value,
+                "%y.%j/%H:%M:%S",
+                f"%{self.t}m/%{self.t}d/%Y %{self.t}I:%M %p",
+            )
+            with self.subTest(value=value):
+                self.assertEqual(JulianDateDecoder.decode(value), standard_date)
+                self.assertEqual(JulianDateDecoder.decode(value, as_date=True), decoded)
+
+    def test_julian_date_decoder_returns_none_for_values_that_are_not_dates(self):
+        for value in [
+            "23.000",
+            "23.367",
+            "23.087/12:60:00",
+            "23.87",
+            "2023.087",
+            "n/a",
+        ]:
+            with self.subTest(value=value):
+                self.assertIsNone(JulianDateDecoder.decode(value))
+
+    # ============================================================================
+    # Date Objects
+    # ============================================================================
+    def test_julian_date_decoder_decode_as_date(self):
+        self.assertEqual(
+            JulianDateDecoder.decode("23.087", as_date=True), date(2023, 3, 28)
+        )
+        self.assertEqual(
+            JulianDateDecoder.decode("23.087/12:37:10", as_date=True),
+            datetime(2023, 3, 28, 12, 37, 10),
+        )
@@ -0,0 +1,171 @@
+"""Test lazily parsed security result dictionaries."""
+
+import copy
+import glob
+import json
+import os
+import pickle
+import unittest
+from typing import Union
+from unittest.mock import patch
+
+import __init__
+
+import tests.user.test_user_constants as TestUserConstants
+from pyracf import RACFSimulator, Transport, UserAdmin
+from pyracf.common.lazy_result_dictionary import LazyResultDictionary
+from pyracf.common.security_result import SecurityResult
+
+# Resolves F401
+__init__
+
+
+class ZeroCopyTransport(Transport):
+    """Returns result XML as a memoryview over one reused buffer, like IRRSMO00."""
+
+    def __init__(self) -> None:
+        self.racf_simulator = RACFSimulator()
+        self.response_buffer = bytearray(100000)
+
+    def call_racf(
+        self, request_xml: bytes, precheck: bool = False, zero_copy: bool = False
+    ) -> Union[str, memoryview]:
+        result_xml = self.racf_simulator.call_racf(request_xml, precheck=precheck)
+        if not zero_copy:
+            return result_xml
+        result_bytes = result_xml.encode("utf-8")
+        self.response_buffer[: len(result_bytes)] = result_bytes
+        return memoryview(self.response_buffer)[: len(result_bytes)]
+
+
+@patch(
+    "pyracf.common.lazy_result_dictionary.SecurityResult",
+    wraps=SecurityResult,
+)
+class TestLazyResultDictionary(unittest.TestCase):
+    maxDiff = None
+
+    # ============================================================================
+    # Return Codes
+    # ============================================================================
+    def test_lazy_result_dictionary_decodes_return_codes_without_parsing(
+        self, security_result_mock
+    ):
+        result = LazyResultDictionary(TestUserConstants.TEST_ADD_USER_RESULT_ERROR_XML)
+        self.assertEqual(result["returnCode"], 4)
+        self.assertEqual(result.get("reasonCode"), 0)
+        self.assertIn("returnCode", result)
+        security_result_mock.assert_not_called()
+
+    def test_lazy_result_dictionary_decodes_return_codes_of_ebcdic_result_xml(
+        self, security_result_mock
+    ):
+        # 'cp1047' is not available off platform, so 'cp500' stands in for EBCDIC.
+        result = LazyResultDictionary(
+            memoryview(
+                TestUserConstants.TEST_ADD_USER_RESULT_ERROR_XML.encode("cp500")
+            ),
+            encoding="cp500",
+        )
+        self.assertEqual(result["returnCode"], 4)
+        security_result_mock.assert_not_called()
+        self.assertEqual(
+            result,
+            SecurityResult(
+                TestUserConstants.TEST_ADD_USER_RESULT_ERROR_XML
+            ).get_result_dictionary()["securityResult"],
+        )
+
+    def test_lazy_result_dictionary_parses_right_away_if_return_codes_are_not_found(
+        self, security_result_mock
+    ):
+        result_xml = TestUserConstants.TEST_ALTER_USER_RESULT_SUCCESS_XML
+        LazyResultDictionary(result_xml + "<!-- Trailing comment. -->")
+        security_result_mock.assert_called_once()
+
+    # ============================================================================
+    # Parsing On Access
+    # ============================================================================
+    def test_lazy_result_dictionary_matches_security_result(self, _):
+        samples = glob.glob(
+            os.path.join(os.path.dirname(__file__), "..", "*", "*_samples", "*.xml")
+        )
+        result_samples = [sample for sample in samples if "_result_" in sample]
+        self.assertNotEqual(result_samples, [])
+        for result_sample in result_samples:
+            with open(result_sample, "r", encoding="utf-8") as result_file:
+                result_xml = result_file.read()
+            security_result = SecurityResult(result_xml).get_result_dictionary()[
+                "securityResult"
+            ]
+            with self.subTest(result_sample=os.path.basename(result_sample)):
+                result = LazyResultDictionary(result_xml)
+                self.assertEqual(list(result.keys()), list(security_result.keys()))
+                self.assertEqual(result, security_result)
+
+    def test_lazy_result_dictionary_parses_once_when_definitions_are_accessed(
+        self, security_result_mock
+    ):
+        result = LazyResultDictionary(
+            TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_XML
+        )
+        self.assertEqual(result["user"]["name"], "SQUIDWRD")
+        self.assertEqual(len(result["user"]["commands"][0]["messages"]), 31)
+        security_result_mock.assert_called_once()
+
+    def test_lazy_result_dictionary_keeps_a_copy_of_memoryview_result_xml(self, _):
+        result_xml = TestUserConstants.TEST_ALTER_USER_RESULT_SUCCESS_XML
+        response_buffer = bytearray(result_xml.encode("utf-8"))
+        result = LazyResultDictionary(memoryview(response_buffer), encoding="utf-8")
+        # The response buffer is reused by the next request.
+        response_buffer[:] = b" " * len(response_buffer)
+        self.assertEqual(
+            result,
+            SecurityResult(result_xml).get_result_dictionary()["securityResult"],
+        )
+
+    def test_lazy_result_dictionary_can_be_serialized_and_copied(self, _):
+        result_xml = TestUserConstants.TEST_ALTER_USER_RESULT_SUCCESS_XML
+        security_result = SecurityResult(result_xml).get_result_dictionary()[
+            "securityResult"
+        ]
+        self.assertEqual(
+            json.loads(json.dumps(LazyResultDictionary(result_xml))), security_result
+        )
+        self.assertEqual(dict(LazyResultDictionary(result_xml)), security_result)
+        for result in [
+            copy.deepcopy(LazyResultDictionary(result_xml)),
+            pickle.loads(pickle.dumps(LazyResultDictionary(result_xml))),
+        ]:
+            self.assertIs(type(result), dict)
+            self.assertEqual(result, security_result)
+
+    # ============================================================================
+    # Security Admin
+    # ============================================================================
+    def test_security_admin_does_not_parse_results_that_are_not_accessed(
+        self, security_result_mock
+    ):
+        user_admin = UserAdmin(transport=RACFSimulator())
+        result = user_admin.add("squidwrd")
+        self.assertEqual(result["securityResult"]["returnCode"], 0)
+        security_result_mock.assert_not_called()
+        self.assertEqual(result["securityResult"]["user"]["name"], "SQUIDWRD")
+        security_result_mock.assert_called_once()
+
+    def test_security_admin_parses_extracts_without_copying_result_xml(self, _):
+        transport = ZeroCopyTransport()
+        user_admin = UserAdmin(transport=transport)
+        user_admin.add("squidwrd", traits={"base:name": "Squidward"})
+        with patch(
+            "pyracf.common.security_admin.LazyResultDictionary",
+            wraps=LazyResultDictionary,
+        ) as lazy_result_dictionary_mock:
+            profile = user_admin.extract("squidwrd", profile_only=True)
+            lazy_result_dictionary_mock.assert_not_called()
+            result = user_admin.alter("squidwrd", traits={"base:special": True})
+            lazy_result_dictionary_mock.assert_called_once()
+        # The response buffer is reused by the next request.
+        transport.response_buffer[:] = b" " * len(transport.response_buffer)
+        self.assertEqual(profile["base"]["name"], "squidward")
+        self.assertEqual(result["securityResult"]["user"]["name"], "SQUIDWRD")
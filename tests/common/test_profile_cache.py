@@ -0,0 +1,370 @@
+"""Test profile extract cache."""
+
+import unittest
+from typing import Union
+from unittest.mock import Mock, patch
+
+import __init__
+
+import tests.common.test_common_constants as TestCommonConstants
+from pyracf import (
+    AccessAdmin,
+    ConnectionAdmin,
+    DataSetAdmin,
+    GroupAdmin,
+    ProfileCache,
+    ResourceAdmin,
+    SecurityBatch,
+    SecurityRequestError,
+    UserAdmin,
+)
+
+# Resolves F401
+__init__
+
+
+class TestProfileCache(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self) -> None:
+        (racf_simulator, self.call_racf_mock) = TestCommonConstants.get_racf_simulator()
+        self.racf_simulator = racf_simulator
+        self.profile_cache = ProfileCache()
+        self.user_admin = UserAdmin(
+            transport=racf_simulator, profile_cache=self.profile_cache
+        )
+        self.user_admin.add(
+            "squidwrd",
+            traits={
+                "omvs:uid": 2424,
+                "omvs:home": "/u/squidwrd",
+                "omvs:program": "/bin/sh",
+            },
+        )
+        self.call_racf_mock.reset_mock()
+
+    def __get_groups(self, userid: str) -> dict:
+        """Get the groups a user is connected to from its profile."""
+        return self.user_admin.extract(userid, profile_only=True)["base"]["groups"]
+
+    def __get_subgroups(self, group: str) -> Union[str, list]:
+        """Get the subgroups of a group from its profile."""
+        group_admin = GroupAdmin(
+            transport=self.racf_simulator, profile_cache=self.profile_cache
+        )
+        return group_admin.extract(group, profile_only=True)["base"].get(
+            "subgroup(s)", []
+        )
+
+    # ============================================================================
+    # Cached Profile Extract
+    # ============================================================================
+    def test_profile_cache_reads_several_fields_with_one_request(self):
+        self.assertEqual(self.user_admin.get_omvs_uid("squidwrd"), 2424)
+        self.assertEqual(self.user_admin.get_omvs_home("squidwrd"), "/u/squidwrd")
+        self.assertEqual(self.user_admin.get_omvs_program("squidwrd"), "/bin/sh")
+        self.assertEqual(self.call_racf_mock.call_count, 1)
+
+    def test_profile_cache_caches_each_set_of_requested_segments_separately(self):
+        self.assertFalse(self.user_admin.has_special_authority("squidwrd"))
+        self.assertEqual(self.user_admin.get_omvs_uid("squidwrd"), 2424)
+        self.assertFalse(self.user_admin.has_auditor_authority("squidwrd"))
+        self.assertEqual(self.user_admin.get_omvs_home("squidwrd"), "/u/squidwrd")
+        self.assertEqual(self.call_racf_mock.call_count, 2)
+        self.assertEqual(len(self.profile_cache), 2)
+
+    def test_profile_cache_is_not_used_by_default(self):
+        user_admin = UserAdmin(transport=self.racf_simulator)
+        user_admin.get_omvs_uid("squidwrd")
+        user_admin.get_omvs_home("squidwrd")
+        self.assertEqual(self.call_racf_mock.call_count, 2)
+
+    def test_profile_cache_returns_copies_of_cached_results(self):
+        profile = self.user_admin.extract("squidwrd", profile_only=True)
+        profile["base"]["attributes"].append("special")
+        self.assertFalse(self.user_admin.has_special_authority("squidwrd"))
+
+    def test_profile_cache_can_be_shared_by_admin_objects(self):
+        user_admin = UserAdmin(
+            transport=self.racf_simulator, profile_cache=self.profile_cache
+        )
+        self.user_admin.get_omvs_uid("squidwrd")
+        user_admin.get_omvs_uid("squidwrd")
+        self.assertEqual(self.call_racf_mock.call_count, 1)
+
+    def test_profile_cache_keys_include_class_name(self):
+        resource_admin = ResourceAdmin(
+            transport=self.racf_simulator, profile_cache=self.profile_cache
+        )
+        resource_admin.add("TESTING", "ELIJTEST", {"base:universal_access": "read"})
+        resource_admin.add("TESTING", "FACILITY", {"base:universal_access": "update"})
+        self.assertEqual(
+            resource_admin.get_universal_access("TESTING", "ELIJTEST"), "read"
+        )
+        self.assertEqual(
+            resource_admin.get_universal_access("TESTING", "FACILITY"), "update"
+        )
+
+    # ============================================================================
+    # Invalidation
+    # ============================================================================
+    def test_profile_cache_is_invalidated_by_alter(self):
+        self.assertEqual(self.user_admin.get_omvs_uid("squidwrd"), 2424)
+        self.user_admin.set_omvs_uid("squidwrd", 1919)
+        self.assertEqual(self.user_admin.get_omvs_uid("squidwrd"), 1919)
+        self.assertEqual(self.call_racf_mock.call_count, 3)
+
+    def test_profile_cache_is_invalidated_by_delete(self):
+        self.user_admin.extract("squidwrd")
+        self.user_admin.delete("squidwrd")
+        with self.assertRaises(SecurityRequestError):
+            self.user_admin.extract("squidwrd")
+
+    def test_profile_cache_is_invalidated_by_failed_request(self):
+        self.user_admin.extract("squidwrd")
+        with self.assertRaises(SecurityRequestError):
+            self.user_admin.add("squidwrd", traits={"base:special": True})
+        self.assertTrue(self.user_admin.has_special_authority("squidwrd"))
+
+    def test_profile_cache_is_invalidated_by_batched_request(self):
+        self.assertFalse(self.user_admin.has_special_authority("squidwrd"))
+        with SecurityBatch() as batch:
+            self.user_admin.alter("squidwrd", traits={"base:special": True})
+        batch.submit()
+        self.assertTrue(self.user_admin.has_special_authority("squidwrd"))
+
+    def test_profile_cache_only_invalidates_profile_that_changed(self):
+        self.user_admin.extract("squidwrd")
+        self.user_admin.extract("ibmuser")
+        self.user_admin.give_special_authority("squidwrd")
+        self.assertEqual(len(self.profile_cache), 1)
+
+    def test_profile_cache_is_invalidated_for_user_and_group_by_connection(self):
+        group_admin = GroupAdmin(
+            transport=self.racf_simulator, profile_cache=self.profile_cache
+        )
+        connection_admin = ConnectionAdmin(
+            transport=self.racf_simulator, profile_cache=self.profile_cache
+        )
+        group_admin.add("testgrp0")
+        self.assertEqual(list(self.__get_groups("squidwrd")), ["SYS1"])
+        self.assertFalse(
+            group_admin.has_group_special_authority("testgrp0", "squidwrd")
+        )
+        connection_admin.give_group_special_authority("squidwrd", "testgrp0")
+        self.assertTrue(group_admin.has_group_special_authority("testgrp0", "squidwrd"))
+        self.assertEqual(list(self.__get_groups("squidwrd")), ["SYS1", "TESTGRP0"])
+        connection_admin.delete("squidwrd", "testgrp0")
+        self.assertFalse(
+            group_admin.has_group_special_authority("testgrp0", "squidwrd")
+        )
+        self.assertEqual(list(self.__get_groups("squidwrd")), ["SYS1"])
+
+    def test_profile_cache_is_invalidated_for_covered_profile_by_permission(self):
+        data_set_admin = DataSetAdmin(
+            transport=self.racf_simulator, profile_cache=self.profile_cache
+        )
+        resource_admin = ResourceAdmin(
+            transport=self.racf_simulator, profile_cache=self.profile_cache
+        )
+        access_admin = AccessAdmin(
+            transport=self.racf_simulator, profile_cache=self.profile_cache
+        )
+        data_set_admin.add("ESWIFT.TEST.T1136242.P3020470", traits={})
+        resource_admin.add("TESTING", "ELIJTEST", traits={})
+        resource_admin.add("TESTING", "FACILITY", traits={})
+        data_set_admin.extract("ESWIFT.TEST.T1136242.P3020470")
+        resource_admin.extract("TESTING", "ELIJTEST")
+        resource_admin.extract("TESTING", "FACILITY")
+        access_admin.add(
+            "ESWIFT.TEST.T1136242.P3020470",
+            "DATASET",
+            "squidwrd",
+            traits={"base:access": "alter"},
+        )
+        access_admin.add(
+            "TESTING", "ELIJTEST", "squidwrd", traits={"base:access": "read"}
+        )
+        self.call_racf_mock.reset_mock()
+        data_set_admin.extract("ESWIFT.TEST.T1136242.P3020470")
+        resource_admin.extract("TESTING", "ELIJTEST")
+        resource_admin.extract("TESTING", "FACILITY")
+        self.assertEqual(self.call_racf_mock.call_count, 2)
+        access_admin.delete("TESTING", "ELIJTEST", "squidwrd")
+        self.call_racf_mock.reset_mock()
+        resource_admin.extract("TESTING", "ELIJTEST")
+        self.assertEqual(self.call_racf_mock.call_count, 1)
+
+    def test_profile_cache_is_invalidated_for_groups_by_user_delete(self):
+        group_admin = GroupAdmin(
+            transport=self.racf_simulator, profile_cache=self.profile_cache
+        )
+        self.assertEqual(
+            group_admin.get_connect_attributes("sys1"),
+            {"ibmuser": [], "squidwrd": []},
+        )
+        self.user_admin.delete("squidwrd")
+        self.assertEqual(group_admin.get_connect_attributes("sys1"), {"ibmuser": []})
+
+    def test_profile_cache_is_invalidated_for_default_group_by_user_add(self):
+        group_admin = GroupAdmin(
+            transport=self.racf_simulator, profile_cache=self.profile_cache
+        )
+        group_admin.add("testgrp0")
+        self.assertEqual(group_admin.get_connect_attributes("testgrp0"), {})
+        self.user_admin.add("squidwrd1", traits={"base:dfltgrp": "testgrp0"})
+        self.assertEqual(
+            group_admin.get_connect_attributes("testgrp0"), {"squidwrd1": []}
+        )
+
+    def test_profile_cache_is_invalidated_for_groups_by_user_add(self):
+        group_admin = GroupAdmin(
+            transport=self.racf_simulator, profile_cache=self.profile_cache
+        )
+        self.assertEqual(
+            group_admin.get_connect_attributes("sys1"),
+            {"ibmuser": [], "squidwrd": []},
+        )
+        self.user_admin.add("squidwrd1")
+        self.assertEqual(
+            group_admin.get_connect_attributes("sys1"),
+            {"ibmuser": [], "squidwrd": [], "squidwrd1": []},
+        )
+
+    def test_profile_cache_is_not_invalidated_for_groups_by_user_alter(self):
+        group_admin = GroupAdmin(
+            transport=self.racf_simulator, profile_cache=self.profile_cache
+        )
+        group_admin.extract("sys1")
+        self.user_admin.alter("squidwrd", traits={"omvs:uid": 2525})
+        self.assertEqual(len(self.profile_cache), 1)
+
+    def test_profile_cache_is_invalidated_for_superior_group_by_group_add(self):
+        group_admin = GroupAdmin(
+            transport=self.racf_simulator, profile_cache=self.profile_cache
+        )
+        group_admin.add("testgrp0")
+        self.assertEqual(self.__get_subgroups("testgrp0"), [])
+        group_admin.add("testgrp1", traits={"base:supgroup": "testgrp0"})
+        self.assertEqual(self.__get_subgroups("testgrp0"), "testgrp1")
+
+    def test_profile_cache_is_invalidated_for_superior_group_by_group_delete(self):
+        group_admin = GroupAdmin(
+            transport=self.racf_simulator, profile_cache=self.profile_cache
+        )
+        group_admin.add("testgrp0")
+        group_admin.add("testgrp1", traits={"base:supgroup": "testgrp0"})
+        self.assertEqual(self.__get_subgroups("testgrp0"), "testgrp1")
+        group_admin.delete("testgrp1")
+        self.assertEqual(self.__get_subgroups("testgrp0"), [])
+
+    def test_profile_cache_does_not_cache_results_outdated_by_a_prefix(self):
+        profile_key = ("group", "TESTGRP0", "", "", "", "")
+        version = self.profile_cache.get_version(profile_key)
+        self.profile_cache.invalidate(("group",))
+        self.profile_cache.put(profile_key, (), {"outdated": True}, version)
+        self.assertIsNone(self.profile_cache.get(profile_key, ()))
+
+    def test_profile_cache_only_keeps_versions_of_recent_profiles(self):
+        self.profile_cache.max_size = 2
+        profile_key = ("user", "SQUIDWRD", "", "", "", "")
+        version = self.profile_cache.get_version(profile_key)
+        self.profile_cache.invalidate(profile_key)
+        for userid in ["IBMUSER", "ESWIFT", "LEONARD"]:
+            self.profile_cache.invalidate(("user", userid, "", "", "", ""))
+        self.assertEqual(len(self.profile_cache._ProfileCache__profile_versions), 2)
+        # The version of a profile never goes back to a version it had before.
+        self.assertGreater(self.profile_cache.get_version(profile_key), version)
+        self.profile_cache.put(profile_key, (), {"outdated": True}, version)
+        self.assertIsNone(self.profile_cache.get(profile_key, ()))
+
+    def test_profile_cache_does_not_cache_outdated_results(self):
+        profile_key = ("user", "SQUIDWRD", "", "", "", "")
+        version = self.profile_cache.get_version(profile_key)
+        self.profile_cache.invalidate(profile_key)
+        self.profile_cache.put(profile_key, (), {"outdated": True}, version)
+        self.assertIsNone(self.profile_cache.get(profile_key, ()))
+
+    # ============================================================================
+    # Expiration and Eviction
+    # ============================================================================
+    @patch("pyracf.common.profile_cache.time.monotonic")
+    def test_profile_cache_entries_expire(self, monotonic_mock: Mock):
+        self.profile_cache.ttl = 30
+        monotonic_mock.return_value = 1000.0
+        self.user_admin.extract("squidwrd")
+        monotonic_mock.return_value = 1029.0
+        self.user_admin.extract("squidwrd")
+        self.assertEqual(self.call_racf_mock.call_count, 1)
+        monotonic_mock.return_value = 1030.0
+        self.user_admin.extract("squidwrd")
+        self.assertEqual(self.call_racf_mock.call_count, 2)
+
+    def test_profile_cache_evicts_least_recently_used_entries(self):
+        self.profile_cache.max_size = 2
+        self.user_admin.add("eswift")
+        self.user_admin.extract("squidwrd")
+        self.user_admin.extract("ibmuser")
+        self.user_admin.extract("squidwrd")
+        self.user_admin.extract("eswift")
+        self.assertEqual(len(self.profile_cache), 2)
+        self.call_racf_mock.reset_mock()
+        self.user_admin.extract("squidwrd")
+        self.assertEqual(self.call_racf_mock.call_count, 0)
+        self.user_admin.extract("ibmuser")
+        self.assertEqual(self.call_racf_mock.call_count, 1)
+
+    # ============================================================================
+    # Profiles Not Found
+    # ============================================================================
+    def test_profile_cache_remembers_profiles_not_found(self):
+        self.profile_cache.not_found_ttl = 5
+        with self.assertRaises(SecurityRequestError) as first_error:
+            self.user_admin.extract("eswift")
+        with self.assertRaises(SecurityRequestError) as second_error:
+            self.user_admin.get_omvs_uid("eswift")
+        self.assertEqual(first_error.exception.result, second_error.exception.result)
+        self.assertEqual(self.call_racf_mock.call_count, 1)
+
+    def test_profile_cache_does_not_remember_profiles_not_found_by_default(self):
+        for _ in range(2):
+            with self.assertRaises(SecurityRequestError):
+                self.user_admin.extract("eswift")
+        self.assertEqual(self.call_racf_mock.call_count, 2)
+
+    def test_profile_cache_profile_not_found_is_invalidated_by_add(self):
+        self.profile_cache.not_found_ttl = 5
+        with self.assertRaises(SecurityRequestError):
+            self.user_admin.extract("eswift")
+        self.user_admin.add("eswift", traits={"omvs:uid": 1989})
+        self.assertEqual(self.user_admin.get_omvs_uid("eswift"), 1989)
+
+    def test_profile_cache_remembers_each_type_of_profile_not_found(self):
+        self.profile_cache.not_found_ttl = 5
+        group_admin = GroupAdmin(
+            transport=self.racf_simulator, profile_cache=self.profile_cache
+        )
+        data_set_admin = DataSetAdmin(
+            transport=self.racf_simulator, profile_cache=self.profile_cache
+        )
+        resource_admin = ResourceAdmin(
+            transport=self.racf_simulator, profile_cache=self.profile_cache
+        )
+        for _ in range(2):
+            for extract in [
+                lambda: group_admin.extract("testgrp0"),
+                lambda: data_set_admin.extract("ESWIFT.TEST.T1136242.P3020470"),
+                lambda: resource_admin.extract("TESTING", "ELIJTEST"),
+            ]:
+                with self.assertRaises(SecurityRequestError):
+                    extract()
+        self.assertEqual(self.call_racf_mock.call_count, 3)
+
+    @patch("pyracf.common.profile_cache.time.monotonic")
+    def test_profile_cache_profile_not_found_expires(self, monotonic_mock: Mock):
+        self.profile_cache.not_found_ttl = 5
+        for current_time in [1000.0, 1004.0, 1005.0]:
+            monotonic_mock.return_value = current_time
+            with self.assertRaises(SecurityRequestError):
+                self.user_admin.extract("eswift")
+        self.assertEqual(self.call_racf_mock.call_count, 2)
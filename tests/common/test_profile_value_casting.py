@@ -0,0 +1,66 @@
+"""Test casting of raw profile values."""
+
+import unittest
+
+import __init__
+
+from pyracf import UserAdmin
+
+# Resolves F401
+__init__
+
+
+class TestProfileValueCasting(unittest.TestCase):
+    maxDiff = None
+    user_admin = UserAdmin(generate_requests_only=True)
+    raw_and_cast_values = [
+        ("N/A", None),
+        ("NONE", None),
+        ("NONE SPECIFIED", None),
+        ("NO", None),
+        ("ACTIVE", True),
+        ("IN EFFECT.", True),
+        ("INACTIVE", False),
+        ("NOT IN EFFECT", False),
+        ("186 DAYS", 186),
+        ("IN EFFECT FOR THE TERMINAL FUNCTION.", "terminal"),
+        ("READ", "read"),
+        ("/u/squidwrd", "/u/squidwrd"),
+        (" 0000002424", 2424),
+        ("-1", -1),
+        ("1,024", 1024),
+        ("1.5", 1.5),
+        ("-.5", -0.5),
+        ("1.", 1.0),
+        ("1.5e3", 1500.0),
+        ("1.2.3", "1.2.3"),
+        ("23.087", "3/28/2023"),
+        ("23.087/12:37:10", "3/28/2023 12:37 PM"),
+        ("23.999", None),
+        ("23.087/25:00:00", None),
+    ]
+
+    # ============================================================================
+    # Cast Values
+    # ============================================================================
+    def test_cast_from_str(self):
+        for raw_value, cast_value in self.raw_and_cast_values:
+            with self.subTest(raw_value=raw_value):
+                self.assertEqual(self.user_admin._cast_from_str(raw_value), cast_value)
+                self.assertIs(
+                    type(self.user_admin._cast_from_str(raw_value)), type(cast_value)
+                )
+
+    def test_cast_many_from_str(self):
+        self.assertEqual(
+            self.user_admin._cast_many_from_str(
+                [raw_value for raw_value, _ in self.raw_and_cast_values]
+            ),
+            [cast_value for _, cast_value in self.raw_and_cast_values],
+        )
+
+    def test_cast_from_str_gives_the_same_value_for_repeated_values(self):
+        self.assertEqual(
+            self.user_admin._cast_many_from_str(["23.087", "23.087", "READ", "READ"]),
+            ["3/28/2023", "3/28/2023", "read", "read"],
+        )
@@ -0,0 +1,172 @@
+"""Test record and replay transports."""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+import __init__
+
+from pyracf import (
+    RACFSimulator,
+    RecordingTransport,
+    ReplayTransport,
+    SecurityRequestError,
+    Transport,
+    UserAdmin,
+)
+
+# Resolves F401
+__init__
+
+
+class TestRecordReplayTransport(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self) -> None:
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.capture_file = os.path.join(temporary_directory.name, "capture.jsonl")
+        self.user_admin = UserAdmin(
+            transport=RecordingTransport(self.capture_file, transport=RACFSimulator())
+        )
+
+    def __read_records(self) -> list:
+        with open(self.capture_file, "r", encoding="utf-8") as capture_file:
+            return [json.loads(line) for line in capture_file]
+
+    # ============================================================================
+    # Recording
+    # ============================================================================
+    def test_recording_transport_appends_each_request_to_capture_file(self):
+        self.user_admin.add("squidwrd", traits={"base:name": "Squidward"})
+        self.user_admin.extract("squidwrd")
+        records = self.__read_records()
+        self.assertEqual(len(records), 2)
+        self.assertEqual(
+            [list(record) for record in records],
+            [["request_xml", "precheck", "result_xml", "latency"]] * 2,
+        )
+        self.assertIn('operation="set"', records[0]["request_xml"])
+        self.assertFalse(records[0]["precheck"])
+        self.assertIn("<image>ADDUSER SQUIDWRD </image>", records[0]["result_xml"])
+        self.assertIn('operation="listdata"', records[1]["request_xml"])
+        self.assertGreaterEqual(records[1]["latency"], 0)
+
+    def test_recording_transport_redacts_secrets_in_capture_file(self):
+        self.user_admin.add(
+            "squidwrd",
+            traits={
+                "base:password": "GIyTTqdF",
+                "base:passphrase": "PassPhrasesAreCool!",
+            },
+        )
+        records = self.__read_records()
+        self.assertNotIn("GIyTTqdF", records[0]["request_xml"])
+        self.assertNotIn("PassPhrasesAreCool!", records[0]["request_xml"])
+        self.assertIn(
+            "<racf:password>********</racf:password>",
+            records[0]["request_xml"],
+        )
+        self.assertIn("PASSWORD    (********) ", records[0]["result_xml"])
+
+    def test_recording_transport_redacts_additional_secret_traits_of_admin(self):
+        user_admin = UserAdmin(
+            additional_secret_traits=["omvs:home"],
+            transport=RecordingTransport(self.capture_file, transport=RACFSimulator()),
+        )
+        user_admin.add("squidwrd", traits={"omvs:home": "/u/SECRETHOME"})
+        records = self.__read_records()
+        self.assertNotIn("SECRETHOME", records[0]["request_xml"])
+        self.assertNotIn("SECRETHOME", records[0]["result_xml"])
+        self.assertIn("<home>********</home>", records[0]["request_xml"])
+
+    def test_recording_transport_records_failed_requests(self):
+        with self.assertRaises(SecurityRequestError):
+            self.user_admin.extract("squidwrd")
+        self.assertIn(
+            "ICH30001I UNABLE TO LOCATE USER    ENTRY SQUIDWRD",
+            self.__read_records()[0]["result_xml"],
+        )
+
+    # ============================================================================
+    # Replay
+    # ============================================================================
+    def test_replay_transport_returns_recorded_results(self):
+        recorded_add = self.user_admin.add(
+            "squidwrd", traits={"base:password": "GIyTTqdF"}
+        )
+        recorded_extract = self.user_admin.extract("squidwrd")
+        user_admin = UserAdmin(transport=ReplayTransport(self.capture_file))
+        self.assertEqual(
+            user_admin.add("squidwrd", traits={"base:password": "GIyTTqdF"}),
+            recorded_add,
+        )
+        self.assertEqual(user_admin.extract("squidwrd"), recorded_extract)
+        # Results are replayed again once all of them have been used.
+        self.assertEqual(user_admin.extract("squidwrd"), recorded_extract)
+
+    def test_replay_transport_redacts_additional_secret_traits_of_admin(self):
+        recording_admin = UserAdmin(
+            additional_secret_traits=["omvs:home"],
+            transport=RecordingTransport(self.capture_file, transport=RACFSimulator()),
+        )
+        recorded_add = recording_admin.add(
+            "squidwrd", traits={"omvs:home": "/u/SECRETHOME"}
+        )
+        user_admin = UserAdmin(
+            additional_secret_traits=["omvs:home"],
+            transport=ReplayTransport(self.capture_file),
+        )
+        self.assertEqual(
+            user_admin.add("squidwrd", traits={"omvs:home": "/u/SECRETHOME"}),
+            recorded_add,
+        )
+
+    def test_replay_transport_returns_recorded_results_in_order(self):
+        self.user_admin.extract("ibmuser")
+        self.user_admin.give_auditor_authority("ibmuser")
+        self.user_admin.extract("ibmuser")
+        user_admin = UserAdmin(transport=ReplayTransport(self.capture_file))
+        self.assertFalse(user_admin.has_auditor_authority("ibmuser"))
+        self.assertTrue(user_admin.has_auditor_authority("ibmuser"))
+
+    def test_replay_transport_can_return_undecoded_results(self):
+        self.user_admin.extract("ibmuser")
+        replay_transport = ReplayTransport(self.capture_file)
+        record = replay_transport.records[0]
+        result_xml = replay_transport.call_racf(
+            record["request_xml"].encode("utf-8"), zero_copy=True
+        )
+        self.assertIsInstance(result_xml, memoryview)
+        self.assertEqual(bytes(result_xml), record["result_xml"].encode("utf-8"))
+
+    @patch("pyracf.common.replay_transport.time.sleep")
+    def test_replay_transport_can_replay_recorded_latencies(self, sleep_mock: Mock):
+        self.user_admin.extract("ibmuser")
+        latency = self.__read_records()[0]["latency"]
+        UserAdmin(transport=ReplayTransport(self.capture_file)).extract("ibmuser")
+        sleep_mock.assert_not_called()
+        UserAdmin(transport=ReplayTransport(self.capture_file, real_time=True)).extract(
+            "ibmuser"
+        )
+        sleep_mock.assert_called_once_with(latency)
+
+    def test_replay_transport_raises_lookup_error_for_unrecorded_request(self):
+        self.user_admin.extract("ibmuser")
+        user_admin = UserAdmin(transport=ReplayTransport(self.capture_file))
+        with self.assertRaises(LookupError):
+            user_admin.extract("squidwrd")
+
+    # ============================================================================
+    # Transport
+    # ============================================================================
+    def test_transport_can_not_be_created_without_call_racf(self):
+        class IncompleteTransport(Transport):
+            pass
+
+        with self.assertRaises(TypeError):
+            Transport()
+        with self.assertRaises(TypeError):
+            IncompleteTransport()
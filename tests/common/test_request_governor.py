@@ -0,0 +1,133 @@
+"""Test concurrency governor and rate limiter for IRRSMO00 requests."""
+
+import threading
+import time
+import unittest
+
+import __init__
+
+import tests.common.test_common_constants as TestCommonConstants
+from pyracf import RequestGovernor, SecurityBatch, UserAdmin
+
+# Resolves F401
+__init__
+
+
+class TestRequestGovernor(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.in_flight_lock = threading.Lock()
+        self.request_time = 0
+        (racf_simulator, _) = TestCommonConstants.get_racf_simulator(
+            self.__track_request
+        )
+        self.user_admin = UserAdmin(transport=racf_simulator)
+        for index in range(25):
+            self.user_admin.add(f"user{index}")
+        # Only the requests made by the tests themselves take a while.
+        self.max_in_flight = 0
+        self.request_time = 0.05
+        self.addCleanup(RequestGovernor.uninstall)
+
+    def __track_request(self) -> None:
+        """Keep track of how many requests are in flight at once."""
+        with self.in_flight_lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.request_time)
+        with self.in_flight_lock:
+            self.in_flight -= 1
+
+    def __extracts(self, count: int) -> list:
+        """Build extracts of different users, so that they aren't coalesced."""
+        return [
+            lambda userid=f"user{index}": self.user_admin.extract(userid)
+            for index in range(count)
+        ]
+
+    def __run_concurrently(self, functions: list) -> None:
+        """Call each function on its own thread and wait for all of them."""
+        threads = [threading.Thread(target=function) for function in functions]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    # ============================================================================
+    # Max In Flight
+    # ============================================================================
+    def test_request_governor_limits_requests_in_flight(self):
+        RequestGovernor(max_in_flight=2).install()
+        self.__run_concurrently(self.__extracts(8))
+        self.assertEqual(self.max_in_flight, 2)
+
+    def test_request_governor_limits_reads_and_writes_separately(self):
+        RequestGovernor(max_reads_in_flight=1, max_writes_in_flight=1).install()
+        self.__run_concurrently(
+            self.__extracts(4)
+            + [lambda: self.user_admin.alter("user0", traits={"omvs:uid": 5})] * 4
+        )
+        self.assertEqual(self.max_in_flight, 2)
+
+    def test_request_governor_is_not_installed_by_default(self):
+        RequestGovernor(max_in_flight=1)
+        self.__run_concurrently(self.__extracts(4))
+        self.assertEqual(self.max_in_flight, 4)
+
+    def test_request_governor_uninstall(self):
+        RequestGovernor(max_in_flight=1).install()
+        RequestGovernor.uninstall()
+        self.__run_concurrently(self.__extracts(4))
+        self.assertEqual(self.max_in_flight, 4)
+
+    # ============================================================================
+    # Requests Per Second
+    # ============================================================================
+    def test_request_governor_limits_requests_per_second(self):
+        RequestGovernor(requests_per_second=20).install()
+        start_time = time.perf_counter()
+        self.__run_concurrently(self.__extracts(25))
+        # 20 requests can be made right away, and the other 5 must wait for tokens.
+        self.assertGreaterEqual(time.perf_counter() - start_time, 0.25)
+
+    def test_request_governor_limits_writes_per_second_without_limiting_reads(self):
+        RequestGovernor(writes_per_second=1).install()
+        self.user_admin.alter("user0", traits={"omvs:uid": 5})
+        start_time = time.perf_counter()
+        self.__run_concurrently(self.__extracts(10))
+        self.assertLess(time.perf_counter() - start_time, 0.5)
+
+    # ============================================================================
+    # Statistics
+    # ============================================================================
+    def test_request_governor_statistics(self):
+        request_governor = RequestGovernor(max_in_flight=1)
+        request_governor.install()
+        self.__run_concurrently(self.__extracts(3))
+        self.user_admin.alter("user0", traits={"omvs:uid": 5})
+        statistics = request_governor.get_statistics()
+        self.assertEqual(statistics["total"]["requests"], 4)
+        self.assertEqual(statistics["read"]["requests"], 3)
+        self.assertEqual(statistics["write"]["requests"], 1)
+        self.assertEqual(statistics["total"]["inFlight"], 0)
+        self.assertEqual(statistics["total"]["queued"], 0)
+        # The last of 3 concurrent extracts waits for the other 2 to complete.
+        self.assertGreaterEqual(statistics["total"]["maxWaitSeconds"], 0.1)
+        self.assertGreaterEqual(
+            statistics["total"]["totalWaitSeconds"],
+            statistics["total"]["maxWaitSeconds"],
+        )
+
+    def test_request_governor_counts_batch_with_a_write_as_a_write(self):
+        request_governor = RequestGovernor()
+        request_governor.install()
+        with SecurityBatch() as batch:
+            self.user_admin.extract("user0")
+            self.user_admin.add("eswift")
+        batch.submit()
+        statistics = request_governor.get_statistics()
+        self.assertEqual(statistics["read"]["requests"], 0)
+        self.assertEqual(statistics["write"]["requests"], 1)
@@ -0,0 +1,241 @@
+"""Test streaming security result parser."""
+
+import glob
+import os
+import unittest
+from typing import Iterator, Union
+from unittest.mock import Mock, patch
+
+import __init__
+
+import tests.user.test_user_constants as TestUserConstants
+from pyracf import RACFSimulator, SecurityResultStream, UserAdmin
+from pyracf.common.irrsmo00 import IRRSMO00
+from pyracf.common.security_result import SecurityResult
+
+# Resolves F401
+__init__
+
+
+class TestSecurityResultStream(unittest.TestCase):
+    maxDiff = None
+
+    def __build_result_dictionary(self, stream: SecurityResultStream) -> dict:
+        """Rebuild the result dictionary of 'SecurityResult' from stream events."""
+        security_result = {}
+        definition_dictionary = None
+        command_dictionary = None
+        for event, value in stream:
+            if event == "definition":
+                (definition_tag, definition_dictionary) = value
+                if definition_tag not in security_result:
+                    security_result[definition_tag] = definition_dictionary
+                elif isinstance(security_result[definition_tag], list):
+                    security_result[definition_tag].append(definition_dictionary)
+                else:
+                    security_result[definition_tag] = [
+                        security_result[definition_tag],
+                        definition_dictionary,
+                    ]
+            elif event == "info":
+                definition_dictionary.setdefault("info", []).append(value)
+            elif event == "error":
+                definition_dictionary["error"] = value
+            elif event == "command":
+                command_dictionary = value
+                definition_dictionary.setdefault("commands", []).append(value)
+            elif event == "message":
+                command_dictionary.setdefault("messages", []).append(value)
+            elif event == "result":
+                security_result.update(value)
+        return {"securityResult": security_result}
+
+    def __iter_chunks(
+        self, result_xml: Union[str, bytes], chunk_size: int
+    ) -> Iterator[Union[str, memoryview]]:
+        """
+        Split result XML into chunks like IRRSMO00 does, reusing one response buffer
+        for every chunk of undecoded result XML.
+        """
+        if isinstance(result_xml, str):
+            for i in range(0, len(result_xml), chunk_size):
+                yield result_xml[i : i + chunk_size]
+            return
+        response_buffer = bytearray(chunk_size)
+        for i in range(0, len(result_xml), chunk_size):
+            chunk = result_xml[i : i + chunk_size]
+            response_buffer[: len(chunk)] = chunk
+            yield memoryview(response_buffer)[: len(chunk)]
+
+    # ============================================================================
+    # Events
+    # ============================================================================
+    def test_security_result_stream_matches_security_result(self):
+        samples = glob.glob(
+            os.path.join(os.path.dirname(__file__), "..", "*", "*_samples", "*.xml")
+        )
+        result_samples = [sample for sample in samples if "_result_" in sample]
+        self.assertNotEqual(result_samples, [])
+        for result_sample in result_samples:
+            with open(result_sample, "r", encoding="utf-8") as result_file:
+                result_xml = result_file.read()
+            with self.subTest(result_sample=os.path.basename(result_sample)):
+                self.assertEqual(
+                    self.__build_result_dictionary(SecurityResultStream(result_xml)),
+                    SecurityResult(result_xml).get_result_dictionary(),
+                )
+
+    def test_security_result_stream_yields_command_before_its_messages(self):
+        events = list(
+            SecurityResultStream(
+                TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_XML
+            )
+        )
+        self.assertEqual(
+            events[:3],
+            [
+                (
+                    "definition",
+                    (
+                        "user",
+                        {
+                            "name": "SQUIDWRD",
+                            "operation": "listdata",
+                            "requestId": "UserRequest",
+                        },
+                    ),
+                ),
+                (
+                    "command",
+                    {
+                        "safReturnCode": 0,
+                        "returnCode": 0,
+                        "reasonCode": 0,
+                        "image": "LISTUSER SQUIDWRD  OMVS    ",
+                    },
+                ),
+                (
+                    "message",
+                    "USER=SQUIDWRD  NAME=SQUIDWARD             OWNER=LEONARD   "
+                    + "CREATED=23.087",
+                ),
+            ],
+        )
+        self.assertEqual(events[-1], ("result", {"returnCode": 0, "reasonCode": 0}))
+
+    def test_security_result_stream_iter_messages(self):
+        result_xml = TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_XML
+        self.assertEqual(
+            list(SecurityResultStream(result_xml).iter_messages()),
+            SecurityResult(result_xml).get_result_dictionary()["securityResult"][
+                "user"
+            ]["commands"][0]["messages"],
+        )
+
+    # ============================================================================
+    # Streaming
+    # ============================================================================
+    def test_security_result_stream_yields_messages_before_the_end_of_the_result(
+        self,
+    ):
+        message_lines = "".join(f"<message>LINE {i}</message>" for i in range(50000))
+        result_xml = (
+            '<securityresult xmlns="http://www.ibm.com/systems/zos/saf/'
+            + 'IRRSMO00Result1"><user name="SQUIDWRD" operation="listdata" '
+            + 'requestid="UserRequest"><command><safreturncode>0</safreturncode>'
+            + f"<image>LISTUSER SQUIDWRD</image>{message_lines}</command></user>"
+            + "<returncode>0</returncode><reasoncode>0</reasoncode></securityresult>"
+        )
+        messages = SecurityResultStream(result_xml).iter_messages()
+        # The first message is yielded after only the first block has been parsed.
+        self.assertEqual(next(messages), "LINE 0")
+        self.assertEqual(sum(1 for _ in messages), 49999)
+
+    def test_security_result_stream_can_parse_result_xml_in_chunks(self):
+        result_xml = TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_XML
+        events = list(SecurityResultStream(result_xml))
+        for chunk_size in [1, 7, 100, len(result_xml) - 1]:
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    list(
+                        SecurityResultStream(self.__iter_chunks(result_xml, chunk_size))
+                    ),
+                    events,
+                )
+
+    def test_security_result_stream_can_parse_ebcdic_result_xml_in_chunks(self):
+        # 'cp1047' is not available off platform, so 'cp500' stands in for EBCDIC.
+        result_xml = TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_XML
+        self.assertEqual(
+            list(
+                SecurityResultStream(
+                    self.__iter_chunks(result_xml.encode("cp500"), 100),
+                    encoding="cp500",
+                )
+            ),
+            list(SecurityResultStream(result_xml)),
+        )
+
+    def test_security_result_stream_decodes_characters_split_across_chunks(self):
+        result_xml = TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_XML
+        # Every other chunk boundary falls in the middle of a UTF-16 character.
+        self.assertEqual(
+            list(
+                SecurityResultStream(
+                    self.__iter_chunks(result_xml.encode("utf-16-le"), 99),
+                    encoding="utf-16-le",
+                )
+            ),
+            list(SecurityResultStream(result_xml)),
+        )
+
+    # ============================================================================
+    # Encoding
+    # ============================================================================
+    def test_security_result_stream_can_parse_ebcdic_result_xml(self):
+        # 'cp1047' is not available off platform, so 'cp500' stands in for EBCDIC.
+        result_xml = TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_XML
+        self.assertEqual(
+            list(
+                SecurityResultStream(
+                    memoryview(result_xml.encode("cp500")), encoding="cp500"
+                )
+            ),
+            list(SecurityResultStream(result_xml)),
+        )
+
+    def test_security_result_stream_can_parse_utf_8_result_xml(self):
+        result_xml = TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_XML
+        self.assertEqual(
+            list(SecurityResultStream(result_xml.encode("utf-8"), encoding="utf-8")),
+            list(SecurityResultStream(result_xml)),
+        )
+
+    # ============================================================================
+    # Security Admin
+    # ============================================================================
+    @patch("pyracf.common.irrsmo00.IRRSMO00.call_racf_chunks")
+    def test_security_admin_streams_irrsmo00_response_chunks(
+        self, call_racf_chunks_mock: Mock
+    ):
+        result_xml = TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_XML
+        call_racf_chunks_mock.return_value = self.__iter_chunks(
+            result_xml.encode("utf-8"), 1000
+        )
+        with patch.object(IRRSMO00, "__init__", Mock(return_value=None)):
+            user_admin = UserAdmin()
+        stream = user_admin.extract_stream("squidwrd", segments={"omvs": True})
+        call_racf_chunks_mock.assert_not_called()
+        self.assertEqual(list(stream), list(SecurityResultStream(result_xml)))
+        call_racf_chunks_mock.assert_called_once()
+        self.assertTrue(call_racf_chunks_mock.call_args.kwargs["zero_copy"])
+
+    def test_security_admin_streams_results_of_any_transport(self):
+        user_admin = UserAdmin(transport=RACFSimulator())
+        user_admin.add("squidwrd", traits={"omvs:home": "/u/squidwrd"})
+        messages = list(
+            user_admin.extract_stream(
+                "squidwrd", segments={"omvs": True}
+            ).iter_messages()
+        )
+        self.assertIn("HOME= /u/squidwrd", messages)
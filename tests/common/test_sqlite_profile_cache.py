@@ -0,0 +1,201 @@
+"""Test profile extract cache shared by processes using SQLite."""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+import __init__
+
+import tests.common.test_common_constants as TestCommonConstants
+from pyracf import (
+    ConnectionAdmin,
+    GroupAdmin,
+    SecurityRequestError,
+    SQLiteProfileCache,
+    UserAdmin,
+)
+
+# Resolves F401
+__init__
+
+
+class TestSQLiteProfileCache(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self) -> None:
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.database_file = os.path.join(temporary_directory.name, "cache.db")
+        (racf_simulator, self.call_racf_mock) = TestCommonConstants.get_racf_simulator()
+        self.racf_simulator = racf_simulator
+        self.profile_cache = SQLiteProfileCache(self.database_file)
+        self.user_admin = UserAdmin(
+            transport=racf_simulator, profile_cache=self.profile_cache
+        )
+        self.user_admin.add("squidwrd", traits={"omvs:uid": 2424})
+        self.call_racf_mock.reset_mock()
+
+    def __new_user_admin(self) -> UserAdmin:
+        """Build a user admin like another process would, with its own cache object."""
+        return UserAdmin(
+            transport=self.racf_simulator,
+            profile_cache=SQLiteProfileCache(self.database_file),
+        )
+
+    def __get_groups(self, userid: str) -> dict:
+        """Get the groups a user is connected to from its profile."""
+        return self.user_admin.extract(userid, profile_only=True)["base"]["groups"]
+
+    # ============================================================================
+    # Shared Profile Extract
+    # ============================================================================
+    def test_sqlite_profile_cache_is_shared_by_cache_objects(self):
+        self.assertEqual(self.user_admin.get_omvs_uid("squidwrd"), 2424)
+        self.assertEqual(self.__new_user_admin().get_omvs_uid("squidwrd"), 2424)
+        self.assertEqual(self.call_racf_mock.call_count, 1)
+
+    @patch("pyracf.user.user_admin.UserAdmin._format_profile")
+    def test_sqlite_profile_cache_skips_formatting_cached_profiles(
+        self, format_profile_mock: Mock
+    ):
+        result = UserAdmin(transport=self.racf_simulator).extract("squidwrd")
+        profile_cache = SQLiteProfileCache(self.database_file)
+        profile_key = ("user", "SQUIDWRD", "", "", "", "")
+        profile_cache.put(
+            profile_key, (), result, profile_cache.get_version(profile_key)
+        )
+        format_profile_mock.reset_mock()
+        self.assertEqual(self.__new_user_admin().extract("squidwrd"), result)
+        format_profile_mock.assert_not_called()
+
+    def test_sqlite_profile_cache_is_invalidated_for_all_cache_objects(self):
+        self.assertEqual(self.user_admin.get_omvs_uid("squidwrd"), 2424)
+        self.__new_user_admin().set_omvs_uid("squidwrd", 1919)
+        self.assertEqual(self.user_admin.get_omvs_uid("squidwrd"), 1919)
+        self.assertEqual(self.call_racf_mock.call_count, 3)
+
+    def test_sqlite_profile_cache_is_invalidated_for_user_and_group_by_connection(
+        self,
+    ):
+        group_admin = GroupAdmin(
+            transport=self.racf_simulator, profile_cache=self.profile_cache
+        )
+        connection_admin = ConnectionAdmin(
+            transport=self.racf_simulator,
+            profile_cache=SQLiteProfileCache(self.database_file),
+        )
+        group_admin.add("testgrp0")
+        self.assertFalse(
+            group_admin.has_group_special_authority("testgrp0", "squidwrd")
+        )
+        self.assertNotIn("TESTGRP0", self.__get_groups("squidwrd"))
+        connection_admin.give_group_special_authority("squidwrd", "testgrp0")
+        self.assertTrue(group_admin.has_group_special_authority("testgrp0", "squidwrd"))
+        self.assertIn("TESTGRP0", self.__get_groups("squidwrd"))
+
+    def test_sqlite_profile_cache_is_invalidated_for_groups_by_user_delete(self):
+        group_admin = GroupAdmin(
+            transport=self.racf_simulator, profile_cache=self.profile_cache
+        )
+        self.assertIn("squidwrd", group_admin.get_connect_attributes("sys1"))
+        self.__new_user_admin().delete("squidwrd")
+        self.assertNotIn("squidwrd", group_admin.get_connect_attributes("sys1"))
+
+    def test_sqlite_profile_cache_shares_profiles_not_found(self):
+        self.profile_cache.not_found_ttl = 5
+        with self.assertRaises(SecurityRequestError):
+            self.user_admin.extract("eswift")
+        user_admin = UserAdmin(
+            transport=self.racf_simulator,
+            profile_cache=SQLiteProfileCache(self.database_file, not_found_ttl=5),
+        )
+        with self.assertRaises(SecurityRequestError):
+            user_admin.extract("eswift")
+        self.assertEqual(self.call_racf_mock.call_count, 1)
+        user_admin.add("eswift")
+        user_admin.extract("eswift")
+        self.user_admin.extract("eswift")
+        self.assertEqual(self.call_racf_mock.call_count, 3)
+
+    # ============================================================================
+    # Versions, Expiration and Eviction
+    # ============================================================================
+    def test_sqlite_profile_cache_does_not_cache_outdated_results(self):
+        profile_key = ("user", "SQUIDWRD", "", "", "", "")
+        version = self.profile_cache.get_version(profile_key)
+        SQLiteProfileCache(self.database_file).invalidate(profile_key)
+        self.profile_cache.put(profile_key, (), {"outdated": True}, version)
+        self.assertIsNone(self.profile_cache.get(profile_key, ()))
+        self.assertGreater(self.profile_cache.get_version(profile_key), version)
+
+    def test_sqlite_profile_cache_does_not_cache_results_outdated_by_a_prefix(self):
+        profile_key = ("group", "TESTGRP0", "", "", "", "")
+        version = self.profile_cache.get_version(profile_key)
+        SQLiteProfileCache(self.database_file).invalidate(("group",))
+        self.profile_cache.put(profile_key, (), {"outdated": True}, version)
+        self.assertIsNone(self.profile_cache.get(profile_key, ()))
+
+    def test_sqlite_profile_cache_only_keeps_versions_of_recent_profiles(self):
+        self.profile_cache.max_size = 2
+        profile_key = ("user", "SQUIDWRD", "", "", "", "")
+        version = self.profile_cache.get_version(profile_key)
+        self.profile_cache.invalidate(profile_key)
+        for userid in ["IBMUSER", "ESWIFT", "LEONARD"]:
+            self.profile_cache.invalidate(("user", userid, "", "", "", ""))
+        with sqlite3.connect(self.database_file) as connection:
+            self.assertEqual(
+                connection.execute("SELECT count(*) FROM profile_versions").fetchone(),
+                (2,),
+            )
+        # The version of a profile never goes back to a version it had before.
+        self.assertGreater(self.profile_cache.get_version(profile_key), version)
+        self.profile_cache.put(profile_key, (), {"outdated": True}, version)
+        self.assertIsNone(self.profile_cache.get(profile_key, ()))
+
+    def test_sqlite_profile_cache_hits_do_not_wait_for_the_write_lock(self):
+        self.user_admin.extract("squidwrd")
+        connection = sqlite3.connect(self.database_file, isolation_level=None)
+        self.addCleanup(connection.close)
+        connection.execute("BEGIN IMMEDIATE")
+        self.addCleanup(connection.execute, "ROLLBACK")
+        self.profile_cache.get_version(("user", "SQUIDWRD", "", "", "", ""))
+        self.user_admin.extract("squidwrd")
+        self.assertEqual(self.call_racf_mock.call_count, 1)
+
+    @patch("pyracf.common.sqlite_profile_cache.time.time")
+    def test_sqlite_profile_cache_entries_expire(self, time_mock: Mock):
+        self.profile_cache.ttl = 30
+        time_mock.return_value = 1000.0
+        self.user_admin.extract("squidwrd")
+        time_mock.return_value = 1029.0
+        self.user_admin.extract("squidwrd")
+        self.assertEqual(self.call_racf_mock.call_count, 1)
+        time_mock.return_value = 1030.0
+        self.user_admin.extract("squidwrd")
+        self.assertEqual(self.call_racf_mock.call_count, 2)
+
+    @patch("pyracf.common.sqlite_profile_cache.time.time")
+    def test_sqlite_profile_cache_evicts_least_recently_used_entries(
+        self, time_mock: Mock
+    ):
+        self.profile_cache.max_size = 2
+        self.user_admin.add("eswift")
+        for current_time, userid in enumerate(["squidwrd", "ibmuser", "squidwrd"]):
+            time_mock.return_value = 1000.0 + current_time
+            self.user_admin.extract(userid)
+        time_mock.return_value = 1003.0
+        self.user_admin.extract("eswift")
+        self.assertEqual(len(self.profile_cache), 2)
+        self.call_racf_mock.reset_mock()
+        self.user_admin.extract("squidwrd")
+        self.assertEqual(self.call_racf_mock.call_count, 0)
+        self.user_admin.extract("ibmuser")
+        self.assertEqual(self.call_racf_mock.call_count, 1)
+
+    def test_sqlite_profile_cache_replaces_tables_with_older_layout(self):
+        self.user_admin.extract("squidwrd")
+        with sqlite3.connect(self.database_file) as connection:
+            connection.execute("PRAGMA user_version = 0")
+        self.assertEqual(len(SQLiteProfileCache(self.database_file)), 0)
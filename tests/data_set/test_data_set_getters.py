@@ -100,3 +100,21 @@ class TestDataSetGetters(unittest.TestCase):
         )
         with self.assertRaises(SecurityRequestError):
             self.data_set_admin.get_my_access("ESWIFT.TEST.T1136242.P3020470")
+
+    # ============================================================================
+    # Multiple Fields
+    # ============================================================================
+    def test_data_set_admin_get_fields(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestDataSetConstants.TEST_EXTRACT_DATA_SET_RESULT_BASE_SUCCESS_XML
+        )
+        self.assertEqual(
+            self.data_set_admin.get_fields(
+                "ESWIFT.TEST.T1136242.P3020470", ["base:owner", "base:universalAccess"]
+            ),
+            {"base:owner": "eswift", "base:universalAccess": "read"},
+        )
+        call_racf_mock.assert_called_once()
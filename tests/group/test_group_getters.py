@@ -6,8 +6,9 @@ from unittest.mock import Mock, patch
 import __init__
 
 import tests.group.test_group_constants as TestGroupConstants
-from pyracf import GroupAdmin, SecurityRequestError
+from pyracf import GroupAdmin, ProfileCache, SecurityRequestError
 from pyracf.common.irrsmo00 import IRRSMO00
+from pyracf.group.group_admin import _GroupProfile
 
 # Resolves F401
 __init__
@@ -240,3 +241,117 @@ class TestGroupGetters(unittest.TestCase):
             TestGroupConstants.TEST_EXTRACT_GROUP_RESULT_BASE_ONLY_NO_OMVS_SUCCESS_XML
         )
         self.assertIsNone(self.group_admin.get_ovm_gid("TESTGRP0"))
+
+    # ============================================================================
+    # Connect Authorities
+    # ============================================================================
+    def test_group_admin_get_connect_authorities(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestGroupConstants.TEST_EXTRACT_GROUP_RESULT_BASE_ONLY_NO_OMVS_SUCCESS_XML
+        )
+        self.assertEqual(
+            self.group_admin.get_connect_authorities("TESTGRP0", "ESWIFT"),
+            {
+                "special": True,
+                "operations": False,
+                "auditor": False,
+                "grpacc": False,
+            },
+        )
+        call_racf_mock.assert_called_once()
+
+    def test_group_admin_get_connect_attributes_of_many_users(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestGroupConstants.TEST_EXTRACT_GROUP_RESULT_BASE_ONLY_NO_OMVS_SUCCESS_XML
+        )
+        self.assertEqual(
+            self.group_admin.get_connect_attributes(
+                "TESTGRP0", ["ESWIFT", "leonard", "SQUIDWRD"]
+            ),
+            {"ESWIFT": ["special"], "leonard": ["operations"], "SQUIDWRD": None},
+        )
+        call_racf_mock.assert_called_once()
+
+    def test_group_admin_get_connect_attributes_of_all_users(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestGroupConstants.TEST_EXTRACT_GROUP_RESULT_BASE_ONLY_NO_OMVS_SUCCESS_XML
+        )
+        self.assertEqual(
+            self.group_admin.get_connect_attributes("TESTGRP0"),
+            {"eswift": ["special"], "leonard": ["operations"]},
+        )
+
+    def test_group_admin_get_connect_attributes_with_no_users(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestGroupConstants.TEST_EXTRACT_GROUP_RESULT_BASE_OMVS_SUCCESS_XML
+        )
+        self.assertEqual(
+            self.group_admin.get_connect_attributes("TESTGRP0", ["ESWIFT"]),
+            {"ESWIFT": None},
+        )
+
+    def test_group_admin_builds_connect_index_once_per_extract(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestGroupConstants.TEST_EXTRACT_GROUP_RESULT_BASE_ONLY_NO_OMVS_SUCCESS_XML
+        )
+        group_admin = GroupAdmin(profile_cache=ProfileCache())
+        with patch.object(
+            _GroupProfile, "__init__", autospec=True, side_effect=_GroupProfile.__init__
+        ) as group_profile_init_mock:
+            self.assertEqual(
+                group_admin.get_connect_attributes("TESTGRP0", ["ESWIFT"]),
+                {"ESWIFT": ["special"]},
+            )
+            self.assertTrue(
+                group_admin.has_group_operations_authority("TESTGRP0", "LEONARD")
+            )
+            self.assertEqual(
+                group_admin.get_connect_attributes("TESTGRP0"),
+                {"eswift": ["special"], "leonard": ["operations"]},
+            )
+        group_profile_init_mock.assert_called_once()
+        call_racf_mock.assert_called_once()
+
+    def test_group_admin_get_connect_attributes_raises_an_exception_when_extract_fails(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestGroupConstants.TEST_EXTRACT_GROUP_RESULT_BASE_OMVS_ERROR_XML
+        )
+        with self.assertRaises(SecurityRequestError):
+            self.group_admin.get_connect_attributes("TESTGRP0", ["ESWIFT"])
+
+    # ============================================================================
+    # Multiple Fields
+    # ============================================================================
+    def test_group_admin_get_fields(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestGroupConstants.TEST_EXTRACT_GROUP_RESULT_BASE_OMVS_SUCCESS_XML
+        )
+        self.assertEqual(
+            self.group_admin.get_fields(
+                "TESTGRP0", ["base:owner", "base:superiorGroup", "omvs:gid"]
+            ),
+            {"base:owner": "eswift", "base:superiorGroup": "sys1", "omvs:gid": 1234567},
+        )
+        call_racf_mock.assert_called_once()
+        self.assertIn(b"<omvs", call_racf_mock.call_args.args[0])
@@ -113,6 +113,36 @@ class TestGroupResultParser(unittest.TestCase):
             TestGroupConstants.TEST_EXTRACT_GROUP_RESULT_BASE_ONLY_NO_OMVS_SUCCESS_JSON,
         )
 
+    def test_group_admin_can_parse_extract_group_with_many_users(
+        self,
+        call_racf_mock: Mock,
+    ):
+        result_xml = (
+            TestGroupConstants.TEST_EXTRACT_GROUP_RESULT_BASE_ONLY_NO_OMVS_SUCCESS_XML
+        )
+        user = result_xml[
+            result_xml.index("<message>      LEONARD") : result_xml.rindex("</message>")
+            + len("</message>")
+        ]
+        result_xml = result_xml.replace(
+            user,
+            "".join(user.replace("LEONARD ", f"USER{i:<4}") for i in range(1000)),
+        )
+        call_racf_mock.return_value = result_xml
+        profile = self.group_admin.extract("TESTGRP0", profile_only=True)
+        self.assertEqual(len(profile["base"]["users"]), 1001)
+        self.assertEqual(
+            profile["base"]["users"][1000],
+            {
+                **profile["base"]["users"][1],
+                "userid": "user999",
+            },
+        )
+        self.assertEqual(
+            profile["base"]["users"][1000]["connectAttributes"], ["operations"]
+        )
+        self.assertTrue(profile["base"]["terminalUniversalAccess"])
+
     # Error in environment, TESTGRP0 already deleted/not added
     def test_group_admin_can_parse_extract_group_base_omvs_error_xml(
         self,
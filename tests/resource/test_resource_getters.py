@@ -95,3 +95,21 @@ class TestResourceGetters(unittest.TestCase):
         )
         with self.assertRaises(SecurityRequestError):
             self.resource_admin.get_my_access("TESTING", "ELIJTEST")
+
+    # ============================================================================
+    # Multiple Fields
+    # ============================================================================
+    def test_resource_admin_get_fields(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestResourceConstants.TEST_EXTRACT_RESOURCE_RESULT_BASE_SUCCESS_XML
+        )
+        self.assertEqual(
+            self.resource_admin.get_fields(
+                "TESTING", "ELIJTEST", ["base:owner", "base:yourAccess"]
+            ),
+            {"base:owner": "eswift", "base:yourAccess": "read"},
+        )
+        call_racf_mock.assert_called_once()
@@ -115,6 +115,29 @@ class TestResourceResultParser(unittest.TestCase):
             TestResourceConstants.TEST_EXTRACT_RESOURCE_RESULT_MULTI_BASE_SUCCESS_DICTIONARY,
         )
 
+    def test_resource_admin_extract_many_reports_result_for_each_resource(
+        self,
+        call_racf_mock: Mock,
+    ):
+        def call_racf(request_xml: bytes, *_, **__) -> str:
+            if b'name="TESTING"' in request_xml:
+                return (
+                    TestResourceConstants.TEST_EXTRACT_RESOURCE_RESULT_BASE_SUCCESS_XML
+                )
+            return TestResourceConstants.TEST_EXTRACT_RESOURCE_RESULT_BASE_ERROR_XML
+
+        call_racf_mock.side_effect = call_racf
+        results = dict(
+            self.resource_admin.extract_many(["TESTING", "MISSING"], "ELIJTEST")
+        )
+        self.assertEqual(
+            results["TESTING"],
+            TestResourceConstants.TEST_EXTRACT_RESOURCE_RESULT_BASE_SUCCESS_DICTIONARY,
+        )
+        self.assertIsInstance(results["MISSING"], SecurityRequestError)
+        for call in call_racf_mock.call_args_list:
+            self.assertIn(b'class="ELIJTEST"', call.args[0])
+
     # Error in environment, TESTING already deleted/not added
     def test_resource_admin_can_parse_extract_resource_base_error_xml(
         self,
@@ -0,0 +1,122 @@
+"""Test cached snapshot of RACF options."""
+
+import unittest
+from unittest.mock import Mock, patch
+
+import __init__
+
+import tests.setropts.test_setropts_constants as TestSetroptsConstants
+from pyracf import SecurityRequestError, SetroptsSnapshot
+from pyracf.common.irrsmo00 import IRRSMO00
+from pyracf.setropts.setropts_admin import SetroptsAdmin
+
+# Resolves F401
+__init__
+
+
+@patch("pyracf.common.irrsmo00.IRRSMO00.call_racf")
+class TestSetroptsSnapshot(unittest.TestCase):
+    maxDiff = None
+    IRRSMO00.__init__ = Mock(return_value=None)
+
+    # ============================================================================
+    # Snapshot Queries
+    # ============================================================================
+    def test_setropts_snapshot_answers_class_questions(self, call_racf_mock: Mock):
+        call_racf_mock.return_value = (
+            TestSetroptsConstants.TEST_LIST_SETROPTS_RESULT_SUCCESS_XML
+        )
+        snapshot = SetroptsAdmin().get_snapshot()
+        self.assertIsInstance(snapshot, SetroptsSnapshot)
+        self.assertEqual(
+            snapshot.get_class_attributes("facility"),
+            TestSetroptsConstants.TEST_SETROPTS_CLASS_ATTRIBUTES,
+        )
+        self.assertTrue(snapshot.is_class_active("FACILITY"))
+        self.assertTrue(snapshot.is_class_raclisted("FACILITY"))
+        self.assertTrue(snapshot.is_class_generic("FACILITY"))
+        self.assertFalse(snapshot.has_class_attribute("FACILITY", "statistics"))
+        self.assertEqual(snapshot.get_class_attributes("NOTACLASS"), [])
+
+    def test_setropts_snapshot_get_password_rules(self, call_racf_mock: Mock):
+        call_racf_mock.return_value = (
+            TestSetroptsConstants.TEST_LIST_SETROPTS_RESULT_SUCCESS_XML
+        )
+        self.assertEqual(
+            SetroptsAdmin().get_snapshot().get_password_rules(),
+            TestSetroptsConstants.TEST_SETROPTS_PASSWORD_RULES,
+        )
+
+    def test_setropts_snapshot_raises_an_exception_when_extract_fails(
+        self, call_racf_mock: Mock
+    ):
+        call_racf_mock.return_value = (
+            TestSetroptsConstants.TEST_ALTER_SETROPTS_RESULT_ERROR_XML
+        )
+        with self.assertRaises(SecurityRequestError):
+            SetroptsAdmin(snapshot_ttl=60).get_snapshot()
+
+    def test_setropts_snapshot_generate_requests_only(self, call_racf_mock: Mock):
+        result = SetroptsAdmin(
+            generate_requests_only=True, snapshot_ttl=60
+        ).get_snapshot()
+        self.assertEqual(result, TestSetroptsConstants.TEST_LIST_SETROPTS_REQUEST_XML)
+        call_racf_mock.assert_not_called()
+
+    # ============================================================================
+    # Snapshot Reuse
+    # ============================================================================
+    def test_setropts_snapshot_is_not_reused_by_default(self, call_racf_mock: Mock):
+        call_racf_mock.return_value = (
+            TestSetroptsConstants.TEST_LIST_SETROPTS_RESULT_SUCCESS_XML
+        )
+        setropts_admin = SetroptsAdmin()
+        setropts_admin.get_class_attributes("FACILITY")
+        setropts_admin.get_password_rules()
+        self.assertEqual(call_racf_mock.call_count, 2)
+
+    def test_setropts_snapshot_is_reused_until_it_expires(self, call_racf_mock: Mock):
+        call_racf_mock.return_value = (
+            TestSetroptsConstants.TEST_LIST_SETROPTS_RESULT_SUCCESS_XML
+        )
+        setropts_admin = SetroptsAdmin(snapshot_ttl=30)
+        with patch("pyracf.setropts.setropts_admin.time.monotonic") as monotonic_mock:
+            monotonic_mock.return_value = 1000.0
+            for class_name in ["FACILITY", "SURROGAT", "PROGRAM", "UNIXPRIV"]:
+                setropts_admin.get_class_attributes(class_name)
+            monotonic_mock.return_value = 1029.0
+            self.assertEqual(
+                setropts_admin.get_password_rules(),
+                TestSetroptsConstants.TEST_SETROPTS_PASSWORD_RULES,
+            )
+            self.assertEqual(call_racf_mock.call_count, 1)
+            monotonic_mock.return_value = 1030.0
+            setropts_admin.get_password_rules()
+            self.assertEqual(call_racf_mock.call_count, 2)
+
+    def test_setropts_snapshot_is_invalidated_by_alter(self, call_racf_mock: Mock):
+        setropts_admin = SetroptsAdmin(snapshot_ttl=60)
+        call_racf_mock.side_effect = [
+            TestSetroptsConstants.TEST_LIST_SETROPTS_RESULT_SUCCESS_XML,
+            TestSetroptsConstants.TEST_ALTER_SETROPTS_RESULT_SUCCESS_XML,
+            TestSetroptsConstants.TEST_LIST_SETROPTS_RESULT_SUCCESS_XML,
+        ]
+        setropts_admin.get_class_attributes("FACILITY")
+        setropts_admin.add_raclist_class("ELIJTEST")
+        setropts_admin.get_class_attributes("FACILITY")
+        self.assertEqual(call_racf_mock.call_count, 3)
+
+    def test_setropts_snapshot_is_invalidated_by_failed_alter(
+        self, call_racf_mock: Mock
+    ):
+        setropts_admin = SetroptsAdmin(snapshot_ttl=60)
+        call_racf_mock.side_effect = [
+            TestSetroptsConstants.TEST_LIST_SETROPTS_RESULT_SUCCESS_XML,
+            TestSetroptsConstants.TEST_ALTER_SETROPTS_RESULT_ERROR_XML,
+            TestSetroptsConstants.TEST_LIST_SETROPTS_RESULT_SUCCESS_XML,
+        ]
+        setropts_admin.get_password_rules()
+        with self.assertRaises(SecurityRequestError):
+            setropts_admin.alter(options={"base:raclist": "ELIJTEST"})
+        setropts_admin.get_password_rules()
+        self.assertEqual(call_racf_mock.call_count, 3)
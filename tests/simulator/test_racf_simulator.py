@@ -0,0 +1,275 @@
+"""Test in-memory RACF simulator."""
+
+import unittest
+
+import __init__
+
+from pyracf import (
+    AccessAdmin,
+    ConnectionAdmin,
+    DataSetAdmin,
+    GroupAdmin,
+    RACFSimulator,
+    ResourceAdmin,
+    SecurityBatch,
+    SecurityRequestError,
+    SetroptsAdmin,
+    UserAdmin,
+)
+
+# Resolves F401
+__init__
+
+
+class TestRACFSimulator(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self) -> None:
+        self.racf_simulator = RACFSimulator()
+        self.user_admin = UserAdmin(transport=self.racf_simulator)
+        self.group_admin = GroupAdmin(transport=self.racf_simulator)
+        self.connection_admin = ConnectionAdmin(transport=self.racf_simulator)
+        self.data_set_admin = DataSetAdmin(transport=self.racf_simulator)
+        self.resource_admin = ResourceAdmin(transport=self.racf_simulator)
+        self.access_admin = AccessAdmin(transport=self.racf_simulator)
+
+    def __get_profile(self, result: dict, definition: str) -> dict:
+        return result["securityResult"][definition]["commands"][0]["profiles"][0]
+
+    # ============================================================================
+    # User Administration
+    # ============================================================================
+    def test_racf_simulator_can_add_and_extract_user(self):
+        self.user_admin.add(
+            "squidwrd",
+            traits={
+                "base:name": "Squidward",
+                "base:special": True,
+                "omvs:uid": 2424,
+                "omvs:home": "/u/squidwrd",
+                "omvs:program": "/bin/sh",
+            },
+        )
+        profile = self.__get_profile(
+            self.user_admin.extract("squidwrd", segments={"omvs": True}), "user"
+        )
+        self.assertEqual(profile["base"]["user"], "squidwrd")
+        self.assertEqual(profile["base"]["name"], "squidward")
+        self.assertEqual(profile["base"]["owner"], "ibmuser")
+        self.assertEqual(profile["base"]["defaultGroup"], "sys1")
+        self.assertEqual(profile["base"]["attributes"], ["special", "protected"])
+        self.assertEqual(list(profile["base"]["groups"]), ["SYS1"])
+        self.assertEqual(profile["omvs"]["uid"], 2424)
+        self.assertEqual(profile["omvs"]["home"], "/u/squidwrd")
+        self.assertEqual(profile["omvs"]["program"], "/bin/sh")
+
+    def test_racf_simulator_can_alter_user(self):
+        self.user_admin.add("squidwrd")
+        self.user_admin.give_auditor_authority("squidwrd")
+        self.user_admin.set_omvs_uid("squidwrd", 1919)
+        self.assertTrue(self.user_admin.has_auditor_authority("squidwrd"))
+        self.assertEqual(self.user_admin.get_omvs_uid("squidwrd"), 1919)
+        self.user_admin.take_away_auditor_authority("squidwrd")
+        self.assertFalse(self.user_admin.has_auditor_authority("squidwrd"))
+
+    def test_racf_simulator_can_add_and_remove_class_authorizations(self):
+        self.user_admin.add("squidwrd")
+        self.user_admin.add_class_authorizations("squidwrd", ["facility", "terminal"])
+        self.assertEqual(
+            self.user_admin.get_class_authorizations("squidwrd"),
+            ["facility", "terminal"],
+        )
+        self.user_admin.remove_class_authorizations("squidwrd", ["facility"])
+        self.assertEqual(
+            self.user_admin.get_class_authorizations("squidwrd"), ["terminal"]
+        )
+
+    def test_racf_simulator_can_set_class_authorizations_with_one_alter(self):
+        self.user_admin.add("squidwrd")
+        self.user_admin.add_class_authorizations("squidwrd", ["facility", "terminal"])
+        self.user_admin.set_class_authorizations("squidwrd", ["terminal", "xfacilit"])
+        self.assertEqual(
+            self.user_admin.get_class_authorizations("squidwrd"),
+            ["terminal", "xfacilit"],
+        )
+
+    def test_racf_simulator_skips_add_user_for_existing_user_with_precheck(self):
+        self.user_admin.add("squidwrd")
+        result = self.user_admin.alter("squidwrd", traits={"base:name": "Squidward"})
+        self.assertEqual(
+            result["securityResult"]["user"]["info"],
+            ["Definition exists. Add command skipped due  to precheck option"],
+        )
+        self.assertEqual(
+            result["securityResult"]["user"]["commands"][0]["image"],
+            "ALTUSER SQUIDWRD NAME        ('Squidward') ",
+        )
+
+    def test_racf_simulator_fails_add_user_for_existing_user(self):
+        self.user_admin.add("squidwrd")
+        with self.assertRaises(SecurityRequestError) as exception:
+            self.user_admin.add("squidwrd", traits={"base:name": "Squidward"})
+        result = exception.exception.result["securityResult"]
+        self.assertEqual(result["returnCode"], 4)
+        self.assertEqual(
+            result["user"]["commands"][0]["messages"],
+            ["IKJ56702I INVALID USERID, SQUIDWRD"],
+        )
+        self.assertEqual(result["user"]["commands"][1]["returnCode"], 0)
+
+    def test_racf_simulator_can_delete_user(self):
+        self.user_admin.add("squidwrd")
+        self.user_admin.delete("squidwrd")
+        with self.assertRaises(SecurityRequestError) as exception:
+            self.user_admin.extract("squidwrd")
+        self.assertEqual(
+            exception.exception.result["securityResult"]["user"]["commands"][0][
+                "messages"
+            ],
+            ["ICH30001I UNABLE TO LOCATE USER    ENTRY SQUIDWRD"],
+        )
+
+    def test_racf_simulator_does_not_return_or_store_passwords(self):
+        result = self.user_admin.add("squidwrd", traits={"base:password": "GIyTTqdF"})
+        image = result["securityResult"]["user"]["commands"][1]["image"]
+        self.assertNotIn("GIyTTqdF", image)
+        self.assertEqual(
+            self.racf_simulator.database.users["SQUIDWRD"]["segments"]["base"][
+                "password"
+            ],
+            True,
+        )
+        profile = self.__get_profile(self.user_admin.extract("squidwrd"), "user")
+        self.assertNotIn("protected", profile["base"]["attributes"])
+
+    # ============================================================================
+    # Group and Group Connection Administration
+    # ============================================================================
+    def test_racf_simulator_can_connect_user_to_group(self):
+        self.user_admin.add("squidwrd")
+        self.group_admin.add("testgrp0", traits={"base:owner": "ibmuser"})
+        self.connection_admin.add("squidwrd", "testgrp0")
+        self.connection_admin.give_group_special_authority("squidwrd", "testgrp0")
+        profile = self.__get_profile(self.group_admin.extract("testgrp0"), "group")
+        self.assertEqual(profile["base"]["superiorGroup"], "sys1")
+        self.assertEqual(
+            profile["base"]["users"][0]["userid"],
+            "squidwrd",
+        )
+        self.assertEqual(
+            profile["base"]["users"][0]["connectAttributes"],
+            ["special"],
+        )
+        profile = self.__get_profile(self.user_admin.extract("squidwrd"), "user")
+        self.assertEqual(list(profile["base"]["groups"]), ["SYS1", "TESTGRP0"])
+
+    def test_racf_simulator_fails_to_connect_undefined_user(self):
+        self.group_admin.add("testgrp0")
+        with self.assertRaises(SecurityRequestError) as exception:
+            self.connection_admin.add("squidwrd", "testgrp0")
+        self.assertEqual(
+            exception.exception.result["securityResult"]["groupConnection"]["commands"][
+                0
+            ]["messages"],
+            [
+                "ICH51003I NAME NOT FOUND IN RACF DATA SET",
+                "ICH02003I USER(S) NOT CONNECTED.",
+            ],
+        )
+
+    def test_racf_simulator_can_remove_user_from_group(self):
+        self.user_admin.add("squidwrd")
+        self.group_admin.add("testgrp0")
+        self.connection_admin.add("squidwrd", "testgrp0")
+        self.connection_admin.delete("squidwrd", "testgrp0")
+        profile = self.__get_profile(self.group_admin.extract("testgrp0"), "group")
+        self.assertEqual(profile["base"]["users"], [])
+
+    # ============================================================================
+    # Data Set and General Resource Profile Administration
+    # ============================================================================
+    def test_racf_simulator_can_add_and_extract_data_set(self):
+        self.user_admin.add("eswift")
+        self.data_set_admin.add(
+            "ESWIFT.TEST.T1136242.P3020470", traits={"base:universal_access": "read"}
+        )
+        self.assertEqual(
+            self.data_set_admin.get_universal_access("ESWIFT.TEST.T1136242.P3020470"),
+            "read",
+        )
+        profile = self.__get_profile(
+            self.data_set_admin.extract("ESWIFT.TEST.T1136242.P3020470"), "dataSet"
+        )
+        self.assertEqual(profile["base"]["owner"], "eswift")
+        self.assertEqual(profile["base"]["volumes"], ["simvol"])
+
+    def test_racf_simulator_can_permit_access_to_resource(self):
+        self.user_admin.add("eswift")
+        self.resource_admin.add(
+            "TESTING", "ELIJTEST", traits={"base:universal_access": "read"}
+        )
+        result = self.access_admin.add(
+            "TESTING", "ELIJTEST", "eswift", traits={"base:access": "alter"}
+        )
+        self.assertEqual(
+            result["securityResult"]["permission"]["commands"][0]["image"],
+            "PERMIT               TESTING CLASS(ELIJTEST)  ACCESS      (ALTER) "
+            + "ID          (ESWIFT)",
+        )
+        self.assertEqual(
+            self.racf_simulator.database.resources[("ELIJTEST", "TESTING")][
+                "access_list"
+            ],
+            {"ESWIFT": "ALTER"},
+        )
+        self.assertEqual(
+            self.resource_admin.get_universal_access("TESTING", "ELIJTEST"), "read"
+        )
+
+    def test_racf_simulator_fails_to_permit_access_to_undefined_resource(self):
+        with self.assertRaises(SecurityRequestError) as exception:
+            self.access_admin.add(
+                "TESTING", "ELIJTEST", "ibmuser", traits={"base:access": "read"}
+            )
+        self.assertEqual(
+            exception.exception.result["securityResult"]["permission"]["commands"][0][
+                "messages"
+            ],
+            ["ICH06004I TESTING NOT DEFINED TO RACF"],
+        )
+
+    # ============================================================================
+    # Batches, Concurrent Profile Extracts and Unsupported Requests
+    # ============================================================================
+    def test_racf_simulator_can_process_batch(self):
+        with SecurityBatch() as batch:
+            self.user_admin.add("squidwrd")
+            self.group_admin.add("testgrp0")
+            self.connection_admin.add("squidwrd", "testgrp0")
+        batch.submit()
+        self.assertIn(
+            ("SQUIDWRD", "TESTGRP0"), self.racf_simulator.database.connections
+        )
+
+    def test_racf_simulator_can_extract_many_users(self):
+        self.user_admin.add("squidwrd")
+        results = dict(self.user_admin.extract_many(["squidwrd", "ibmuser", "nobody"]))
+        self.assertEqual(
+            self.__get_profile(results["squidwrd"], "user")["base"]["user"],
+            "squidwrd",
+        )
+        self.assertEqual(
+            self.__get_profile(results["ibmuser"], "user")["base"]["attributes"],
+            ["special"],
+        )
+        self.assertIsInstance(results["nobody"], SecurityRequestError)
+
+    def test_racf_simulator_returns_error_for_unsupported_request(self):
+        setropts_admin = SetroptsAdmin(transport=self.racf_simulator)
+        with self.assertRaises(SecurityRequestError) as exception:
+            setropts_admin.list_racf_options()
+        result = exception.exception.result["securityResult"]
+        self.assertEqual(result["returnCode"], 2000)
+        self.assertEqual(
+            result["systemSettings"]["error"]["textInError"], "systemsettings"
+        )
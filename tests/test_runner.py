@@ -8,6 +8,19 @@ import __init__
 from tests.access.test_access_debug_logging import TestAccessDebugLogging
 from tests.access.test_access_request_builder import TestAccessRequestBuilder
 from tests.access.test_access_result_parser import TestAccessResultParser
+from tests.batch.test_batch_request_builder import TestBatchRequestBuilder
+from tests.batch.test_batch_result_parser import TestBatchResultParser
+from tests.common.test_async_security_admin import TestAsyncSecurityAdmin
+from tests.common.test_extract_coalescing import TestExtractCoalescing
+from tests.common.test_irrsmo00 import TestIRRSMO00
+from tests.common.test_julian_date_decoder import TestJulianDateDecoder
+from tests.common.test_lazy_result_dictionary import TestLazyResultDictionary
+from tests.common.test_profile_cache import TestProfileCache
+from tests.common.test_profile_value_casting import TestProfileValueCasting
+from tests.common.test_record_replay_transport import TestRecordReplayTransport
+from tests.common.test_request_governor import TestRequestGovernor
+from tests.common.test_security_result_stream import TestSecurityResultStream
+from tests.common.test_sqlite_profile_cache import TestSQLiteProfileCache
 from tests.connection.test_connection_debug_logging import TestConnectionDebugLogging
 from tests.connection.test_connection_request_builder import (
     TestConnectionRequestBuilder,
@@ -34,6 +47,9 @@ from tests.setropts.test_setropts_getters import TestSetroptsGetters
 from tests.setropts.test_setropts_request_builder import TestSetroptsRequestBuilder
 from tests.setropts.test_setropts_result_parser import TestSetroptsResultParser
 from tests.setropts.test_setropts_setters import TestSetroptsSetters
+from tests.setropts.test_setropts_snapshot import TestSetroptsSnapshot
+from tests.simulator.test_racf_simulator import TestRACFSimulator
+from tests.user.test_user_apply import TestUserApply
 from tests.user.test_user_debug_logging import TestUserDebugLogging
 from tests.user.test_user_getters import TestUserGetters
 from tests.user.test_user_request_builder import TestUserRequestBuilder
@@ -52,6 +68,19 @@ def __test_suite() -> unittest.TestSuite:
         TestAccessResultParser,
         TestAccessRequestBuilder,
         TestAccessDebugLogging,
+        TestBatchResultParser,
+        TestBatchRequestBuilder,
+        TestAsyncSecurityAdmin,
+        TestExtractCoalescing,
+        TestIRRSMO00,
+        TestJulianDateDecoder,
+        TestLazyResultDictionary,
+        TestProfileCache,
+        TestProfileValueCasting,
+        TestRecordReplayTransport,
+        TestRequestGovernor,
+        TestSecurityResultStream,
+        TestSQLiteProfileCache,
         TestConnectionResultParser,
         TestConnectionRequestBuilder,
         TestConnectionSetters,
@@ -76,11 +105,14 @@ def __test_suite() -> unittest.TestSuite:
         TestSetroptsGetters,
         TestSetroptsSetters,
         TestSetroptsDebugLogging,
+        TestSetroptsSnapshot,
+        TestRACFSimulator,
         TestUserResultParser,
         TestUserRequestBuilder,
         TestUserGetters,
         TestUserSetters,
         TestUserDebugLogging,
+        TestUserApply,
     ]
     for test_class in test_classes:
         tests = test_loader.loadTestsFromTestCase(test_class)
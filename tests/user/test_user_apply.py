@@ -0,0 +1,117 @@
+"""Test applying desired state to user profiles."""
+
+import unittest
+
+import __init__
+
+import tests.common.test_common_constants as TestCommonConstants
+from pyracf import UserAdmin
+
+# Resolves F401
+__init__
+
+
+class TestUserApply(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self) -> None:
+        (racf_simulator, self.call_racf_mock) = TestCommonConstants.get_racf_simulator()
+        self.user_admin = UserAdmin(transport=racf_simulator)
+        self.user_admin.add(
+            "squidwrd",
+            traits={
+                "base:name": "Squidward",
+                "base:special": True,
+                "omvs:uid": 2424,
+                "omvs:home": "/u/squidwrd",
+                "omvs:program": "/bin/sh",
+            },
+        )
+        self.call_racf_mock.reset_mock()
+
+    def __get_alter_request_xml(self) -> str:
+        """Get the request XML of the alter made by 'apply()'."""
+        self.assertEqual(self.call_racf_mock.call_count, 2)
+        return self.call_racf_mock.call_args_list[1].args[0].decode("utf-8")
+
+    # ============================================================================
+    # Apply
+    # ============================================================================
+    def test_user_admin_apply_does_not_alter_when_nothing_differs(self):
+        self.assertFalse(
+            self.user_admin.apply(
+                "squidwrd",
+                {
+                    "base:name": "SQUIDWARD",
+                    "base:special": True,
+                    "base:auditor": False,
+                    "omvs:uid": 2424,
+                    "omvs:threads": None,
+                },
+            )
+        )
+        self.assertEqual(self.call_racf_mock.call_count, 1)
+
+    def test_user_admin_apply_only_alters_traits_that_differ(self):
+        result = self.user_admin.apply(
+            "squidwrd",
+            {
+                "base:special": True,
+                "base:operations": True,
+                "omvs:uid": 1919,
+                "base:name": "Squidward",
+            },
+        )
+        self.assertEqual(list(result.keys()), ["step1"])
+        request_xml = self.__get_alter_request_xml()
+        self.assertIn("<racf:oper", request_xml)
+        self.assertIn(">1919</uid>", request_xml)
+        self.assertNotIn("racf:special", request_xml)
+        self.assertNotIn("<name", request_xml)
+        self.assertEqual(self.user_admin.get_omvs_uid("squidwrd"), 1919)
+        self.assertTrue(self.user_admin.has_operations_authority("squidwrd"))
+
+    def test_user_admin_apply_removes_attributes_and_fields(self):
+        self.user_admin.apply(
+            "squidwrd", {"base:special": False, "omvs:program": False}
+        )
+        request_xml = self.__get_alter_request_xml()
+        self.assertIn("racf:special", request_xml)
+        self.assertIn("pgm", request_xml)
+        self.assertFalse(self.user_admin.has_special_authority("squidwrd"))
+        self.assertIsNone(self.user_admin.get_omvs_program("squidwrd"))
+
+    def test_user_admin_apply_always_alters_traits_that_cannot_be_compared(self):
+        self.user_admin.apply(
+            "squidwrd", {"base:password": "GIyTTqdF", "omvs:uid": 2424}
+        )
+        request_xml = self.__get_alter_request_xml()
+        self.assertIn("racf:password", request_xml)
+        self.assertNotIn("<uid", request_xml)
+
+    def test_user_admin_apply_always_alters_case_sensitive_traits(self):
+        self.user_admin.apply("squidwrd", {"omvs:home": "/u/SQUIDWRD"})
+        self.assertIn(">/u/SQUIDWRD</home>", self.__get_alter_request_xml())
+        self.call_racf_mock.reset_mock()
+        self.user_admin.apply("squidwrd", {"omvs:program": "/bin/sh"})
+        self.assertIn(">/bin/sh</pgm>", self.__get_alter_request_xml())
+
+    def test_user_admin_apply_alters_fields_of_missing_segments(self):
+        self.user_admin.add("eswift")
+        self.call_racf_mock.reset_mock()
+        self.user_admin.apply("eswift", {"omvs:uid": 1989})
+        self.assertIn(">1989</uid>", self.__get_alter_request_xml())
+
+    def test_user_admin_apply_only_extracts_segments_that_are_compared(self):
+        self.user_admin.apply("squidwrd", {"base:special": True})
+        request_xml = self.call_racf_mock.call_args.args[0].decode("utf-8")
+        self.assertNotIn("omvs", request_xml)
+
+    def test_user_admin_apply_generate_requests_only(self):
+        user_admin = UserAdmin(generate_requests_only=True)
+        request_xml = user_admin.apply("squidwrd", {"omvs:uid": 2424})
+        self.assertEqual(
+            request_xml,
+            user_admin.extract("squidwrd", segments={"omvs": True})
+            + user_admin.alter("squidwrd", traits={"omvs:uid": 2424}),
+        )
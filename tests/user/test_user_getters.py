@@ -257,3 +257,77 @@ class TestUserGetters(unittest.TestCase):
             TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_ONLY_NO_OMVS_SUCCESS_XML
         )
         self.assertIsNone(self.user_admin.get_omvs_program("squidwrd"))
+
+    # ============================================================================
+    # Authorities
+    # ============================================================================
+    def test_user_admin_get_authorities(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_XML
+        )
+        self.assertEqual(
+            self.user_admin.get_authorities("squidwrd"),
+            {"special": True, "operations": False, "auditor": False},
+        )
+        call_racf_mock.assert_called_once()
+
+    def test_user_admin_get_authorities_raises_an_exception_when_extract_fails(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_ERROR_XML
+        )
+        with self.assertRaises(SecurityRequestError):
+            self.user_admin.get_authorities("squidwrd")
+
+    # ============================================================================
+    # Multiple Fields
+    # ============================================================================
+    def test_user_admin_get_fields(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_XML
+        )
+        self.assertEqual(
+            self.user_admin.get_fields(
+                "squidwrd",
+                ["omvs:uid", "omvs:home", "base:attributes", "base:notAField"],
+            ),
+            {
+                "omvs:uid": 2424,
+                "omvs:home": "/u/squidwrd",
+                "base:attributes": ["special"],
+                "base:notAField": None,
+            },
+        )
+        call_racf_mock.assert_called_once()
+        self.assertIn(b"<omvs", call_racf_mock.call_args.args[0])
+
+    def test_user_admin_get_fields_only_requests_segments_of_fields(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_ONLY_NO_OMVS_SUCCESS_XML
+        )
+        self.assertEqual(
+            self.user_admin.get_fields("squidwrd", ["base:owner"]),
+            {"base:owner": "leonard"},
+        )
+        self.assertNotIn(b"<omvs", call_racf_mock.call_args.args[0])
+
+    def test_user_admin_get_fields_raises_an_exception_when_extract_fails(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_ERROR_XML
+        )
+        with self.assertRaises(SecurityRequestError):
+            self.user_admin.get_fields("squidwrd", ["omvs:uid"])
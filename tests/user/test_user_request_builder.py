@@ -1,6 +1,7 @@
 """Test user request builder."""
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock
 
 import __init__
@@ -110,3 +111,21 @@ class TestUserRequestBuilder(unittest.TestCase):
             result,
             TestUserConstants.TEST_ALTER_USER_REQUEST_UPDATE_SEGMENTS_XML,
         )
+
+    # ============================================================================
+    # Reentrancy
+    # ============================================================================
+    def test_user_admin_build_requests_concurrently_with_one_admin(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(
+                    lambda uid: self.user_admin.alter(
+                        f"user{uid}", traits={"omvs:uid": uid}
+                    ),
+                    range(64),
+                )
+            )
+        for uid, result in enumerate(results):
+            self.assertIn(f'name="user{uid}"'.encode(), result)
+            self.assertIn(f">{uid}</uid>".encode(), result)
+            self.assertEqual(result.count(b"<uid"), 1)
@@ -8,6 +8,7 @@ import __init__
 import tests.user.test_user_constants as TestUserConstants
 from pyracf import SecurityRequestError, UserAdmin
 from pyracf.common.irrsmo00 import IRRSMO00
+from pyracf.common.security_result import SecurityResult
 
 # Resolves F401
 __init__
@@ -113,6 +114,42 @@ class TestUserResultParser(unittest.TestCase):
             TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_ONLY_NO_OMVS_SUCCESS_JSON,
         )
 
+    def test_user_admin_can_parse_extract_user_with_many_class_authorizations_and_groups(
+        self,
+        call_racf_mock: Mock,
+    ):
+        result_xml = TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_XML
+        classes = [f"CLASS{i}" for i in range(500)]
+        result_xml = result_xml.replace(
+            "CLASS AUTHORIZATIONS=NONE", f"CLASS AUTHORIZATIONS={' '.join(classes)}"
+        )
+        connection = result_xml[
+            result_xml.index("<message>  GROUP=SYS1") : result_xml.index(
+                "<message>SECURITY-LEVEL"
+            )
+        ]
+        result_xml = result_xml.replace(
+            connection,
+            "".join(
+                connection.replace("GROUP=SYS1    ", f"GROUP=GROUP{i:<3}")
+                for i in range(500)
+            ),
+        )
+        call_racf_mock.return_value = result_xml
+        profile = self.user_admin.extract(
+            "squidwrd", segments={"omvs": True}, profile_only=True
+        )
+        self.assertEqual(
+            profile["base"]["classAuthorizations"],
+            [racf_class.lower() for racf_class in classes],
+        )
+        self.assertEqual(len(profile["base"]["groups"]), 500)
+        self.assertEqual(
+            profile["base"]["groups"]["GROUP499"],
+            profile["base"]["groups"]["GROUP0"],
+        )
+        self.assertEqual(profile["omvs"]["uid"], 2424)
+
     # Error in environment, SQUIDWRD already deleted/not added
     def test_user_admin_can_parse_extract_user_base_omvs_error_xml(
         self,
@@ -356,3 +393,95 @@ class TestUserResultParser(unittest.TestCase):
             user_admin.extract("squidwrd", {"omvs": True, "csdata": True}),
             TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_CSDATA_SUCCESS_DICTIONARY,
         )
+
+    # ============================================================================
+    # Undecoded Result XML
+    # ============================================================================
+    def test_user_admin_can_parse_extract_user_base_omvs_success_memoryview(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = memoryview(
+            TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_XML.encode(
+                "utf-8"
+            )
+        )
+        self.assertEqual(
+            self.user_admin.extract("squidwrd", segments={"omvs": True}),
+            TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_DICTIONARY,
+        )
+
+    def test_user_admin_password_redacted_add_user_success_bytes(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestUserConstants.TEST_ADD_USER_PASSWORD_RESULT_SUCCESS_XML.encode("utf-8")
+        )
+        result = self.user_admin.add(
+            "squidwrd",
+            traits=TestUserConstants.TEST_ADD_USER_REQUEST_TRAITS_PASSWORD,
+        )
+        self.assertEqual(
+            result,
+            TestUserConstants.TEST_ADD_USER_PASSWORD_RESULT_SUCCESS_DICTIONARY,
+        )
+        self.assertNotIn(self.test_password, str(result))
+
+    def test_security_result_can_parse_ebcdic_result_xml(
+        self,
+        call_racf_mock: Mock,
+    ):
+        # 'cp1047' is not available off platform, so 'cp500' stands in for EBCDIC.
+        result_xml = TestUserConstants.TEST_ADD_USER_RESULT_SUCCESS_XML
+        self.assertEqual(
+            SecurityResult(
+                memoryview(result_xml.encode("cp500")), encoding="cp500"
+            ).get_result_dictionary(),
+            SecurityResult(result_xml).get_result_dictionary(),
+        )
+
+    # ============================================================================
+    # Extract Many Users
+    # ============================================================================
+    def test_user_admin_extract_many_reports_result_for_each_user(
+        self,
+        call_racf_mock: Mock,
+    ):
+        def call_racf(request_xml: bytes, *_, **__) -> str:
+            if b'name="squidwrd"' in request_xml:
+                return TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_XML
+            return TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_ERROR_XML
+
+        call_racf_mock.side_effect = call_racf
+        results = dict(
+            self.user_admin.extract_many(
+                ["squidwrd", "missing"], segments={"omvs": True}, max_workers=2
+            )
+        )
+        self.assertEqual(
+            results["squidwrd"],
+            TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_DICTIONARY,
+        )
+        self.assertIsInstance(results["missing"], SecurityRequestError)
+        self.assertEqual(
+            results["missing"].result,
+            TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_ERROR_DICTIONARY,
+        )
+
+    def test_user_admin_extract_many_does_not_share_request_state(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_XML
+        )
+        userids = [f"user{i}" for i in range(16)]
+        results = dict(
+            self.user_admin.extract_many(
+                userids, segments={"omvs": True}, profile_only=True, max_workers=4
+            )
+        )
+        self.assertEqual(sorted(results), sorted(userids))
+        for call in call_racf_mock.call_args_list:
+            self.assertEqual(call.args[0].count(b"<omvs"), 1)
@@ -144,17 +144,13 @@ class TestUserSetters(unittest.TestCase):
         get_class_authorizations_mock.return_value = [
             "facility",
             "terminal",
-            "xfacilit",
         ]
         result = self.user_admin.set_class_authorizations(
             "squidwrd", ["terminal", "xfacilit"]
         )
         self.assertEqual(
             result,
-            (
-                TestUserConstants.TEST_USER_DELETE_ALL_CLASS_AUTHORIZATIONS_XML
-                + TestUserConstants.TEST_USER_SET_CLASS_AUTHORIZATIONS_XML
-            ),
+            TestUserConstants.TEST_USER_SET_CLASS_AUTHORIZATIONS_ADD_AND_REMOVE_XML,
         )
 
     @patch("pyracf.user.user_admin.UserAdmin.get_class_authorizations")
@@ -170,6 +166,17 @@ class TestUserSetters(unittest.TestCase):
             result, TestUserConstants.TEST_USER_SET_CLASS_AUTHORIZATIONS_XML
         )
 
+    @patch("pyracf.user.user_admin.UserAdmin.get_class_authorizations")
+    def test_user_admin_build_set_class_authorizations_returns_false_if_unchanged(
+        self,
+        get_class_authorizations_mock: Mock,
+    ):
+        get_class_authorizations_mock.return_value = ["terminal", "xfacilit"]
+        result = self.user_admin.set_class_authorizations(
+            "squidwrd", ["TERMINAL", "xfacilit"]
+        )
+        self.assertFalse(result)
+
     # ============================================================================
     # OMVS UID
     # ============================================================================